@@ -17,9 +17,100 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import os
+import re
 import sqlite3
+from typing import NamedTuple
 from PySide6.QtCore import QObject, Signal
 
+# One comma-separated note with surrounding whitespace trimmed
+_NOTE_PATTERN = re.compile(r'[^,\s](?:[^,]*[^,\s])?')
+
+
+# Splits the three comma-separated notes columns into one row per note and counts
+# them, so the top-N aggregation happens inside SQLite
+_TOP_NOTES_QUERY = """
+    WITH RECURSIVE
+    note_lists(rest) AS (
+        SELECT top_notes || ',' FROM fragrances WHERE {where}
+        UNION ALL
+        SELECT middle_notes || ',' FROM fragrances WHERE {where}
+        UNION ALL
+        SELECT base_notes || ',' FROM fragrances WHERE {where}
+    ),
+    split(note, rest) AS (
+        SELECT '', rest FROM note_lists WHERE rest IS NOT NULL
+        UNION ALL
+        SELECT trim(substr(rest, 1, instr(rest, ',') - 1)), substr(rest, instr(rest, ',') + 1)
+        FROM split
+        WHERE rest != ''
+    )
+    SELECT note, COUNT(*) AS count
+    FROM split
+    WHERE note != ''
+    GROUP BY note
+    ORDER BY count DESC, note ASC
+    LIMIT ?
+"""
+
+# Filled in once so every call executes an identical, reusable statement
+_ALL_TOP_NOTES_QUERY = _TOP_NOTES_QUERY.format(where="1")
+_FAVORITE_TOP_NOTES_QUERY = _TOP_NOTES_QUERY.format(where="is_favorite = 1")
+
+# Fragrance and distinct house totals
+_TOTALS_QUERY = """
+    SELECT
+        COUNT(*) as total,
+        COUNT(DISTINCT house) as house_count
+    FROM fragrances
+"""
+
+# Most common houses with their fragrance counts
+_TOP_HOUSES_QUERY = """
+    SELECT house, COUNT(*) as count
+    FROM fragrances
+    GROUP BY house
+    ORDER BY count DESC
+    LIMIT ?
+"""
+
+# (season, average rating, fragrances rating it highest) ranked by average, ties in calendar order
+_SEASONAL_RANKING_QUERY = """
+    WITH stats AS (
+        SELECT
+            AVG(winter_rating) as winter_avg,
+            AVG(spring_rating) as spring_avg,
+            AVG(summer_rating) as summer_avg,
+            AVG(fall_rating) as fall_avg,
+            COALESCE(SUM(winter_rating = best), 0) as winter_count,
+            COALESCE(SUM(spring_rating = best), 0) as spring_count,
+            COALESCE(SUM(summer_rating = best), 0) as summer_count,
+            COALESCE(SUM(fall_rating = best), 0) as fall_count
+        FROM (
+            SELECT winter_rating, spring_rating, summer_rating, fall_rating,
+                   MAX(winter_rating, spring_rating, summer_rating, fall_rating) as best
+            FROM fragrances
+        )
+    )
+    SELECT season, avg, count FROM (
+        SELECT 1 as position, 'Winter' as season, winter_avg as avg, winter_count as count FROM stats
+        UNION ALL SELECT 2, 'Spring', spring_avg, spring_count FROM stats
+        UNION ALL SELECT 3, 'Summer', summer_avg, summer_count FROM stats
+        UNION ALL SELECT 4, 'Fall', fall_avg, fall_count FROM stats
+    )
+    WHERE avg IS NOT NULL
+    ORDER BY avg DESC, position ASC
+"""
+
+
+class OverviewStats(NamedTuple):
+    """Everything the collection overview displays, read in one database round-trip"""
+    total_fragrances: int
+    house_count: int
+    top_houses: list
+    top_notes: list
+    top_favorite_notes: list
+    seasonal_ranking: list
+
 
 class DatabaseManager(QObject):
 
@@ -28,6 +119,11 @@ class DatabaseManager(QObject):
     def __init__(self, db_path="fragrances.db"):
         super().__init__()
         self.db_path = db_path
+        
+        # Bumped on every write so cached aggregates know when to rebuild
+        self._data_version = 0
+        self._autocomplete_cache = None
+        
         self.initialize_database()
     
     def get_connection(self):
@@ -41,6 +137,10 @@ class DatabaseManager(QObject):
         conn = self.get_connection()
         cursor = conn.cursor()
         
+        # WAL is stored in the database file, so this only needs to run once;
+        # readers such as the statistics worker then never block on a write
+        cursor.execute("PRAGMA journal_mode=WAL")
+        
         # Create fragrances table
         cursor.execute('''
         CREATE TABLE IF NOT EXISTS fragrances (
@@ -73,6 +173,10 @@ class DatabaseManager(QObject):
         if 'is_favorite' not in columns:
             cursor.execute('ALTER TABLE fragrances ADD COLUMN is_favorite INTEGER DEFAULT 0')
         
+        # Indexes for the house grouping and favorites filter used by the statistics
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_fragrances_house ON fragrances(house)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_fragrances_favorite ON fragrances(is_favorite)')
+        
         conn.commit()
         conn.close()
     
@@ -126,6 +230,7 @@ class DatabaseManager(QObject):
         conn.commit()
         conn.close()
         
+        self._data_version += 1
         self.database_updated.emit()
         return fragrance_id
     
@@ -195,6 +300,7 @@ class DatabaseManager(QObject):
         conn.commit()
         conn.close()
         
+        self._data_version += 1
         self.database_updated.emit()
         return success
     
@@ -218,6 +324,7 @@ class DatabaseManager(QObject):
         conn.commit()
         conn.close()
         
+        self._data_version += 1
         self.database_updated.emit()
         return success
     
@@ -262,6 +369,62 @@ class DatabaseManager(QObject):
         conn.close()
         return fragrances
     
+    def data_version(self):
+        """Return a counter that changes whenever fragrance data is written"""
+        return self._data_version
+    
+    def get_distinct_houses(self):
+        """
+        Get every house name used in the collection
+        
+        Returns:
+            list: Sorted list of distinct, non-empty house names
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("SELECT DISTINCT house FROM fragrances WHERE house != '' ORDER BY house")
+        houses = [row[0] for row in cursor.fetchall()]
+        
+        conn.close()
+        return houses
+    
+    def iter_note_columns(self):
+        """
+        Iterate over the notes columns of every fragrance
+        
+        Yields:
+            tuple: (top_notes, middle_notes, base_notes) for each fragrance
+        """
+        conn = self.get_connection()
+        try:
+            yield from conn.execute("SELECT top_notes, middle_notes, base_notes FROM fragrances")
+        finally:
+            conn.close()
+    
+    def get_autocomplete_corpus(self):
+        """
+        Get the distinct houses and notes used in the collection
+        
+        The result is cached until the next add, update or delete.
+        
+        Returns:
+            tuple: (houses, notes) as sorted tuples of strings
+        """
+        if self._autocomplete_cache and self._autocomplete_cache[0] == self._data_version:
+            return self._autocomplete_cache[1]
+        
+        notes = set()
+        
+        for note_columns in self.iter_note_columns():
+            for field in note_columns:
+                if field:
+                    notes.update(_NOTE_PATTERN.findall(field))
+        
+        corpus = (tuple(self.get_distinct_houses()), tuple(sorted(notes)))
+        self._autocomplete_cache = (self._data_version, corpus)
+        return corpus
+    
     def search_fragrances(self, search_term="", filters=None):
         """
         Search fragrances with optional filtering
@@ -367,196 +530,48 @@ class DatabaseManager(QObject):
             "averages": averages
         }
     
-    def get_top_houses(self, limit=3):
+    def get_overview_bundle(self, house_limit=3, notes_limit=10):
         """
-        Get the most common houses in the collection
+        Get all collection overview statistics over a single connection
         
         Args:
-            limit: Maximum number of houses to return
+            house_limit: Maximum number of houses to return
+            notes_limit: Maximum number of notes to return per notes ranking
             
         Returns:
-            List of tuples (house_name, count)
-        """
-        try:
-            cursor = self.get_connection().cursor()
-            query = """
-                SELECT house, COUNT(*) as count
-                FROM fragrances
-                GROUP BY house
-                ORDER BY count DESC
-                LIMIT ?
-            """
-            cursor.execute(query, (limit,))
-            results = cursor.fetchall()
-            return [(row['house'], row['count']) for row in results]
-        except sqlite3.Error as e:
-            print(f"Database error: {e}")
-            return []
-    
-    def get_top_notes(self, limit=10):
-        """
-        Get the most common notes in the collection
-        
-        Args:
-            limit: Maximum number of notes to return
-            
-        Returns:
-            List of tuples (note, count)
+            OverviewStats, or None if the database could not be read
         """
+        conn = self.get_connection()
         try:
-            cursor = self.get_connection().cursor()
-            
-            # Process and count all notes by splitting the comma-separated lists
-            query = """
-                SELECT f.id, f.top_notes, f.middle_notes, f.base_notes
-                FROM fragrances f
-            """
-            cursor.execute(query)
-            all_fragrances = cursor.fetchall()
-            
-            # Process notes (split by comma, trim whitespace)
-            note_counts = {}
-            for frag in all_fragrances:
-                note_fields = [
-                    frag['top_notes'] or "", 
-                    frag['middle_notes'] or "", 
-                    frag['base_notes'] or ""
-                ]
+            with conn:
+                cursor = conn.cursor()
                 
-                for field in note_fields:
-                    if field.strip():
-                        notes = [n.strip() for n in field.split(',')]
-                        for note in notes:
-                            if note:  # Skip empty notes
-                                note_counts[note] = note_counts.get(note, 0) + 1
-            
-            # Sort by count and get the top notes
-            sorted_notes = sorted(note_counts.items(), key=lambda x: x[1], reverse=True)
-            return sorted_notes[:limit]
-        except sqlite3.Error as e:
-            print(f"Database error: {e}")
-            return []
-    
-    def get_seasonal_averages(self):
-        """
-        Get average ratings for each season across the collection
-        
-        Returns:
-            Dictionary with season averages
-        """
-        try:
-            cursor = self.get_connection().cursor()
-            query = """
-                SELECT 
-                    AVG(winter_rating) as winter_avg,
-                    AVG(spring_rating) as spring_avg,
-                    AVG(summer_rating) as summer_avg,
-                    AVG(fall_rating) as fall_avg
-                FROM fragrances
-            """
-            cursor.execute(query)
-            return dict(cursor.fetchone())
-        except sqlite3.Error as e:
-            print(f"Database error: {e}")
-            return {}
-    
-    def get_seasonal_preferences(self):
-        """
-        Get the number of fragrances that score highest in each season
-        If a fragrance scores highest in multiple seasons, it's counted in each
-        
-        Returns:
-            Dictionary with season counts and ties
-        """
-        try:
-            cursor = self.get_connection().cursor()
-            
-            # Get all fragrances with their seasonal ratings
-            query = """
-                SELECT id, winter_rating, spring_rating, summer_rating, fall_rating
-                FROM fragrances
-            """
-            cursor.execute(query)
-            fragrances = cursor.fetchall()
-            
-            # Count fragrances by their highest rated season
-            winter_count = 0
-            spring_count = 0
-            summer_count = 0
-            fall_count = 0
-            
-            for frag in fragrances:
-                # Get all ratings
-                winter = frag['winter_rating']
-                spring = frag['spring_rating']
-                summer = frag['summer_rating']
-                fall = frag['fall_rating']
+                # Totals
+                cursor.execute(_TOTALS_QUERY)
+                totals = dict(cursor.fetchone())
                 
-                # Find the maximum rating
-                max_rating = max(winter, spring, summer, fall)
+                cursor.execute(_TOP_HOUSES_QUERY, (house_limit,))
+                top_houses = [(row['house'], row['count']) for row in cursor.fetchall()]
                 
-                # Count each season that matches the max rating
-                if winter == max_rating:
-                    winter_count += 1
-                if spring == max_rating:
-                    spring_count += 1
-                if summer == max_rating:
-                    summer_count += 1
-                if fall == max_rating:
-                    fall_count += 1
-            
-            return {
-                'winter_count': winter_count,
-                'spring_count': spring_count,
-                'summer_count': summer_count,
-                'fall_count': fall_count
-            }
-            
-        except sqlite3.Error as e:
-            print(f"Database error: {e}")
-            return {}
-            
-    def get_top_notes_from_favorites(self, limit=10):
-        """
-        Get the most common notes in favorited fragrances
-        
-        Args:
-            limit: Maximum number of notes to return
-            
-        Returns:
-            List of tuples (note, count)
-        """
-        try:
-            cursor = self.get_connection().cursor()
-            
-            # Process and count notes from favorited fragrances only
-            query = """
-                SELECT f.id, f.top_notes, f.middle_notes, f.base_notes
-                FROM fragrances f
-                WHERE f.is_favorite = 1
-            """
-            cursor.execute(query)
-            favorite_fragrances = cursor.fetchall()
-            
-            # Process notes (split by comma, trim whitespace)
-            note_counts = {}
-            for frag in favorite_fragrances:
-                note_fields = [
-                    frag['top_notes'] or "", 
-                    frag['middle_notes'] or "", 
-                    frag['base_notes'] or ""
-                ]
+                cursor.execute(_ALL_TOP_NOTES_QUERY, (notes_limit,))
+                top_notes = [(row['note'], row['count']) for row in cursor.fetchall()]
+                
+                cursor.execute(_FAVORITE_TOP_NOTES_QUERY, (notes_limit,))
+                top_favorite_notes = [(row['note'], row['count']) for row in cursor.fetchall()]
                 
-                for field in note_fields:
-                    if field.strip():
-                        notes = [n.strip() for n in field.split(',')]
-                        for note in notes:
-                            if note:  # Skip empty notes
-                                note_counts[note] = note_counts.get(note, 0) + 1
+                cursor.execute(_SEASONAL_RANKING_QUERY)
+                seasonal_ranking = [tuple(row) for row in cursor.fetchall()]
             
-            # Sort by count and get the top notes
-            sorted_notes = sorted(note_counts.items(), key=lambda x: x[1], reverse=True)
-            return sorted_notes[:limit] 
+            return OverviewStats(
+                total_fragrances=totals['total'],
+                house_count=totals['house_count'],
+                top_houses=top_houses,
+                top_notes=top_notes,
+                top_favorite_notes=top_favorite_notes,
+                seasonal_ranking=seasonal_ranking
+            )
         except sqlite3.Error as e:
             print(f"Database error: {e}")
-            return [] 
\ No newline at end of file
+            return None
+        finally:
+            conn.close()
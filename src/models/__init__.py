@@ -17,4 +17,5 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from .fragrance import Fragrance
-from .collection import FragranceCollectionModel, FragranceCollectionManager, collection_manager 
\ No newline at end of file
+from .collection import FragranceCollectionModel, FragranceCollectionManager, collection_manager
+from .ranking import RankingModel
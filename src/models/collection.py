@@ -157,6 +157,10 @@ class FragranceCollectionManager(QObject):
         """Get all fragrances without filtering"""
         return self._fragrances
     
+    def version(self):
+        """Get a counter that changes whenever the stored collection changes"""
+        return db_manager.data_version()
+    
     def get_collection_stats(self):
         """Get statistics about the collection"""
         return db_manager.get_collection_stats()
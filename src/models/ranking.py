@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright 2025 Fragrance Collection Organizer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtGui import QColor
+
+
+class RankingModel(QAbstractTableModel):
+    """
+    Read-only table model for ranked (name, value, ...) rows such as top houses or notes
+    """
+    def __init__(self, headers, colors=None, parent=None):
+        """
+        Args:
+            headers: Column header labels
+            colors: Optional mapping of first-column value to a text color
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._headers = tuple(headers)
+        self._colors = {name: QColor(color) for name, color in (colors or {}).items()}
+        self._rows = []
+    
+    def setRows(self, rows):
+        """Replace the ranked rows"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Number of ranked rows"""
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Number of columns"""
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Cell text, first-column color and alignment"""
+        if not index.isValid():
+            return None
+        
+        value = self._rows[index.row()][index.column()]
+        
+        if role == Qt.DisplayRole:
+            return f"{value:.2f}" if isinstance(value, float) else str(value)
+        
+        if role == Qt.ForegroundRole and index.column() == 0:
+            return self._colors.get(value)
+        
+        if role == Qt.TextAlignmentRole and index.column() > 0:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Column labels and row ranks"""
+        if role != Qt.DisplayRole:
+            return None
+        
+        # Columns show their labels, rows show their rank
+        if orientation == Qt.Horizontal:
+            return self._headers[section]
+        return str(section + 1)
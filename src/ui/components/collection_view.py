@@ -201,13 +201,13 @@ class CollectionView(QWidget):
     def _update_styling(self):
         """Update styling based on the current theme"""
         current_theme = theme_manager.get_current_theme()
-        theme_data = theme_manager._themes[current_theme]
+        colors = theme_manager.get_color_names(current_theme)
         
         # Get colors from theme
-        text_color = theme_data["palette"]["foreground"].name()
-        primary_color = theme_data["palette"]["primary"].name()
-        bg_color = theme_data["palette"]["background"].name()
-        bg2_color = theme_data["palette"]["background_alt"].name()
+        text_color = colors["foreground"]
+        primary_color = colors["primary"]
+        bg_color = colors["background"]
+        bg2_color = colors["background_alt"]
         
         # Update styles
         self._stats_label.setStyleSheet(f"""
@@ -18,142 +18,19 @@
 
 from PySide6.QtWidgets import (
     QWidget, QLineEdit, QComboBox, QLabel, QPushButton, QVBoxLayout, 
-    QHBoxLayout, QGroupBox, QCheckBox, QFormLayout, QCompleter,
+    QHBoxLayout, QGroupBox, QCheckBox, QFormLayout,
     QMessageBox, QFileDialog
 )
-from PySide6.QtCore import Qt, Signal, Slot, QStringListModel, QEvent
+from PySide6.QtCore import Qt, Signal, Slot, QEvent
 from PySide6.QtGui import QKeyEvent
 
 from src.db import db_manager
 from src.models import collection_manager
 from src.ui.dialogs import ExportDialog
+from src.ui.widgets import NotesCompleterLineEdit, SAMPLE_NOTES
 from src.utils import export_collection_to_csv
 
 
-class NotesCompleterLineEdit(QLineEdit):
-    """
-    Custom QLineEdit with comma-separated text autocompletion
-    """
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self._completer = QCompleter([])
-        self._completer.setCaseSensitivity(Qt.CaseInsensitive)
-        self._completer.setCompletionMode(QCompleter.PopupCompletion)
-        self._completer.activated.connect(self._insertCompletion)
-        self._completer.setWidget(self)
-        self._all_items = []
-        self._current_completion = ""
-        
-        # Connect text changed signal for real-time completion
-        self.textChanged.connect(self._handleTextChanged)
-        
-        # Connect to completer signals for highlighted items
-        self._completer.highlighted.connect(self._onCompletionHighlighted)
-        
-    def keyPressEvent(self, event):
-        """Override key press event to handle special keys"""
-        # Handle right arrow to accept current highlighted completion
-        if self._completer.popup().isVisible():
-            if event.key() == Qt.Key_Right:
-                if self._current_completion:
-                    self._insertCompletion(self._current_completion)
-                    return
-        
-        super().keyPressEvent(event)
-        
-        # Don't update completer for navigation keys or other special keys
-        if event.key() not in (Qt.Key_Up, Qt.Key_Down, Qt.Key_Enter, Qt.Key_Return, Qt.Key_Escape, 
-                              Qt.Key_Tab, Qt.Key_Backtab, Qt.Key_Right, Qt.Key_Left):
-            self._handleTextChanged(self.text())
-    
-    def _onCompletionHighlighted(self, text):
-        """Track the currently highlighted completion"""
-        self._current_completion = text
-    
-    def setAllItems(self, items):
-        """Set the complete list of available items"""
-        self._all_items = items
-        
-    def _handleTextChanged(self, text):
-        """Handle text changes to update the completer"""
-        if not text:
-            # Hide completer if there's no text
-            self._completer.popup().hide()
-            return
-            
-        # Find the last comma and get text after it
-        last_comma_pos = text.rfind(",") + 1
-        if last_comma_pos > 0:
-            current_term = text[last_comma_pos:].strip()
-        else:
-            current_term = text
-            
-        if current_term:
-            # Only update and show completer if there's something to complete
-            has_matches = self._updateCompleter(current_term)
-            if has_matches:
-                self._completer.complete()
-    
-    def _updateCompleter(self, current_term):
-        """Update the completer model with filtered items"""
-        filtered_items = [item for item in self._all_items if current_term.lower() in item.lower()]
-        
-        if filtered_items:
-            self._completer.setModel(QStringListModel(filtered_items))
-            
-            # Set the first item as current if there's an exact prefix match
-            for item in filtered_items:
-                if item.lower().startswith(current_term.lower()):
-                    index = self._completer.completionModel().index(filtered_items.index(item), 0)
-                    self._completer.popup().setCurrentIndex(index)
-                    break
-            return True
-        else:
-            # Hide the completer if there are no matches
-            self._completer.popup().hide()
-            return False
-    
-    def _insertCompletion(self, completion):
-        """Insert the selected completion at the current position"""
-        current_text = self.text()
-        cursor_pos = self.cursorPosition()
-        last_comma_pos = current_text.rfind(",", 0, cursor_pos) + 1
-        
-        # Create the new text with the completion inserted
-        if last_comma_pos > 0:
-            # Adding to existing comma-separated list
-            prefix = current_text[:last_comma_pos]
-            suffix = current_text[cursor_pos:]
-            
-            # Add space after comma if needed
-            if not prefix.endswith(" "):
-                prefix += " "
-            
-            # Build the new text with the completion properly inserted    
-            new_text = prefix + completion + suffix
-            
-            # Set the cursor position to be after the completion
-            new_cursor_pos = len(prefix) + len(completion)
-        else:
-            # First item in the list
-            suffix = current_text[cursor_pos:]
-            
-            # Build the new text
-            new_text = completion + suffix
-            
-            # Set the cursor position to be after the completion
-            new_cursor_pos = len(completion)
-        
-        # Set the new text
-        self.setText(new_text)
-        
-        # Set the cursor position
-        self.setCursorPosition(new_cursor_pos)
-        
-        # Hide the completer after selection
-        self._completer.popup().hide()
-
-
 class FilterPanel(QWidget):
     """
     Panel for searching and filtering fragrances
@@ -296,87 +173,18 @@ class FilterPanel(QWidget):
     
     def _populate_filter_options(self):
         """Populate filter dropdown options based on collection data"""
-        # Get all fragrances
-        fragrances = collection_manager.get_all_fragrances()
-        
-        # Get unique houses
-        houses = set()
-        all_notes = set()
-        
-        for fragrance in fragrances:
-            if fragrance.house():
-                houses.add(fragrance.house())
-            
-            # Collect all notes for autocomplete
-            if fragrance.top_notes():
-                for note in [n.strip() for n in fragrance.top_notes().split(',')]:
-                    if note:
-                        all_notes.add(note)
-            
-            if fragrance.middle_notes():
-                for note in [n.strip() for n in fragrance.middle_notes().split(',')]:
-                    if note:
-                        all_notes.add(note)
-            
-            if fragrance.base_notes():
-                for note in [n.strip() for n in fragrance.base_notes().split(',')]:
-                    if note:
-                        all_notes.add(note)
-        
-        # Always add these sample notes to ensure rich autocomplete suggestions
-        sample_notes = [
-            "Bergamot", "Lemon", "Orange", "Grapefruit", "Lime", "Neroli",
-            "Lavender", "Rose", "Jasmine", "Violet", "Ylang-Ylang", "Iris",
-            "Sandalwood", "Cedarwood", "Vetiver", "Patchouli", "Musk", "Amber",
-            "Vanilla", "Tobacco", "Leather", "Oud", "Cinnamon", "Cardamom",
-            "Apple", "Wild Lavender", "Orange Blossom", "Lily-of-the-Valley", "Tonka Bean",
-            "Black Currant", "Pink Pepper", "Cedar", "Incense", "Ginger",
-            "Oakmoss", "Ambergris", "Saffron", "Pineapple", "Birch", "Moroccan Jasmine",
-            "Mandarin Orange", "Petitgrain", "Seaweed", "Cotton Flower", "Virginia Cedar",
-            "Woodsy Notes", "Clary Sage", "Water Notes", "Rosemary", "Green Notes",
-            "Papaya", "Nutmeg", "Orris Root", "Freesia", "Green Accord", "Green Tea",
-            "Guaiac Wood", "Labdanum", "Plum", "Geranium", "Truffle", "Oak", "Sichuan Pepper",
-            "Star Anise", "Ambroxan", "Elemi", "Olibanum", "Blood Orange", "Juniper Berries",
-            "Pimento", "Sicilian Lemon", "Fig Nectar", "Cypriol Oil or Nagarmotha",
-            "Sea Water", "Juniper", "Coriander", "Basil", "Peach", "Melon", "Sea Salt",
-            "Aquozone", "Green Mandarin", "Cypress", "Mastic or Lentisque", "Coconut",
-            "Benzoin", "Honey", "Watermelon", "Green Apple", "Black Tea", "Frankincense",
-            "Agarwood (Oud)", "Woody Notes", "Black Pepper", "Amberwood", "Violet Leaf",
-            "Cashmeran", "Haitian Vetiver", "Clearwood", "Indian Ginger",
-            "Green Tangerine", "Aromatic Notes", "Spicy Notes", "Patchouli Leaf", "Water Jasmine",
-            "White Musk", "Moss", "Driftwood", "Tequila", "Sea Notes",
-            "Agave", "Salt", "Guava", "Palm Leaf", "Red Apple", "Calabrian Bergamot",
-            "Bourbon Geranium", "Tobacco Leaf", "Mineral Notes", "Papyrus",
-            "Carambola (Star Fruit)", "Brazilian Rosewood", "Tarragon", "Pepper",
-            "Rose de Mai", "Hyacinth", "White Pepper", "Tunisian Orange Blossom",
-            "Ambrofix", "Aldeyhydes", "Sycamore", "Tahitian Vetiver", "Cashmere Wood",
-            "Blackberry", "Tonka", "Bergamot Zest", "Lavandin", "Mandarin", "Mandarin Zest",
-            "Orange Zest", "Grapefruit Zest", "Pear", "Peony", "Gardenia", "Magnolia",
-            "Heliotrope", "Tiare Flower", "Carnation", "Cyclamen", "Honeysuckle",
-            "Chamomile", "Green Leaves", "Tea", "Mate", "Beeswax", "Coumarin",
-            "Myrrh", "Resins", "Balsam Fir", "Fir Resin", "Fir Balsam", "Pine",
-            "Cade Oil", "Amyris", "Iso E Super", "Oakwood", "Hinoki Wood", "Mahogany",
-            "Teak Wood", "Wormwood", "Absinthe", "Rum", "Whiskey", "Gin", "Cognac",
-            "Champagne", "Coffee", "Cacao", "Chocolate", "Dark Chocolate", "Milk",
-            "Cream", "Sugar", "Praline", "Caramel", "Almond", "Hazelnut", "Pistachio",
-            "Chestnut", "Walnut", "Marzipan", "Butter", "Pastry", "Candy",
-            "Mango", "Lychee", "Passionfruit", "Kiwi", "Pomegranate", "Fig", "Dates",
-            "Raisin", "Currant Buds", "Red Berries", "Strawberry", "Raspberry",
-            "Blueberry", "Cherry", "Ice", "Snow", "Metallic Notes", "Ink", "Gasoline",
-            "Gunpowder", "Rubber", "Smoke", "Ash", "Burnt Wood", "Charcoal", "Leather Accord",
-            "Suede", "Tobacco Blossom", "Hay", "Earthy Notes", "Mushroom", "Mossy Notes",
-            "Rain", "Dew", "Solar Notes", "Aldehydic Notes", "Skin", "Clean Cotton", "Powdery Notes"
-        ]
+        # Distinct houses and notes in the collection, cached by the database manager
+        houses, collection_notes = db_manager.get_autocomplete_corpus()
         
         # Always add the sample notes, regardless of whether the collection is empty
-        all_notes.update(sample_notes)
+        all_notes = SAMPLE_NOTES.union(collection_notes)
         
         # Update house filter
         current_house = self._house_filter.currentText()
         self._house_filter.clear()
         self._house_filter.addItem("All Houses", None)
         
-        for house in sorted(houses):
+        for house in houses:
             self._house_filter.addItem(house, house)
         
         # Try to restore the previous selection if it exists
@@ -485,7 +293,7 @@ class FilterPanel(QWidget):
             return
         
         # Show export options dialog
-        export_dialog = ExportDialog(self)
+        export_dialog = ExportDialog.get_or_create(self)
         if export_dialog.exec() != ExportDialog.Accepted:
             return
         
@@ -379,9 +379,9 @@ class FragranceItem(QFrame):
         
         # Update the color directly based on theme
         current_theme = theme_manager.get_current_theme()
-        theme_data = theme_manager._themes[current_theme]
-        text_color = theme_data["palette"]["foreground"].name()
-        primary_color = theme_data["palette"]["primary"].name()
+        colors = theme_manager.get_color_names(current_theme)
+        text_color = colors["foreground"]
+        primary_color = colors["primary"]
         
         # Determine star color based on theme
         if current_theme == "nature":  # "Emerald Veil" theme
@@ -415,9 +415,9 @@ class FragranceItem(QFrame):
         
         # Update the color directly based on theme
         current_theme = theme_manager.get_current_theme()
-        theme_data = theme_manager._themes[current_theme]
-        text_color = theme_data["palette"]["foreground"].name()
-        primary_color = theme_data["palette"]["primary"].name()
+        colors = theme_manager.get_color_names(current_theme)
+        text_color = colors["foreground"]
+        primary_color = colors["primary"]
         
         # Determine star color based on theme
         if current_theme == "nature":  # "Emerald Veil" theme
@@ -472,14 +472,14 @@ class FragranceItem(QFrame):
     def _update_styling(self):
         """Update styling based on the current theme"""
         current_theme = theme_manager.get_current_theme()
-        theme_data = theme_manager._themes[current_theme]
+        colors = theme_manager.get_color_names(current_theme)
         
         # Get colors from theme
-        bg_color = theme_data["palette"]["background_alt"].name()
-        bg2_color = theme_data["palette"]["background"].name()
-        text_color = theme_data["palette"]["foreground"].name()
-        primary_color = theme_data["palette"]["primary"].name()
-        secondary_color = theme_data["palette"]["secondary"].name()
+        bg_color = colors["background_alt"]
+        bg2_color = colors["background"]
+        text_color = colors["foreground"]
+        primary_color = colors["primary"]
+        secondary_color = colors["secondary"]
         
         # Standard styling
         name_font_size = "20px"
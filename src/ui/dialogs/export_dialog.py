@@ -18,23 +18,83 @@
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGroupBox, 
-    QCheckBox, QDialogButtonBox, QLabel, QFileDialog,
-    QPushButton, QGridLayout
+    QDialogButtonBox, QLabel, QListWidget, QListWidgetItem,
+    QPushButton, QButtonGroup
 )
-from PySide6.QtCore import Qt, Slot, Signal
+from PySide6.QtCore import Qt, Slot, QSettings
+
+from src.utils import EXPORT_FIELDS
+
+
+# Item check states indexed by a boolean
+_CHECK_STATES = (Qt.Unchecked, Qt.Checked)
+
+# Per-field default check state; fields not listed default to checked
+_DEFAULTS = {}
 
 
 class ExportDialog(QDialog):
     """
     Dialog for selecting which fields to include in CSV export
     """
+    MIN_WIDTH = 400
+    
+    # Size hint shared by all instances, computed once the widgets are built
+    _cached_size_hint = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
-        self.setWindowTitle("Export Options")
-        self.setMinimumWidth(400)
+        # Widgets are built on first show
+        self._built = False
         
-        self._setup_ui()
+        self.setWindowTitle("Export Options")
+        self.setMinimumWidth(self.MIN_WIDTH)
+    
+    @classmethod
+    def get_or_create(cls, parent):
+        """
+        Get the export dialog cached on the parent, creating it on first use
+        
+        Args:
+            parent: Widget that owns the dialog
+        
+        Returns:
+            ExportDialog: The cached dialog, showing the last saved selection
+        """
+        dialog = getattr(parent, "_export_dialog", None)
+        if dialog is None:
+            dialog = cls(parent)
+            parent._export_dialog = dialog
+        
+        dialog._load_selection()
+        return dialog
+        
+    def showEvent(self, event):
+        """Build the user interface the first time the dialog is shown"""
+        self._ensure_ui()
+        super().showEvent(event)
+    
+    def sizeHint(self):
+        """Return the size hint, caching it once the widgets are built"""
+        if not self._built:
+            return super().sizeHint()
+        
+        if ExportDialog._cached_size_hint is None:
+            ExportDialog._cached_size_hint = super().sizeHint()
+        return ExportDialog._cached_size_hint
+    
+    def _ensure_ui(self):
+        """Set up the user interface if it hasn't been built yet"""
+        if not self._built:
+            # Batch layout and paint work into a single pass
+            self.setUpdatesEnabled(False)
+            try:
+                self._setup_ui()
+            finally:
+                self.setUpdatesEnabled(True)
+            self._built = True
+            self._load_selection()
         
     def _setup_ui(self):
         """Set up the user interface"""
@@ -50,82 +110,29 @@ class ExportDialog(QDialog):
         fields_group = QGroupBox("Fields")
         fields_layout = QVBoxLayout(fields_group)
         
-        # Checkboxes for each field
-        self._field_checkboxes = {}
-        
-        # Basic info fields
-        self._field_checkboxes["house"] = QCheckBox("House")
-        self._field_checkboxes["house"].setChecked(True)
-        fields_layout.addWidget(self._field_checkboxes["house"])
-        
-        self._field_checkboxes["name"] = QCheckBox("Name")
-        self._field_checkboxes["name"].setChecked(True)
-        fields_layout.addWidget(self._field_checkboxes["name"])
-        
-        self._field_checkboxes["size_oz"] = QCheckBox("Size (oz)")
-        self._field_checkboxes["size_oz"].setChecked(True)
-        fields_layout.addWidget(self._field_checkboxes["size_oz"])
-        
-        self._field_checkboxes["size_ml"] = QCheckBox("Size (ml)")
-        self._field_checkboxes["size_ml"].setChecked(True)
-        fields_layout.addWidget(self._field_checkboxes["size_ml"])
-        
-        self._field_checkboxes["concentration"] = QCheckBox("Concentration")
-        self._field_checkboxes["concentration"].setChecked(True)
-        fields_layout.addWidget(self._field_checkboxes["concentration"])
-        
-        # Notes fields
-        self._field_checkboxes["top_notes"] = QCheckBox("Top Notes")
-        self._field_checkboxes["top_notes"].setChecked(True)
-        fields_layout.addWidget(self._field_checkboxes["top_notes"])
-        
-        self._field_checkboxes["middle_notes"] = QCheckBox("Middle Notes")
-        self._field_checkboxes["middle_notes"].setChecked(True)
-        fields_layout.addWidget(self._field_checkboxes["middle_notes"])
-        
-        self._field_checkboxes["base_notes"] = QCheckBox("Base Notes")
-        self._field_checkboxes["base_notes"].setChecked(True)
-        fields_layout.addWidget(self._field_checkboxes["base_notes"])
-        
-        # Seasonal ratings
-        self._field_checkboxes["winter_rating"] = QCheckBox("Winter Rating")
-        self._field_checkboxes["winter_rating"].setChecked(True)
-        fields_layout.addWidget(self._field_checkboxes["winter_rating"])
-        
-        self._field_checkboxes["spring_rating"] = QCheckBox("Spring Rating")
-        self._field_checkboxes["spring_rating"].setChecked(True)
-        fields_layout.addWidget(self._field_checkboxes["spring_rating"])
-        
-        self._field_checkboxes["summer_rating"] = QCheckBox("Summer Rating")
-        self._field_checkboxes["summer_rating"].setChecked(True)
-        fields_layout.addWidget(self._field_checkboxes["summer_rating"])
-        
-        self._field_checkboxes["fall_rating"] = QCheckBox("Fall Rating")
-        self._field_checkboxes["fall_rating"].setChecked(True)
-        fields_layout.addWidget(self._field_checkboxes["fall_rating"])
-        
-        # Performance metrics
-        self._field_checkboxes["longevity"] = QCheckBox("Longevity")
-        self._field_checkboxes["longevity"].setChecked(True)
-        fields_layout.addWidget(self._field_checkboxes["longevity"])
-        
-        self._field_checkboxes["sillage"] = QCheckBox("Sillage")
-        self._field_checkboxes["sillage"].setChecked(True)
-        fields_layout.addWidget(self._field_checkboxes["sillage"])
-        
-        # Clone information
-        self._field_checkboxes["is_clone"] = QCheckBox("Is Clone")
-        self._field_checkboxes["is_clone"].setChecked(True)
-        fields_layout.addWidget(self._field_checkboxes["is_clone"])
-        
-        self._field_checkboxes["original_fragrance"] = QCheckBox("Original Fragrance")
-        self._field_checkboxes["original_fragrance"].setChecked(True)
-        fields_layout.addWidget(self._field_checkboxes["original_fragrance"])
+        # One checkable list item per field, painted by a single list widget
+        self._fields_list = QListWidget(fields_group)
+        self._field_items = {}
+        self._fields_list.setUpdatesEnabled(False)
+        for field in EXPORT_FIELDS:
+            item = QListWidgetItem(field.label)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked)
+            self._fields_list.addItem(item)
+            self._field_items[field.key] = item
+        self._fields_list.setUpdatesEnabled(True)
+        
+        # Show every field without scrolling
+        self._fields_list.setMinimumHeight(
+            self._fields_list.sizeHintForRow(0) * len(EXPORT_FIELDS)
+            + 2 * self._fields_list.frameWidth()
+        )
+        fields_layout.addWidget(self._fields_list)
         
-        # Favorite field
-        self._field_checkboxes["is_favorite"] = QCheckBox("Is Favorite")
-        self._field_checkboxes["is_favorite"].setChecked(True)
-        fields_layout.addWidget(self._field_checkboxes["is_favorite"])
+        # Bound checkState getters, so reading the selection skips attribute lookups
+        self._check_state_getters = tuple(
+            (key, item.checkState) for key, item in self._field_items.items()
+        )
         
         main_layout.addWidget(fields_group)
         
@@ -133,13 +140,21 @@ class ExportDialog(QDialog):
         select_buttons_layout = QHBoxLayout()
         
         select_all_button = QPushButton("Select All")
-        select_all_button.clicked.connect(self._select_all)
         select_buttons_layout.addWidget(select_all_button)
         
         select_none_button = QPushButton("Select None")
-        select_none_button.clicked.connect(self._select_none)
         select_buttons_layout.addWidget(select_none_button)
         
+        # Route both buttons through one connection, the id is the state to apply
+        self._select_buttons = QButtonGroup(self)
+        self._select_buttons.addButton(select_all_button, 1)
+        self._select_buttons.addButton(select_none_button, 0)
+        self._select_buttons.idClicked.connect(self._apply_state)
+        
+        reset_button = QPushButton("Reset Defaults")
+        reset_button.clicked.connect(self.reset_defaults)
+        select_buttons_layout.addWidget(reset_button)
+        
         main_layout.addLayout(select_buttons_layout)
         
         # Action buttons
@@ -148,34 +163,47 @@ class ExportDialog(QDialog):
         button_box.rejected.connect(self.reject)
         main_layout.addWidget(button_box)
     
-    def _select_all(self):
-        """Select all export fields"""
-        for checkbox in self.findChildren(QCheckBox):
-            checkbox.setChecked(True)
+    def accept(self):
+        """Save the selected fields for the next export and close the dialog"""
+        self._save_selection()
+        super().accept()
+    
+    def _load_selection(self):
+        """Restore the field selection saved by the last accepted export"""
+        if not self._built:
+            return
+        
+        settings = QSettings("FragranceOrg", "Fragrance Collection Organizer")
+        unchecked = settings.value("export/fields_unchecked", []) or []
+        if isinstance(unchecked, str):
+            unchecked = [unchecked]
+        
+        for key, item in self._field_items.items():
+            item.setCheckState(_CHECK_STATES[key not in unchecked])
+    
+    def _save_selection(self):
+        """Save the unchecked fields to settings"""
+        settings = QSettings("FragranceOrg", "Fragrance Collection Organizer")
+        unchecked = [key for key, check_state in self._check_state_getters if check_state() != Qt.Checked]
+        settings.setValue("export/fields_unchecked", unchecked)
+    
+    @Slot()
+    def reset_defaults(self):
+        """Restore the default selection of export fields"""
+        if not self._built:
+            return
+        
+        for key, item in self._field_items.items():
+            item.setCheckState(_CHECK_STATES[_DEFAULTS.get(key, True)])
     
-    def _select_none(self):
-        """Deselect all export fields"""
-        for checkbox in self.findChildren(QCheckBox):
-            checkbox.setChecked(False)
+    @Slot(int)
+    def _apply_state(self, state):
+        """Select (1) or deselect (0) all export fields"""
+        check_state = _CHECK_STATES[bool(state)]
+        for item in self._field_items.values():
+            item.setCheckState(check_state)
     
     def get_selected_fields(self):
-        """Get a dictionary of selected export fields"""
-        return {
-            'house': self._field_checkboxes["house"].isChecked(),
-            'name': self._field_checkboxes["name"].isChecked(),
-            'size_oz': self._field_checkboxes["size_oz"].isChecked(),
-            'size_ml': self._field_checkboxes["size_ml"].isChecked(),
-            'concentration': self._field_checkboxes["concentration"].isChecked(),
-            'top_notes': self._field_checkboxes["top_notes"].isChecked(),
-            'middle_notes': self._field_checkboxes["middle_notes"].isChecked(),
-            'base_notes': self._field_checkboxes["base_notes"].isChecked(),
-            'winter_rating': self._field_checkboxes["winter_rating"].isChecked(),
-            'spring_rating': self._field_checkboxes["spring_rating"].isChecked(),
-            'summer_rating': self._field_checkboxes["summer_rating"].isChecked(),
-            'fall_rating': self._field_checkboxes["fall_rating"].isChecked(),
-            'longevity': self._field_checkboxes["longevity"].isChecked(),
-            'sillage': self._field_checkboxes["sillage"].isChecked(),
-            'is_clone': self._field_checkboxes["is_clone"].isChecked(),
-            'original_fragrance': self._field_checkboxes["original_fragrance"].isChecked(),
-            'is_favorite': self._field_checkboxes["is_favorite"].isChecked()
-        } 
\ No newline at end of file
+        """Get the set of export field keys that are checked"""
+        self._ensure_ui()
+        return frozenset(key for key, check_state in self._check_state_getters if check_state() == Qt.Checked)
@@ -22,14 +22,35 @@ from PySide6.QtWidgets import (
     QDialogButtonBox, QSpinBox, QTextEdit, QSlider, QWidget, QCompleter,
     QApplication
 )
-from PySide6.QtCore import Qt, Signal, Slot, QEvent, QPoint, QRect, QTimer, QStringListModel
+from PySide6.QtCore import Qt, Signal, Slot, QEvent, QPoint, QRect, QTimer, QSignalBlocker, QStringListModel
 from PySide6.QtGui import QTextCursor, QKeyEvent, QFontMetrics
 
 from src.models import Fragrance
-from src.ui.widgets import RatingSlider
+from src.ui.widgets import RatingSlider, NotesCompleterLineEdit, SAMPLE_NOTES
 from src.db import db_manager
 
 
+# Milliliters per US fluid ounce
+_ML_PER_OZ = 29.5735
+
+# Pre-formatted ml labels for every 0.1 oz step of the size spinbox (0.0 - 50.0 oz)
+_ML_LABELS = tuple(f"{round(tenths / 10 * _ML_PER_OZ, 1)} ml" for tenths in range(501))
+
+# Well-known houses suggested even when the collection does not contain them
+_SAMPLE_HOUSES = frozenset((
+    "Chanel", "Dior", "Yves Saint Laurent", "Gucci", "Giorgio Armani", "Versace",
+    "Prada", "Dolce & Gabbana", "Givenchy", "Hermès", "Burberry",
+    "Calvin Klein", "Hugo Boss", "Tommy Hilfiger", "Lacoste", "Jean Paul Gaultier",
+    "Creed", "Maison Francis Kurkdjian", "Amouage", "Parfums de Marly",
+    "Xerjoff", "Initio", "Memo Paris", "Byredo", "Diptyque", "Le Labo",
+    "Frederic Malle", "Maison Margiela", "Penhaligon's", "Ormonde Jayne",
+    "Lattafa Perfumes", "Rasasi", "Ard Al Zaafaran", "Afnan", "Al Haramain", 
+    "Swiss Arabian", "Ajmal", "Khadlaj", "Nabeel", "Armaf", "Louis Vuitton",
+    "Zoologist", "Imaginary Authors", "Gallivant", "House of Matriarch",
+    "4160 Tuesdays", "Slumberhouse", "Bortnikoff", "Rogue Perfumery", "DS & Durga",
+    "Bath & Body Works", "Victoria's Secret", "Abercrombie & Fitch", "Coach", "Michael Kors"
+))
+
 class PerformanceSlider(QWidget):
     """
     Custom slider widget for performance metrics (longevity, sillage)
@@ -100,140 +121,20 @@ class PerformanceSlider(QWidget):
             self._label.setText(f"{self._label_text}: {self._value}/5")
 
 
-class NotesCompleterLineEdit(QLineEdit):
-    """
-    Custom QLineEdit with comma-separated text autocompletion
-    """
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self._completer = QCompleter([])
-        self._completer.setCaseSensitivity(Qt.CaseInsensitive)
-        self._completer.setCompletionMode(QCompleter.PopupCompletion)
-        self._completer.activated.connect(self._insertCompletion)
-        self._completer.setWidget(self)
-        self._all_items = []
-        self._current_completion = ""
-        
-        # Connect text changed signal for real-time completion
-        self.textChanged.connect(self._handleTextChanged)
-        
-        # Connect to completer signals for highlighted items
-        self._completer.highlighted.connect(self._onCompletionHighlighted)
-        
-    def keyPressEvent(self, event):
-        """Override key press event to handle special keys"""
-        # Handle right arrow to accept current highlighted completion
-        if self._completer.popup().isVisible():
-            if event.key() == Qt.Key_Right:
-                if self._current_completion:
-                    self._insertCompletion(self._current_completion)
-                    return
-        
-        super().keyPressEvent(event)
-        
-        # Don't update completer for navigation keys or other special keys
-        if event.key() not in (Qt.Key_Up, Qt.Key_Down, Qt.Key_Enter, Qt.Key_Return, Qt.Key_Escape, 
-                              Qt.Key_Tab, Qt.Key_Backtab, Qt.Key_Right, Qt.Key_Left):
-            self._handleTextChanged(self.text())
-    
-    def _onCompletionHighlighted(self, text):
-        """Track the currently highlighted completion"""
-        self._current_completion = text
-    
-    def setAllItems(self, items):
-        """Set the complete list of available items"""
-        self._all_items = items
-        
-    def _handleTextChanged(self, text):
-        """Handle text changes to update the completer"""
-        if not text:
-            # Hide completer if there's no text
-            self._completer.popup().hide()
-            return
-            
-        # Find the last comma and get text after it
-        last_comma_pos = text.rfind(",") + 1
-        if last_comma_pos > 0:
-            current_term = text[last_comma_pos:].strip()
-        else:
-            current_term = text
-            
-        if current_term:
-            # Only update and show completer if there's something to complete
-            has_matches = self._updateCompleter(current_term)
-            if has_matches:
-                self._completer.complete()
-    
-    def _updateCompleter(self, current_term):
-        """Update the completer model with filtered items"""
-        filtered_items = [item for item in self._all_items if current_term.lower() in item.lower()]
-        
-        if filtered_items:
-            self._completer.setModel(QStringListModel(filtered_items))
-            
-            # Set the first item as current if there's an exact prefix match
-            for item in filtered_items:
-                if item.lower().startswith(current_term.lower()):
-                    index = self._completer.completionModel().index(filtered_items.index(item), 0)
-                    self._completer.popup().setCurrentIndex(index)
-                    break
-            return True
-        else:
-            # Hide the completer if there are no matches
-            self._completer.popup().hide()
-            return False
-    
-    def _insertCompletion(self, completion):
-        """Insert the selected completion at the current position"""
-        current_text = self.text()
-        cursor_pos = self.cursorPosition()
-        last_comma_pos = current_text.rfind(",", 0, cursor_pos) + 1
-        
-        # Create the new text with the completion inserted
-        if last_comma_pos > 0:
-            # Adding to existing comma-separated list
-            prefix = current_text[:last_comma_pos]
-            suffix = current_text[cursor_pos:]
-            
-            # Add space after comma if needed
-            if not prefix.endswith(" "):
-                prefix += " "
-                
-            # Build the new text with the completion properly inserted
-            new_text = prefix + completion + suffix
-            
-            # Set the cursor position to be after the completion
-            new_cursor_pos = len(prefix) + len(completion)
-        else:
-            # First item in the list
-            suffix = current_text[cursor_pos:]
-            
-            # Build the new text
-            new_text = completion + suffix
-            
-            # Set the cursor position to be after the completion
-            new_cursor_pos = len(completion)
-        
-        # Set the new text
-        self.setText(new_text)
-        
-        # Set the cursor position
-        self.setCursorPosition(new_cursor_pos)
-        
-        # Hide the completer after selection
-        self._completer.popup().hide()
-
-
 class FragranceDialog(QDialog):
     """
     Dialog for adding or editing a fragrance
     """
+    # (corpus, house model, notes) shared by every dialog until the collection changes
+    _autocomplete_cache = None
+    
     def __init__(self, fragrance=None, parent=None):
         super().__init__(parent)
         
         self._fragrance = fragrance
         self._is_edit_mode = fragrance is not None
         self._notes_list = []  # Store the list of notes for completion
+        self._notes_autocomplete_ready = False
         
         self._setup_ui()
         self._setup_autocompletion()
@@ -369,8 +270,11 @@ class FragranceDialog(QDialog):
     
     def _update_ml_equivalent(self, oz_value):
         """Update the milliliter equivalent label when oz value changes"""
-        ml_value = round(oz_value * 29.5735, 1)
-        self._ml_label.setText(f"{ml_value} ml")
+        tenths = round(oz_value * 10)
+        if 0 <= tenths < len(_ML_LABELS):
+            self._ml_label.setText(_ML_LABELS[tenths])
+        else:
+            self._ml_label.setText(f"{round(oz_value * _ML_PER_OZ, 1)} ml")
     
     def _toggle_clone_field(self, is_checked):
         """Enable/disable the original fragrance field based on clone checkbox"""
@@ -394,10 +298,15 @@ class FragranceDialog(QDialog):
         if index >= 0:
             self._concentration_input.setCurrentIndex(index)
         
-        # Notes
-        self._top_notes_input.setText(self._fragrance.top_notes())
-        self._middle_notes_input.setText(self._fragrance.middle_notes())
-        self._base_notes_input.setText(self._fragrance.base_notes())
+        # Notes, with signals blocked so loading doesn't queue completer refreshes
+        notes_fields = (
+            (self._top_notes_input, self._fragrance.top_notes()),
+            (self._middle_notes_input, self._fragrance.middle_notes()),
+            (self._base_notes_input, self._fragrance.base_notes()),
+        )
+        for notes_input, notes in notes_fields:
+            with QSignalBlocker(notes_input):
+                notes_input.setText(notes)
         
         # Seasonality
         self._winter_slider.setValue(self._fragrance.winter_rating())
@@ -435,110 +344,55 @@ class FragranceDialog(QDialog):
         
         return data
     
-    def _setup_autocompletion(self):
-        """Set up autocompletion for houses and notes"""
-        # Get all fragrances
-        fragrances = db_manager.get_all_fragrances()
-        
-        # Get unique houses
-        houses = set()
-        all_notes = set()
-        
-        for fragrance in fragrances:
-            # Collect houses
-            if fragrance['house']:
-                houses.add(fragrance['house'])
+    def _autocomplete_lists(self):
+        """
+        Get the house model and notes list shared by all dialogs
+        
+        Returns:
+            Tuple (house_model, notes) rebuilt only when the collection changes
+        """
+        # Distinct houses and notes already in the collection, cached by the database manager
+        corpus = db_manager.get_autocomplete_corpus()
+        
+        # The merged lists only change with the corpus, so every dialog shares them
+        cache = FragranceDialog._autocomplete_cache
+        if cache is None or cache[0] is not corpus:
+            collection_houses, collection_notes = corpus
             
-            # Collect all notes for autocomplete
-            if fragrance['top_notes']:
-                for note in [n.strip() for n in fragrance['top_notes'].split(',')]:
-                    if note:
-                        all_notes.add(note)
+            # Always include the sample houses and notes, regardless of whether the collection is empty;
+            # both are sorted to match the case-insensitive lookups of their completers
+            houses = sorted(_SAMPLE_HOUSES.union(collection_houses), key=str.lower)
+            notes = tuple(sorted(SAMPLE_NOTES.union(collection_notes), key=str.lower))
             
-            if fragrance['middle_notes']:
-                for note in [n.strip() for n in fragrance['middle_notes'].split(',')]:
-                    if note:
-                        all_notes.add(note)
-            
-            if fragrance['base_notes']:
-                for note in [n.strip() for n in fragrance['base_notes'].split(',')]:
-                    if note:
-                        all_notes.add(note)
-        
-        sample_houses = [
-            "Chanel", "Dior", "Yves Saint Laurent", "Gucci", "Giorgio Armani", "Versace",
-            "Prada", "Dolce & Gabbana", "Givenchy", "Hermès", "Burberry",
-            "Calvin Klein", "Hugo Boss", "Tommy Hilfiger", "Lacoste", "Jean Paul Gaultier",
-            "Creed", "Maison Francis Kurkdjian", "Amouage", "Parfums de Marly",
-            "Xerjoff", "Initio", "Memo Paris", "Byredo", "Diptyque", "Le Labo",
-            "Frederic Malle", "Maison Margiela", "Penhaligon's", "Ormonde Jayne",
-            "Lattafa Perfumes", "Rasasi", "Ard Al Zaafaran", "Afnan", "Al Haramain", 
-            "Swiss Arabian", "Ajmal", "Khadlaj", "Nabeel", "Armaf", "Louis Vuitton",
-            "Zoologist", "Imaginary Authors", "Gallivant", "House of Matriarch",
-            "4160 Tuesdays", "Slumberhouse", "Bortnikoff", "Rogue Perfumery", "DS & Durga",
-            "Bath & Body Works", "Victoria's Secret", "Abercrombie & Fitch", "Coach", "Michael Kors"
-        ]
-
-        # Always include the sample houses
-        houses.update(sample_houses)
-
-        # Always add these sample notes to ensure rich autocomplete suggestions
-        sample_notes = [
-            "Bergamot", "Lemon", "Orange", "Grapefruit", "Lime", "Neroli",
-            "Lavender", "Rose", "Jasmine", "Violet", "Ylang-Ylang", "Iris",
-            "Sandalwood", "Cedarwood", "Vetiver", "Patchouli", "Musk", "Amber",
-            "Vanilla", "Tobacco", "Leather", "Oud", "Cinnamon", "Cardamom",
-            "Apple", "Wild Lavender", "Orange Blossom", "Lily-of-the-Valley", "Tonka Bean",
-            "Black Currant", "Pink Pepper", "Cedar", "Incense", "Ginger",
-            "Oakmoss", "Ambergris", "Saffron", "Pineapple", "Birch", "Moroccan Jasmine",
-            "Mandarin Orange", "Petitgrain", "Seaweed", "Cotton Flower", "Virginia Cedar",
-            "Woodsy Notes", "Clary Sage", "Water Notes", "Rosemary", "Green Notes",
-            "Papaya", "Nutmeg", "Orris Root", "Freesia", "Green Accord", "Green Tea",
-            "Guaiac Wood", "Labdanum", "Plum", "Geranium", "Truffle", "Oak", "Sichuan Pepper",
-            "Star Anise", "Ambroxan", "Elemi", "Olibanum", "Blood Orange", "Juniper Berries",
-            "Pimento", "Sicilian Lemon", "Fig Nectar", "Cypriol Oil or Nagarmotha",
-            "Sea Water", "Juniper", "Coriander", "Basil", "Peach", "Melon", "Sea Salt",
-            "Aquozone", "Green Mandarin", "Cypress", "Mastic or Lentisque", "Coconut",
-            "Benzoin", "Honey", "Watermelon", "Green Apple", "Black Tea", "Frankincense",
-            "Agarwood (Oud)", "Woody Notes", "Black Pepper", "Amberwood", "Violet Leaf",
-            "Cashmeran", "Haitian Vetiver", "Clearwood", "Indian Ginger",
-            "Green Tangerine", "Aromatic Notes", "Spicy Notes", "Patchouli Leaf", "Water Jasmine",
-            "White Musk", "Moss", "Driftwood", "Tequila", "Sea Notes",
-            "Agave", "Salt", "Guava", "Palm Leaf", "Red Apple", "Calabrian Bergamot",
-            "Bourbon Geranium", "Tobacco Leaf", "Mineral Notes", "Papyrus",
-            "Carambola (Star Fruit)", "Brazilian Rosewood", "Tarragon", "Pepper",
-            "Rose de Mai", "Hyacinth", "White Pepper", "Tunisian Orange Blossom",
-            "Ambrofix", "Aldeyhydes", "Sycamore", "Tahitian Vetiver", "Cashmere Wood",
-            "Blackberry", "Tonka", "Bergamot Zest", "Lavandin", "Mandarin", "Mandarin Zest",
-            "Orange Zest", "Grapefruit Zest", "Pear", "Peony", "Gardenia", "Magnolia",
-            "Heliotrope", "Tiare Flower", "Carnation", "Cyclamen", "Honeysuckle",
-            "Chamomile", "Green Leaves", "Tea", "Mate", "Beeswax", "Coumarin",
-            "Myrrh", "Resins", "Balsam Fir", "Fir Resin", "Fir Balsam", "Pine",
-            "Cade Oil", "Amyris", "Iso E Super", "Oakwood", "Hinoki Wood", "Mahogany",
-            "Teak Wood", "Wormwood", "Absinthe", "Rum", "Whiskey", "Gin", "Cognac",
-            "Champagne", "Coffee", "Cacao", "Chocolate", "Dark Chocolate", "Milk",
-            "Cream", "Sugar", "Praline", "Caramel", "Almond", "Hazelnut", "Pistachio",
-            "Chestnut", "Walnut", "Marzipan", "Butter", "Pastry", "Candy",
-            "Mango", "Lychee", "Passionfruit", "Kiwi", "Pomegranate", "Fig", "Dates",
-            "Raisin", "Currant Buds", "Red Berries", "Strawberry", "Raspberry",
-            "Blueberry", "Cherry", "Ice", "Snow", "Metallic Notes", "Ink", "Gasoline",
-            "Gunpowder", "Rubber", "Smoke", "Ash", "Burnt Wood", "Charcoal", "Leather Accord",
-            "Suede", "Tobacco Blossom", "Hay", "Earthy Notes", "Mushroom", "Mossy Notes",
-            "Rain", "Dew", "Solar Notes", "Aldehydic Notes", "Skin", "Clean Cotton", "Powdery Notes"
-        ]
-        
-        # Always add the sample notes, regardless of whether the collection is empty
-        all_notes.update(sample_notes)
-        
-        # Set up house autocompleter
-        house_completer = QCompleter(sorted(houses))
+            cache = (corpus, QStringListModel(houses), notes)
+            FragranceDialog._autocomplete_cache = cache
+        
+        return cache[1], cache[2]
+    
+    def _setup_autocompletion(self):
+        """Set up autocompletion for houses; notes wait until a notes field is focused"""
+        house_model, _ = self._autocomplete_lists()
+        
+        # Set up house autocompleter over the shared model; its sort order lets the
+        # completer binary search instead of scanning every row
+        house_completer = QCompleter(house_model, self)
         house_completer.setCaseSensitivity(Qt.CaseInsensitive)
+        house_completer.setModelSorting(QCompleter.CaseInsensitivelySortedModel)
         self._house_input.setCompleter(house_completer)
         
-        # Set up notes autocompleters
-        notes_list = sorted(all_notes)
+        for notes_input in (self._top_notes_input, self._middle_notes_input, self._base_notes_input):
+            notes_input.focusGained.connect(self._setup_notes_autocompletion)
+    
+    @Slot()
+    def _setup_notes_autocompletion(self):
+        """Fill the notes completers the first time any notes field gets focus"""
+        if self._notes_autocomplete_ready:
+            return
+        self._notes_autocomplete_ready = True
+        
+        _, notes_list = self._autocomplete_lists()
         
         # Update notes lists for all note fields
         self._top_notes_input.setAllItems(notes_list)
         self._middle_notes_input.setAllItems(notes_list)
-        self._base_notes_input.setAllItems(notes_list) 
\ No newline at end of file
+        self._base_notes_input.setAllItems(notes_list)
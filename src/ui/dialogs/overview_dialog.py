@@ -17,16 +17,133 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from PySide6.QtWidgets import (
-    QDialog, QLabel, QVBoxLayout, QHBoxLayout, QGroupBox, 
-    QPushButton, QScrollArea, QWidget, QTextEdit, QApplication
+    QDialog, QLabel, QVBoxLayout, QHBoxLayout, 
+    QPushButton, QScrollArea, QWidget, QTextEdit, QApplication, QTableView, QHeaderView
 )
-from PySide6.QtCore import Qt, Slot, QTimer
+from PySide6.QtCore import Qt, Slot, Signal, QTimer, QObject, QRunnable, QThreadPool
 from PySide6.QtGui import QFont
 
-from src.models import collection_manager
+from src.models import collection_manager, RankingModel
 from src.db import db_manager
 from src.utils import theme_manager
 
+# Text color for each season in the seasonal rankings
+SEASON_COLORS = {
+    "Winter": "#0072B2",  # Blue
+    "Spring": "#009E73",  # Green
+    "Summer": "#E65849",  # Red
+    "Fall": "#D55E00",  # Orange
+}
+
+# Rendered statistics keyed by collection version
+_STATS_CACHE = {}
+_STATS_CACHE_SIZE = 2
+
+
+def _plural(count):
+    """Return the suffix that pluralizes a noun for the given count"""
+    return "" if count == 1 else "s"
+
+
+def _format_ranking(title, rows, unit, empty_text):
+    """
+    Format a ranking as plain text lines
+    
+    Args:
+        title: Section heading
+        rows: Ranked (name, count) tuples
+        unit: Word shown after each count
+        empty_text: Line shown when there are no rows
+        
+    Returns:
+        list: The heading followed by one numbered line per row
+    """
+    lines = [title]
+    lines.extend(f"{i}. {name} ({count} {unit})" for i, (name, count) in enumerate(rows, 1))
+    if not rows:
+        lines.append(empty_text)
+    return lines
+
+
+def _build_statistics():
+    """
+    Query the database and render the plain text summary
+    
+    Safe to run on a worker thread: it opens its own database connection
+    and touches no widgets.
+    
+    Returns:
+        dict: Totals, ranking rows and the plain text summary
+    """
+    # Read every statistic over one database connection
+    bundle = db_manager.get_overview_bundle(house_limit=3, notes_limit=10)
+    
+    # Basic stats
+    total_fragrances = bundle.total_fragrances if bundle else 0
+    total_houses = bundle.house_count if bundle else 0
+    
+    top_houses = bundle.top_houses if bundle else []
+    top_notes = bundle.top_notes if bundle else []
+    top_favorite_notes = bundle.top_favorite_notes if bundle else []
+    sorted_seasons = bundle.seasonal_ranking if bundle else []
+    
+    # Create text representation for copying, one section per ranking
+    sections = [
+        ["FRAGRANCE COLLECTION OVERVIEW", "============================"],
+        [
+            "Collection Statistics:",
+            f"- Total Fragrances: {total_fragrances}",
+            f"- Total Houses: {total_houses}",
+        ],
+        _format_ranking("Most Common Houses:", top_houses, "fragrances", "No house data available"),
+        _format_ranking("Top 10 Most Common Notes:", top_notes, "occurrences", "No notes data available"),
+        _format_ranking("Top 10 Notes in Favorite Fragrances:", top_favorite_notes, "occurrences",
+                        "No favorited fragrances found or no notes data available"),
+    ]
+    
+    seasons_section = ["Seasonal Preferences:"]
+    if sorted_seasons:
+        seasons_section.append("Seasons ranked by average rating:")
+        seasons_section.extend(
+            f"{i}. {season}: {avg:.2f}/5.0 ({count} fragrance{_plural(count)})"
+            for i, (season, avg, count) in enumerate(sorted_seasons, 1)
+        )
+        seasons_section += ["", "Note: Fragrances may be counted in multiple seasons if they score equally high in more than one season."]
+    else:
+        seasons_section.append("No seasonal data available")
+    sections.append(seasons_section)
+    
+    text_rep = "\n\n".join("\n".join(section) for section in sections) + "\n"
+    
+    return {
+        'total_fragrances': total_fragrances,
+        'total_houses': total_houses,
+        'top_houses': top_houses,
+        'top_notes': top_notes,
+        'top_favorite_notes': top_favorite_notes,
+        'seasons': sorted_seasons,
+        'text_rep': text_rep,
+    }
+
+
+class StatsWorkerSignals(QObject):
+    """Signals emitted by StatsWorker"""
+    finished = Signal(int, object)
+
+
+class StatsWorker(QRunnable):
+    """
+    Builds the overview statistics on a thread pool thread
+    """
+    def __init__(self, version):
+        super().__init__()
+        self.signals = StatsWorkerSignals()
+        self._version = version
+    
+    def run(self):
+        """Query and render the statistics, then hand them back to the GUI thread"""
+        self.signals.finished.emit(self._version, _build_statistics())
+
 
 class OverviewDialog(QDialog):
     """
@@ -38,8 +155,15 @@ class OverviewDialog(QDialog):
         self.setWindowTitle("Collection Overview")
         self.setMinimumSize(600, 500)
         
+        # Set when the statistics shown may be out of date; only reloaded while visible
+        self._dirty = True
+        
         self._setup_ui()
-        self._load_statistics()
+        
+        collection_manager.collection_updated.connect(self._mark_dirty)
+        
+        # Let the dialog paint its header before building the heavier sections
+        QTimer.singleShot(0, self._build_remaining_sections)
     
     def _setup_ui(self):
         """Set up the user interface"""
@@ -56,7 +180,7 @@ class OverviewDialog(QDialog):
         # Container for all content
         content_widget = QWidget()
         content_layout = QVBoxLayout(content_widget)
-        content_layout.setSpacing(20)
+        content_layout.setSpacing(10)
         content_layout.setContentsMargins(5, 5, 5, 5)
         
         # Header
@@ -68,75 +192,118 @@ class OverviewDialog(QDialog):
         header_label.setFont(font)
         content_layout.addWidget(header_label)
         
-        # Basic Stats Group
-        basic_stats_group = QGroupBox("Collection Statistics")
-        basic_stats_layout = QVBoxLayout(basic_stats_group)
-        basic_stats_layout.setSpacing(10)
-        basic_stats_layout.setContentsMargins(15, 15, 15, 15)
+        # The remaining sections are built after the first paint
+        self._content_layout = content_layout
+        
+        # Basic stats
+        self._add_section_header("Collection Statistics")
         
         self._total_fragrances_label = QLabel("Total Fragrances: Loading...")
         self._total_houses_label = QLabel("Total Houses: Loading...")
         
-        basic_stats_layout.addWidget(self._total_fragrances_label)
-        basic_stats_layout.addWidget(self._total_houses_label)
-        
-        content_layout.addWidget(basic_stats_group)
-        
-        # Popular Houses Group
-        houses_group = QGroupBox("Most Common Houses")
-        houses_layout = QVBoxLayout(houses_group)
-        houses_layout.setSpacing(10)
-        houses_layout.setContentsMargins(15, 15, 15, 15)
+        # Plain text skips the rich text parser on every refresh
+        for label in (self._total_fragrances_label, self._total_houses_label):
+            label.setTextFormat(Qt.PlainText)
         
-        self._houses_list = QLabel("Loading house data...")
-        self._houses_list.setTextFormat(Qt.RichText)
-        houses_layout.addWidget(self._houses_list)
+        content_layout.addWidget(self._total_fragrances_label)
+        content_layout.addWidget(self._total_houses_label)
         
-        content_layout.addWidget(houses_group)
+        self._sections_built = False
+        self._stats_worker = None
+        self._text_rep_str = ""
         
-        # Popular Notes Group
-        notes_group = QGroupBox("Top 10 Most Common Notes")
-        notes_layout = QVBoxLayout(notes_group)
-        notes_layout.setSpacing(10)
-        notes_layout.setContentsMargins(15, 15, 15, 15)
-        
-        self._notes_list = QLabel("Loading notes data...")
-        self._notes_list.setWordWrap(True)
-        self._notes_list.setTextFormat(Qt.RichText)
-        notes_layout.addWidget(self._notes_list)
+        # Set the scroll area widget
+        scroll_area.setWidget(content_widget)
+        main_layout.addWidget(scroll_area)
         
-        content_layout.addWidget(notes_group)
+        # Bottom buttons
+        button_layout = QHBoxLayout()
+        button_layout.setContentsMargins(0, 10, 0, 0)
         
-        # Favorite Notes Group
-        favorite_notes_group = QGroupBox("Top 10 Notes in Favorite Fragrances")
-        favorite_notes_layout = QVBoxLayout(favorite_notes_group)
-        favorite_notes_layout.setSpacing(10)
-        favorite_notes_layout.setContentsMargins(15, 15, 15, 15)
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.accept)
         
-        self._favorite_notes_list = QLabel("Loading favorite notes data...")
-        self._favorite_notes_list.setWordWrap(True)
-        self._favorite_notes_list.setTextFormat(Qt.RichText)
-        favorite_notes_layout.addWidget(self._favorite_notes_list)
+        self._refresh_button = QPushButton("Refresh Data")
+        self._refresh_button.clicked.connect(self._load_statistics)
         
-        content_layout.addWidget(favorite_notes_group)
+        button_layout.addWidget(self._refresh_button)
+        button_layout.addStretch()
+        button_layout.addWidget(close_button)
         
-        # Seasonal Preference Group
-        seasons_group = QGroupBox("Seasonal Preferences")
-        seasons_layout = QVBoxLayout(seasons_group)
-        seasons_layout.setSpacing(10)
-        seasons_layout.setContentsMargins(15, 15, 15, 15)
+        main_layout.addLayout(button_layout)
         
-        self._seasons_list = QLabel("Loading seasonal data...")
-        self._seasons_list.setTextFormat(Qt.RichText)
-        seasons_layout.addWidget(self._seasons_list)
+        # Connect to theme changes
+        theme_manager.theme_changed.connect(self._update_styling)
         
-        content_layout.addWidget(seasons_group)
+        # Initial styling
+        self._update_styling()
+    
+    def _add_section_header(self, title):
+        """Add a styled section header label to the content layout
+        
+        Args:
+            title: Text shown in the header
+        """
+        self._content_layout.addSpacing(10)
+        header = QLabel(title)
+        header.setObjectName("sectionHeader")
+        self._content_layout.addWidget(header)
+    
+    @Slot()
+    def _build_remaining_sections(self):
+        """Build the houses, notes, seasons and copy sections, then fill in the statistics"""
+        if self._sections_built:
+            return
+        self._sections_built = True
+        
+        # Rankings, each a small read-only table
+        self._houses_model = RankingModel(("House", "Fragrances"), parent=self)
+        self._notes_model = RankingModel(("Note", "Occurrences"), parent=self)
+        self._favorite_notes_model = RankingModel(("Note", "Occurrences"), parent=self)
+        self._seasons_model = RankingModel(("Season", "Average Rating", "Fragrances"), SEASON_COLORS, self)
+        
+        self._ranking_views = []
+        for title, model, empty_text in (
+            ("Most Common Houses", self._houses_model, "No house data available"),
+            ("Top 10 Most Common Notes", self._notes_model, "No notes data available"),
+            ("Top 10 Notes in Favorite Fragrances", self._favorite_notes_model,
+             "No favorited fragrances found or no notes data available"),
+            ("Seasonal Preferences", self._seasons_model, "No seasonal data available"),
+        ):
+            self._add_section_header(title)
+            
+            view = QTableView()
+            view.setModel(model)
+            view.setEditTriggers(QTableView.NoEditTriggers)
+            view.setSelectionMode(QTableView.NoSelection)
+            view.setFocusPolicy(Qt.NoFocus)
+            view.setShowGrid(False)
+            view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+            view.horizontalHeader().setStretchLastSection(True)
+            view.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+            
+            empty_label = QLabel(empty_text)
+            empty_label.hide()
+            
+            self._content_layout.addWidget(view)
+            self._content_layout.addWidget(empty_label)
+            self._ranking_views.append((view, empty_label))
+            
+            if model is self._seasons_model:
+                ties_label = QLabel(
+                    "Note: Fragrances may be counted in multiple seasons if they "
+                    "score equally high in more than one season."
+                )
+                ties_label.setTextFormat(Qt.PlainText)
+                ties_font = ties_label.font()
+                ties_font.setItalic(True)
+                ties_font.setPointSizeF(ties_font.pointSizeF() * 0.85)
+                ties_label.setFont(ties_font)
+                ties_label.setWordWrap(True)
+                self._content_layout.addWidget(ties_label)
         
         # Text representation for copying
-        copy_group = QGroupBox("Copy to Clipboard")
-        copy_layout = QVBoxLayout(copy_group)
-        copy_layout.setSpacing(10)
-        copy_layout.setContentsMargins(15, 15, 15, 15)
+        self._add_section_header("Copy to Clipboard")
         
         self._text_representation = QTextEdit()
         self._text_representation.setReadOnly(True)
@@ -152,244 +319,118 @@ class OverviewDialog(QDialog):
         self._copy_status = QLabel("")
         self._copy_status.setAlignment(Qt.AlignRight)
         
-        copy_layout.addWidget(self._text_representation)
+        # Clears the status message; restarted on every copy
+        self._copy_status_timer = QTimer(self)
+        self._copy_status_timer.setSingleShot(True)
+        self._copy_status_timer.setInterval(3000)
+        self._copy_status_timer.timeout.connect(self._copy_status.clear)
+        
+        self._content_layout.addWidget(self._text_representation)
         copy_status_layout = QHBoxLayout()
         copy_status_layout.addWidget(self._copy_status, 1)
         copy_status_layout.addWidget(copy_button)
-        copy_layout.addLayout(copy_status_layout)
-        
-        content_layout.addWidget(copy_group)
-        
-        # Set the scroll area widget
-        scroll_area.setWidget(content_widget)
-        main_layout.addWidget(scroll_area)
-        
-        # Bottom buttons
-        button_layout = QHBoxLayout()
-        button_layout.setContentsMargins(0, 10, 0, 0)
-        
-        close_button = QPushButton("Close")
-        close_button.clicked.connect(self.accept)
-        
-        refresh_button = QPushButton("Refresh Data")
-        refresh_button.clicked.connect(self._load_statistics)
-        
-        button_layout.addWidget(refresh_button)
-        button_layout.addStretch()
-        button_layout.addWidget(close_button)
+        self._content_layout.addLayout(copy_status_layout)
         
-        main_layout.addLayout(button_layout)
-        
-        # Connect to theme changes
-        theme_manager.theme_changed.connect(self._update_styling)
-        
-        # Initial styling
-        self._update_styling()
+        self._load_statistics()
     
+    @Slot()
     def _load_statistics(self):
         """Load and display collection statistics"""
-        # Basic stats
-        stats = collection_manager.get_collection_stats()
-        total_fragrances = stats.get('total_fragrances', 0)
-        total_houses = stats.get('house_count', 0)
-        
-        self._total_fragrances_label.setText(f"<b>Total Fragrances:</b> {total_fragrances}")
-        self._total_houses_label.setText(f"<b>Total Houses:</b> {total_houses}")
-        
-        # Get top houses (use database manager to get more specific stats)
-        top_houses = db_manager.get_top_houses(limit=3)
-        houses_text = ""
-        
-        if top_houses:
-            for i, (house, count) in enumerate(top_houses, 1):
-                houses_text += f"<b>{i}.</b> {house} <i>({count} fragrances)</i><br>"
-        else:
-            houses_text = "No house data available"
-        
-        self._houses_list.setText(houses_text)
-        
-        # Get top notes
-        top_notes = db_manager.get_top_notes(limit=10)
-        notes_text = ""
-        
-        if top_notes:
-            for i, (note, count) in enumerate(top_notes, 1):
-                notes_text += f"<b>{i}.</b> {note} <i>({count} occurrences)</i><br>"
-        else:
-            notes_text = "No notes data available"
-        
-        self._notes_list.setText(notes_text)
-        
-        # Get top notes from favorites
-        top_favorite_notes = db_manager.get_top_notes_from_favorites(limit=10)
-        favorite_notes_text = ""
-        
-        if top_favorite_notes:
-            for i, (note, count) in enumerate(top_favorite_notes, 1):
-                favorite_notes_text += f"<b>{i}.</b> {note} <i>({count} occurrences)</i><br>"
-        else:
-            favorite_notes_text = "No favorited fragrances found or no notes data available"
-        
-        self._favorite_notes_list.setText(favorite_notes_text)
-        
-        # Get seasonal averages and preference counts
-        seasonal_stats = db_manager.get_seasonal_averages()
-        seasonal_preferences = db_manager.get_seasonal_preferences()
-        
-        if seasonal_stats and seasonal_preferences:
-            # Sort seasons by rating (highest to lowest)
-            sorted_seasons = sorted(
-                [('Winter', seasonal_stats.get('winter_avg', 0), seasonal_preferences.get('winter_count', 0)),
-                 ('Spring', seasonal_stats.get('spring_avg', 0), seasonal_preferences.get('spring_count', 0)),
-                 ('Summer', seasonal_stats.get('summer_avg', 0), seasonal_preferences.get('summer_count', 0)),
-                 ('Fall', seasonal_stats.get('fall_avg', 0), seasonal_preferences.get('fall_count', 0))],
-                key=lambda x: x[1], reverse=True
-            )
-            
-            seasons_text = "<b>Seasons ranked by average rating:</b><br>"
-            for i, (season, avg, count) in enumerate(sorted_seasons, 1):
-                # Add color tags based on season
-                if season == "Winter":
-                    color = "#0072B2"  # Blue
-                elif season == "Spring":
-                    color = "#009E73"  # Green
-                elif season == "Summer":
-                    color = "#E65849"  # Red
-                elif season == "Fall":
-                    color = "#D55E00"  # Orange
-                else:
-                    color = "inherit"
-                    
-                # Add count of fragrances that score highest in this season
-                count_text = f"({count} fragrance{'s' if count != 1 else ''})"
-                seasons_text += f"<b>{i}.</b> <span style='color:{color};'>{season}</span>: <b>{avg:.2f}/5.0</b> <i>{count_text}</i><br>"
+        if not self._sections_built:
+            return
+        
+        # Hidden dialogs defer the work until they are shown again
+        if not self.isVisible():
+            self._dirty = True
+            return
+        self._dirty = False
+        
+        # A running worker reloads on completion if the collection changed in the meantime
+        if self._stats_worker is not None:
+            return
+        
+        # Statistics only change when the stored collection does, so reuse the last result
+        version = collection_manager.version()
+        statistics = _STATS_CACHE.get(version)
+        if statistics is not None:
+            self._apply_statistics(statistics)
+            return
+        
+        # Query on a worker thread so the dialog stays responsive
+        self._refresh_button.setEnabled(False)
+        self._stats_worker = StatsWorker(version)
+        self._stats_worker.signals.finished.connect(self._on_statistics_ready)
+        QThreadPool.globalInstance().start(self._stats_worker)
+    
+    @Slot(int, object)
+    def _on_statistics_ready(self, version, statistics):
+        """Cache statistics built by the worker and display them"""
+        # Keep only the current and previous versions
+        while len(_STATS_CACHE) >= _STATS_CACHE_SIZE:
+            del _STATS_CACHE[next(iter(_STATS_CACHE))]
+        _STATS_CACHE[version] = statistics
+        
+        self._stats_worker = None
+        self._refresh_button.setEnabled(True)
+        
+        # The collection changed while the worker ran, so load the current version instead
+        if version != collection_manager.version():
+            self._load_statistics()
+            return
+        self._apply_statistics(statistics)
+    
+    @Slot()
+    def _mark_dirty(self):
+        """Reload the statistics while the dialog is open, or flag them for the next show"""
+        self._load_statistics()
+    
+    def showEvent(self, event):
+        """Reload the statistics if the collection changed while the dialog was hidden"""
+        super().showEvent(event)
+        if self._dirty:
+            self._load_statistics()
+    
+    def _fit_ranking_views(self):
+        """Size each ranking table to its rows, or show its placeholder when empty"""
+        for view, empty_label in self._ranking_views:
+            has_rows = view.model().rowCount() > 0
+            view.setVisible(has_rows)
+            empty_label.setVisible(not has_rows)
             
-            # Add a note about possible ties
-            seasons_text += "<br><small><i>Note: Fragrances may be counted in multiple seasons if they score equally high in more than one season.</i></small>"
-        else:
-            seasons_text = "No seasonal data available"
-        
-        self._seasons_list.setText(seasons_text)
-        
-        # Create text representation for copying
-        text_rep = f"FRAGRANCE COLLECTION OVERVIEW\n"
-        text_rep += f"============================\n\n"
-        text_rep += f"Collection Statistics:\n"
-        text_rep += f"- Total Fragrances: {total_fragrances}\n"
-        text_rep += f"- Total Houses: {total_houses}\n\n"
-        
-        text_rep += f"Most Common Houses:\n"
-        if top_houses:
-            for i, (house, count) in enumerate(top_houses, 1):
-                text_rep += f"{i}. {house} ({count} fragrances)\n"
-        else:
-            text_rep += "No house data available\n"
-        text_rep += "\n"
-        
-        text_rep += f"Top 10 Most Common Notes:\n"
-        if top_notes:
-            for i, (note, count) in enumerate(top_notes, 1):
-                text_rep += f"{i}. {note} ({count} occurrences)\n"
-        else:
-            text_rep += "No notes data available\n"
-        text_rep += "\n"
-        
-        text_rep += f"Top 10 Notes in Favorite Fragrances:\n"
-        if top_favorite_notes:
-            for i, (note, count) in enumerate(top_favorite_notes, 1):
-                text_rep += f"{i}. {note} ({count} occurrences)\n"
-        else:
-            text_rep += "No favorited fragrances found or no notes data available\n"
-        text_rep += "\n"
-        
-        text_rep += f"Seasonal Preferences:\n"
-        if seasonal_stats and seasonal_preferences:
-            text_rep += "Seasons ranked by average rating:\n"
-            for i, (season, avg, count) in enumerate(sorted_seasons, 1):
-                text_rep += f"{i}. {season}: {avg:.2f}/5.0 ({count} fragrance{'s' if count != 1 else ''})\n"
-            text_rep += "\nNote: Fragrances may be counted in multiple seasons if they score equally high in more than one season.\n"
-        else:
-            text_rep += "No seasonal data available\n"
-        
-        self._text_representation.setText(text_rep)
+            if has_rows:
+                view.resizeRowsToContents()
+                view.setFixedHeight(
+                    view.horizontalHeader().height() + view.verticalHeader().length() + 2 * view.frameWidth()
+                )
+    
+    def _apply_statistics(self, statistics):
+        """Show rendered statistics in the dialog"""
+        self._total_fragrances_label.setText(f"Total Fragrances: {statistics['total_fragrances']}")
+        self._total_houses_label.setText(f"Total Houses: {statistics['total_houses']}")
+        self._houses_model.setRows(statistics['top_houses'])
+        self._notes_model.setRows(statistics['top_notes'])
+        self._favorite_notes_model.setRows(statistics['top_favorite_notes'])
+        self._seasons_model.setRows(statistics['seasons'])
+        self._fit_ranking_views()
+        
+        # Kept for copying so the text edit's document never has to be serialized back
+        self._text_rep_str = statistics['text_rep']
+        self._text_representation.setPlainText(self._text_rep_str)
     
     def _copy_to_clipboard(self):
         """Copy the overview text to clipboard"""
-        clipboard = QApplication.clipboard()
-        clipboard.setText(self._text_representation.toPlainText())
+        QApplication.clipboard().setText(self._text_rep_str)
         
         # Get current theme colors for status message
-        current_theme = theme_manager.get_current_theme()
-        theme_data = theme_manager._themes[current_theme]
-        primary_color = theme_data["palette"]["primary"].name()
+        primary_color = theme_manager.get_color_names()["primary"]
         
         # Show success message with theme-appropriate color
         self._copy_status.setText(f"<i style='color:{primary_color};'>Copied to clipboard!</i> ")
         
         # Clear the status message after 3 seconds
-        QTimer.singleShot(3000, lambda: self._copy_status.setText(""))
+        self._copy_status_timer.start()
     
     @Slot()
     def _update_styling(self):
         """Update styling based on the current theme"""
-        current_theme = theme_manager.get_current_theme()
-        theme_data = theme_manager._themes[current_theme]
-        
-        # Get colors from theme
-        bg_color = theme_data["palette"]["background"].name()
-        bg_alt_color = theme_data["palette"]["background_alt"].name()
-        text_color = theme_data["palette"]["foreground"].name()
-        primary_color = theme_data["palette"]["primary"].name()
-        secondary_color = theme_data["palette"]["secondary"].name()
-        
-        # Apply theme-based styling
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {bg_color};
-                color: {text_color};
-            }}
-            
-            QGroupBox {{
-                font-weight: bold;
-                border: 1px solid {primary_color};
-                border-radius: 5px;
-                margin-top: 1ex;
-                padding-top: 10px;
-            }}
-            
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 5px;
-                color: {primary_color};
-            }}
-            
-            QLabel {{
-                color: {text_color};
-            }}
-            
-            QTextEdit {{
-                background-color: {bg_alt_color};
-                color: {text_color};
-                border: 1px solid {primary_color};
-                border-radius: 3px;
-                padding: 4px;
-            }}
-            
-            QScrollArea {{
-                border: none;
-                background-color: transparent;
-            }}
-            
-            QPushButton {{
-                background-color: {primary_color};
-                color: white;
-                border: none;
-                padding: 5px 15px;
-                border-radius: 3px;
-            }}
-            
-            QPushButton:hover {{
-                background-color: {secondary_color};
-            }}
-        """) 
\ No newline at end of file
+        self.setStyleSheet(theme_manager.get_dialog_stylesheet()) 
\ No newline at end of file
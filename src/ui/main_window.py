@@ -43,6 +43,9 @@ class MainWindow(QMainWindow):
         self._filter_panel_visible = True
         self._saved_filter_width = 0
         
+        # Created on first use and reused afterwards
+        self._overview_dialog = None
+        
         self._setup_ui()
         self._setup_toolbar()
         self._setup_statusbar()
@@ -63,6 +66,9 @@ class MainWindow(QMainWindow):
         self._splitter = QSplitter(Qt.Horizontal)
         self._splitter.setHandleWidth(1)
         
+        # Every splitter styled on theme change; add new ones here when created
+        self._splitters = [self._splitter]
+        
         # Filter panel (left side)
         self._filter_panel = FilterPanel()
         self._filter_container = QWidget()
@@ -235,31 +241,7 @@ class MainWindow(QMainWindow):
     @Slot()
     def _update_toggle_button_style(self):
         """Update the toggle button style based on the current theme"""
-        current_theme_id = theme_manager.get_current_theme()
-        theme_data = theme_manager._themes[current_theme_id]
-        
-        primary_color = theme_data["palette"]["primary"].name()
-        text_color = theme_data["palette"]["foreground"].name()
-        bg_color = theme_data["palette"]["background_alt"].name()
-        
-        # Set button style
-        self._toggle_filter_btn.setStyleSheet(f"""
-            QToolButton#toggleFilterButton {{
-                background-color: {bg_color};
-                color: {text_color};
-                border: 1px solid {primary_color};
-                border-top-right-radius: 12px;
-                border-bottom-right-radius: 12px;
-                border-left: none;
-                font-weight: bold;
-                font-size: 12px;
-            }}
-            
-            QToolButton#toggleFilterButton:hover {{
-                background-color: {primary_color};
-                color: white;
-            }}
-        """)
+        self._toggle_filter_btn.setStyleSheet(theme_manager.get_toggle_button_stylesheet())
     
     @Slot()
     def _refresh_collection(self):
@@ -306,19 +288,10 @@ class MainWindow(QMainWindow):
     @Slot()
     def _update_splitter_style(self):
         """Update the splitter handle style based on the current theme"""
-        current_theme_id = theme_manager.get_current_theme()
-        theme_data = theme_manager._themes[current_theme_id]
-        bg_color = theme_data["palette"]["background_alt"].name()
-        
-        # Set splitter style
-        style = f"""
-            QSplitter::handle {{
-                background-color: {bg_color};
-            }}
-        """
-        
-        # Find all splitters and update their style
-        for splitter in self.findChildren(QSplitter):
+        style = theme_manager.get_splitter_stylesheet()
+        
+        # Update the registered splitters directly instead of searching the widget tree
+        for splitter in self._splitters:
             splitter.setStyleSheet(style)
         
         # Also update the toggle button style
@@ -331,5 +304,10 @@ class MainWindow(QMainWindow):
     @Slot()
     def _show_overview(self):
         """Show the collection overview dialog"""
-        dialog = OverviewDialog()
-        dialog.exec() 
\ No newline at end of file
+        # Reuse one dialog; it reloads its statistics on show only when the collection changed
+        if self._overview_dialog is None:
+            self._overview_dialog = OverviewDialog(self)
+        
+        self._overview_dialog.show()
+        self._overview_dialog.raise_()
+        self._overview_dialog.activateWindow() 
\ No newline at end of file
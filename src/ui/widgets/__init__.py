@@ -18,4 +18,5 @@
 
 from .rating_slider import RatingSlider
 from .season_rating_bar import SeasonRatingBar, SeasonalityPanel
-from .performance_bar import PerformanceBar 
\ No newline at end of file
+from .performance_bar import PerformanceBar
+from .notes_completer_line_edit import NotesCompleterLineEdit, SAMPLE_NOTES 
\ No newline at end of file
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright 2025 Fragrance Collection Organizer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from bisect import bisect_left
+
+from PySide6.QtWidgets import QLineEdit, QCompleter
+from PySide6.QtCore import Qt, QStringListModel, QSortFilterProxyModel, QTimer, Signal, Slot
+
+
+# Common notes suggested even when the collection does not contain them
+SAMPLE_NOTES = frozenset((
+    "Bergamot", "Lemon", "Orange", "Grapefruit", "Lime", "Neroli",
+    "Lavender", "Rose", "Jasmine", "Violet", "Ylang-Ylang", "Iris",
+    "Sandalwood", "Cedarwood", "Vetiver", "Patchouli", "Musk", "Amber",
+    "Vanilla", "Tobacco", "Leather", "Oud", "Cinnamon", "Cardamom",
+    "Apple", "Wild Lavender", "Orange Blossom", "Lily-of-the-Valley", "Tonka Bean",
+    "Black Currant", "Pink Pepper", "Cedar", "Incense", "Ginger",
+    "Oakmoss", "Ambergris", "Saffron", "Pineapple", "Birch", "Moroccan Jasmine",
+    "Mandarin Orange", "Petitgrain", "Seaweed", "Cotton Flower", "Virginia Cedar",
+    "Woodsy Notes", "Clary Sage", "Water Notes", "Rosemary", "Green Notes",
+    "Papaya", "Nutmeg", "Orris Root", "Freesia", "Green Accord", "Green Tea",
+    "Guaiac Wood", "Labdanum", "Plum", "Geranium", "Truffle", "Oak", "Sichuan Pepper",
+    "Star Anise", "Ambroxan", "Elemi", "Olibanum", "Blood Orange", "Juniper Berries",
+    "Pimento", "Sicilian Lemon", "Fig Nectar", "Cypriol Oil or Nagarmotha",
+    "Sea Water", "Juniper", "Coriander", "Basil", "Peach", "Melon", "Sea Salt",
+    "Aquozone", "Green Mandarin", "Cypress", "Mastic or Lentisque", "Coconut",
+    "Benzoin", "Honey", "Watermelon", "Green Apple", "Black Tea", "Frankincense",
+    "Agarwood (Oud)", "Woody Notes", "Black Pepper", "Amberwood", "Violet Leaf",
+    "Cashmeran", "Haitian Vetiver", "Clearwood", "Indian Ginger",
+    "Green Tangerine", "Aromatic Notes", "Spicy Notes", "Patchouli Leaf", "Water Jasmine",
+    "White Musk", "Moss", "Driftwood", "Tequila", "Sea Notes",
+    "Agave", "Salt", "Guava", "Palm Leaf", "Red Apple", "Calabrian Bergamot",
+    "Bourbon Geranium", "Tobacco Leaf", "Mineral Notes", "Papyrus",
+    "Carambola (Star Fruit)", "Brazilian Rosewood", "Tarragon", "Pepper",
+    "Rose de Mai", "Hyacinth", "White Pepper", "Tunisian Orange Blossom",
+    "Ambrofix", "Aldeyhydes", "Sycamore", "Tahitian Vetiver", "Cashmere Wood",
+    "Blackberry", "Tonka", "Bergamot Zest", "Lavandin", "Mandarin", "Mandarin Zest",
+    "Orange Zest", "Grapefruit Zest", "Pear", "Peony", "Gardenia", "Magnolia",
+    "Heliotrope", "Tiare Flower", "Carnation", "Cyclamen", "Honeysuckle",
+    "Chamomile", "Green Leaves", "Tea", "Mate", "Beeswax", "Coumarin",
+    "Myrrh", "Resins", "Balsam Fir", "Fir Resin", "Fir Balsam", "Pine",
+    "Cade Oil", "Amyris", "Iso E Super", "Oakwood", "Hinoki Wood", "Mahogany",
+    "Teak Wood", "Wormwood", "Absinthe", "Rum", "Whiskey", "Gin", "Cognac",
+    "Champagne", "Coffee", "Cacao", "Chocolate", "Dark Chocolate", "Milk",
+    "Cream", "Sugar", "Praline", "Caramel", "Almond", "Hazelnut", "Pistachio",
+    "Chestnut", "Walnut", "Marzipan", "Butter", "Pastry", "Candy",
+    "Mango", "Lychee", "Passionfruit", "Kiwi", "Pomegranate", "Fig", "Dates",
+    "Raisin", "Currant Buds", "Red Berries", "Strawberry", "Raspberry",
+    "Blueberry", "Cherry", "Ice", "Snow", "Metallic Notes", "Ink", "Gasoline",
+    "Gunpowder", "Rubber", "Smoke", "Ash", "Burnt Wood", "Charcoal", "Leather Accord",
+    "Suede", "Tobacco Blossom", "Hay", "Earthy Notes", "Mushroom", "Mossy Notes",
+    "Rain", "Dew", "Solar Notes", "Aldehydic Notes", "Skin", "Clean Cotton", "Powdery Notes"
+))
+
+
+class NotesCompleterLineEdit(QLineEdit):
+    """
+    Custom QLineEdit with comma-separated text autocompletion
+    """
+    # Emitted whenever the line edit receives keyboard focus
+    focusGained = Signal()
+    
+    # Shortest term worth completing; single letters match nearly every note
+    MIN_COMPLETE_LEN = 2
+    
+    # Delay in milliseconds before the completer refreshes after typing
+    UPDATE_DELAY_MS = 60
+    
+    # (items, lowercase tuple, source model) built by the last setAllItems call and
+    # reused by every instance given the same items
+    _shared_index = None
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # All items live in one source model, shared with other instances once
+        # setAllItems is called; a proxy does the per-term filtering in C++
+        self._source_model = QStringListModel(self)
+        self._proxy = QSortFilterProxyModel(self)
+        self._proxy.setSourceModel(self._source_model)
+        self._proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        
+        self._completer = QCompleter(self._proxy, self)
+        self._completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self._completer.setCompletionMode(QCompleter.PopupCompletion)
+        self._completer.activated.connect(self._insertCompletion)
+        self._completer.setWidget(self)
+        self._all_items_lower = ()
+        self._last_popup_term = None
+        self._current_completion = ""
+        self._pending_text = ""
+        
+        # Coalesce bursts of typing into a single completer refresh
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.UPDATE_DELAY_MS)
+        self._debounce.timeout.connect(self._doCompleterUpdate)
+        
+        # Connect text changed signal for completion
+        self.textChanged.connect(self._scheduleCompleterUpdate)
+        
+        # Connect to completer signals for highlighted items
+        self._completer.highlighted.connect(self._onCompletionHighlighted)
+        
+    def focusInEvent(self, event):
+        """Notify listeners before the user starts typing"""
+        super().focusInEvent(event)
+        self.focusGained.emit()
+    
+    def keyPressEvent(self, event):
+        """Override key press event to handle special keys"""
+        # Handle right arrow to accept current highlighted completion
+        if self._completer.popup().isVisible():
+            if event.key() == Qt.Key_Right:
+                if self._current_completion:
+                    self._insertCompletion(self._current_completion)
+                    return
+        
+        super().keyPressEvent(event)
+        
+        # Don't update completer for navigation keys or other special keys
+        if event.key() not in (Qt.Key_Up, Qt.Key_Down, Qt.Key_Enter, Qt.Key_Return, Qt.Key_Escape, 
+                              Qt.Key_Tab, Qt.Key_Backtab, Qt.Key_Right, Qt.Key_Left):
+            self._scheduleCompleterUpdate(self.text())
+    
+    @Slot(str)
+    def _scheduleCompleterUpdate(self, text):
+        """Remember the latest text and restart the debounce timer"""
+        self._pending_text = text
+        self._debounce.start()
+    
+    @Slot()
+    def _doCompleterUpdate(self):
+        """Refresh the completer once typing has paused"""
+        self._handleTextChanged(self._pending_text)
+    
+    def _onCompletionHighlighted(self, text):
+        """Track the currently highlighted completion"""
+        self._current_completion = text
+    
+    def setAllItems(self, items):
+        """Set the complete list of available items"""
+        shared = NotesCompleterLineEdit._shared_index
+        if shared is None or shared[0] is not items:
+            # Lowercase each item once here rather than on every keystroke; the
+            # lowercase tuple and the model share the sort order used for bisect lookups
+            index = sorted((item.lower(), item) for item in items)
+            model = QStringListModel([item for _, item in index])
+            shared = (items, tuple(low for low, _ in index), model)
+            NotesCompleterLineEdit._shared_index = shared
+        
+        _, self._all_items_lower, self._source_model = shared
+        self._proxy.setSourceModel(self._source_model)
+        
+    @staticmethod
+    def _segment_bounds(text, cursor_pos):
+        """
+        Locate the comma-separated segment that ends at the cursor
+        
+        Args:
+            text: Full text of the line edit
+            cursor_pos: Position the segment ends at
+            
+        Returns:
+            Tuple (start, end) of the segment within text
+        """
+        return text.rfind(",", 0, cursor_pos) + 1, cursor_pos
+    
+    def _handleTextChanged(self, text):
+        """Handle text changes to update the completer"""
+        if not text:
+            # Hide completer if there's no text
+            self._completer.popup().hide()
+            return
+            
+        # The term being typed is the segment after the last comma
+        seg_start, seg_end = self._segment_bounds(text, len(text))
+        current_term = text[seg_start:seg_end].strip()
+        
+        if len(current_term) < self.MIN_COMPLETE_LEN:
+            self._completer.popup().hide()
+            return
+        
+        # Text set programmatically (e.g. when loading a fragrance) needs no popup
+        if not self.hasFocus():
+            return
+        
+        # Only update and show completer if there's something to complete
+        has_matches = self._updateCompleter(current_term)
+        if has_matches:
+            # The proxy already refreshed the visible rows, so only reposition the
+            # popup when it is hidden or the user started a different term
+            term = current_term.lower()
+            if (not self._completer.popup().isVisible() or self._last_popup_term is None
+                    or not term.startswith(self._last_popup_term)):
+                self._completer.complete()
+            self._last_popup_term = term
+    
+    def _updateCompleter(self, current_term):
+        """Update the completer filter for the current term"""
+        self._proxy.setFilterFixedString(current_term)
+        
+        if self._proxy.rowCount():
+            # Set the first item as current if there's an exact prefix match; the source
+            # model shares the sorted order of the lowercase index, so bisect finds it
+            term = current_term.lower()
+            lower = self._all_items_lower
+            row = bisect_left(lower, term)
+            if row < len(lower) and lower[row].startswith(term):
+                proxy_index = self._proxy.mapFromSource(self._source_model.index(row, 0))
+                index = self._completer.completionModel().index(proxy_index.row(), 0)
+                self._completer.popup().setCurrentIndex(index)
+            return True
+        else:
+            # Hide the completer if there are no matches
+            self._completer.popup().hide()
+            return False
+    
+    def _insertCompletion(self, completion):
+        """Insert the selected completion at the current position"""
+        current_text = self.text()
+        seg_start, cursor_pos = self._segment_bounds(current_text, self.cursorPosition())
+        
+        # Keep everything up to the comma (plus a space) and after the cursor
+        prefix = current_text[:seg_start] + " " if seg_start else ""
+        self.setText("".join((prefix, completion, current_text[cursor_pos:])))
+        
+        # Set the cursor position to be after the completion
+        self.setCursorPosition(len(prefix) + len(completion))
+        
+        # Hide the completer after selection, dropping the refresh queued by setText
+        self._debounce.stop()
+        self._completer.popup().hide()
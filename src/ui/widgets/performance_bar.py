@@ -17,8 +17,8 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from PySide6.QtWidgets import QWidget, QLabel, QProgressBar, QHBoxLayout
-from PySide6.QtCore import Qt, Slot
-from PySide6.QtGui import QPainter, QPen, QFont, QColor
+from PySide6.QtCore import Qt, QEvent, QRect, QTimer, Slot
+from PySide6.QtGui import QPainter, QPainterPath, QPen, QBrush, QFont, QFontMetrics, QColor, QPixmap
 
 from src.utils import theme_manager
 
@@ -27,46 +27,117 @@ class OutlinedProgressBar(QProgressBar):
     """
     Custom QProgressBar with outlined text for better readability
     """
+    # Outline padding around the text, in pixels
+    TEXT_PADDING = 2
+    
+    # Rendered outlined text shared by every bar, keyed by text, font, colors and pixel ratio
+    _pixmap_cache = {}
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self._text_color = Qt.white
         self._outline_color = Qt.black
+        self._background_color = Qt.black
+        
+        # paintEvent covers every pixel itself, so Qt can skip erasing the background first
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        
+        # Text pixmap and where it sits, looked up again only when the text, size or colors change
+        self._text_pixmap = None
+        self._text_rect = QRect()
+        self._layout_key = None
+        
+        # Bold copy of the widget font and its metrics, reset on font changes
+        self._bold_font = None
+        self._bold_metrics = None
         
     def setTextColor(self, color):
         self._text_color = color
+        self._layout_key = None
         
     def setOutlineColor(self, color):
         self._outline_color = color
+        self._layout_key = None
+        
+    def setBackgroundColor(self, color):
+        self._background_color = color
+    
+    def changeEvent(self, event):
+        """Drop the cached font and text layout when the widget font changes"""
+        if event.type() == QEvent.FontChange:
+            self._bold_font = None
+            self._bold_metrics = None
+            self._layout_key = None
+        super().changeEvent(event)
     
     def paintEvent(self, event):
+        # Nothing to draw when the bar is fully covered
+        if self.visibleRegion().isEmpty():
+            return
+        
+        # Fill behind the rounded corners the stylesheet leaves unpainted
+        background_painter = QPainter(self)
+        background_painter.fillRect(event.rect(), self._background_color)
+        background_painter.end()
+        
         # First, let the progress bar draw itself normally
         super().paintEvent(event)
         
         # Then, overlay our custom text with an outline
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Create the font
-        font = QFont(self.font())
-        font.setBold(True)
-        painter.setFont(font)
-        
-        # Get the text to display
         text = self.text()
+        key = (text, self.size(), self.devicePixelRatioF())
+        if key != self._layout_key:
+            self._text_pixmap = self._outlined_text_pixmap(text)
+            size = self._text_pixmap.deviceIndependentSize().toSize()
+            self._text_rect = QRect(
+                (self.width() - size.width()) // 2, (self.height() - size.height()) // 2,
+                size.width(), size.height()
+            )
+            self._layout_key = key
+        
+        # Skip the text when only an unrelated part of the bar is being repainted
+        if not event.region().intersects(self._text_rect):
+            return
         
-        # Draw the text with an outline
-        rect = self.rect()
-        
-        # Draw the outline (stroke)
-        painter.setPen(QPen(self._outline_color, 1.5))
-        painter.drawText(rect.adjusted(-1, -1, -1, -1), Qt.AlignCenter, text)
-        painter.drawText(rect.adjusted(1, -1, 1, -1), Qt.AlignCenter, text)
-        painter.drawText(rect.adjusted(-1, 1, -1, 1), Qt.AlignCenter, text)
-        painter.drawText(rect.adjusted(1, 1, 1, 1), Qt.AlignCenter, text)
-        
-        # Draw the main text (fill)
-        painter.setPen(QPen(self._text_color, 1))
-        painter.drawText(rect, Qt.AlignCenter, text)
+        painter = QPainter(self)
+        painter.drawPixmap(self._text_rect.topLeft(), self._text_pixmap)
+    
+    def _outlined_text_pixmap(self, text):
+        """Get the outlined text as a transparent pixmap, rendering it on first use"""
+        if self._bold_font is None:
+            self._bold_font = QFont(self.font())
+            self._bold_font.setBold(True)
+            self._bold_metrics = QFontMetrics(self._bold_font)
+        
+        pixel_ratio = self.devicePixelRatioF()
+        key = (
+            text, self._bold_font.key(),
+            QColor(self._text_color).rgba(), QColor(self._outline_color).rgba(),
+            pixel_ratio
+        )
+        pixmap = self._pixmap_cache.get(key)
+        if pixmap is None:
+            padding = self.TEXT_PADDING
+            width = self._bold_metrics.horizontalAdvance(text) + 2 * padding
+            height = self._bold_metrics.height() + 2 * padding
+            
+            pixmap = QPixmap(round(width * pixel_ratio), round(height * pixel_ratio))
+            pixmap.setDevicePixelRatio(pixel_ratio)
+            pixmap.fill(Qt.transparent)
+            
+            # Shape the text once, stroke the outline, then fill the main text over it
+            path = QPainterPath()
+            path.addText(padding, padding + self._bold_metrics.ascent(), self._bold_font, text)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.strokePath(path, QPen(self._outline_color, 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+            painter.fillPath(path, QBrush(self._text_color))
+            painter.end()
+            
+            self._pixmap_cache[key] = pixmap
+        return pixmap
 
 
 class PerformanceBar(QWidget):
@@ -79,10 +150,11 @@ class PerformanceBar(QWidget):
         
         self._metric_name = metric_name
         self._rating = rating
+        self._restyle_pending = False
         self._setup_ui()
         
         # Connect to theme changes
-        theme_manager.theme_changed.connect(self._update_styling)
+        theme_manager.theme_changed.connect(self._schedule_restyle)
         
         # Apply initial styling
         self._update_styling()
@@ -95,65 +167,51 @@ class PerformanceBar(QWidget):
         
         # Metric label
         self._metric_label = QLabel(f"{self._metric_name}:")
+        self._metric_label.setObjectName("barLabel")
         self._metric_label.setFixedWidth(70)
         
         # Progress bar for visual representation
         self._progress_bar = OutlinedProgressBar()
+        self._progress_bar.setObjectName("performanceBar")
         self._progress_bar.setRange(0, 100)
         self._progress_bar.setTextVisible(True)
         self._progress_bar.setFormat(f"{self._rating}/5")
-        self._progress_bar.setValue(int((self._rating - 1) / 4 * 100))
+        self._progress_bar.setValue(int((self._rating - 1) * 25))
         
         layout.addWidget(self._metric_label)
         layout.addWidget(self._progress_bar)
     
+    @Slot()
+    def _schedule_restyle(self):
+        """Restyle once on the next event loop pass, however many theme changes arrive before it"""
+        if not self._restyle_pending:
+            self._restyle_pending = True
+            QTimer.singleShot(0, self._update_styling)
+    
     @Slot()
     def _update_styling(self):
-        """Update styling based on the current theme"""
-        current_theme = theme_manager.get_current_theme()
-        theme_data = theme_manager._themes[current_theme]
-        
-        # Get colors from theme
-        bg_color = theme_data["palette"]["background"].name()
-        bg_alt_color = theme_data["palette"]["background_alt"].name()
-        primary_color = theme_data["palette"]["primary"].name()
-        text_color = theme_data["palette"]["foreground"].name()
+        """Update the outlined text colors for the current theme"""
+        self._restyle_pending = False
         
-        # Basic styling with border
-        border_style = f"border: 1px solid {primary_color};"
-        height = "16px"
+        # The bar and label themselves are styled by the application stylesheet
+        palette = theme_manager.get_palette_colors()
         
         # Set colors for the progress bar text and outline
-        self._progress_bar.setTextColor(QColor(bg_color))
-        self._progress_bar.setOutlineColor(QColor(primary_color))
-        
-        # Apply styling
-        self._progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                {border_style}
-                border-radius: 4px;
-                background-color: {bg_alt_color};
-                text-align: center;
-                height: {height};
-                font-weight: bold;
-            }}
-            
-            QProgressBar::chunk {{
-                background-color: {primary_color};
-                border-radius: 4px;
-            }}
-        """)
-        
-        # Simple bold styling for metric label without background
-        self._metric_label.setStyleSheet(f"""
-            color: {text_color};
-            font-weight: bold;
-        """)
+        self._progress_bar.setTextColor(palette["background"])
+        self._progress_bar.setOutlineColor(palette["primary"])
+        
+        # Corners are filled with the color of the fragrance card the bar sits on
+        self._progress_bar.setBackgroundColor(palette["background_alt"])
+        self._progress_bar.update()
     
     def set_rating(self, rating):
         """Update the rating value"""
         self._rating = max(1, min(5, rating))
-        self._progress_bar.setValue(int((self._rating - 1) / 4 * 100))
+        
+        # Each rating point above 1 fills a quarter of the bar; skip setValue when the fill is unchanged
+        percent = int((self._rating - 1) * 25)
+        if percent != self._progress_bar.value():
+            self._progress_bar.setValue(percent)
         self._progress_bar.setFormat(f"{self._rating}/5")
     
     def get_rating(self):
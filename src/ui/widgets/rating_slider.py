@@ -17,7 +17,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from PySide6.QtWidgets import QWidget, QSlider, QLabel, QHBoxLayout, QVBoxLayout
-from PySide6.QtCore import Qt, Signal, Property, Slot
+from PySide6.QtCore import Qt, Signal, Property, Slot, QTimer
 
 from src.utils import theme_manager
 
@@ -40,10 +40,15 @@ class RatingSlider(QWidget):
         # Calculate the number of steps
         self._steps = int((max_value - min_value) / step) + 1
         
+        # Every valid value, indexed by slider position, so positions map back without float drift
+        self._pos_to_value = tuple(min_value + i * step for i in range(self._steps))
+        self._position = self._value_to_slider(self._value)
+        
+        self._restyle_pending = False
         self._setup_ui()
         
         # Connect to theme changes
-        theme_manager.theme_changed.connect(self._update_styling)
+        theme_manager.theme_changed.connect(self._schedule_restyle)
         
         # Apply initial styling
         self._update_styling()
@@ -63,7 +68,7 @@ class RatingSlider(QWidget):
         self._slider = QSlider(Qt.Horizontal)
         self._slider.setMinimum(0)
         self._slider.setMaximum(self._steps - 1)
-        self._slider.setValue(self._value_to_slider(self._value))
+        self._slider.setValue(self._position)
         self._slider.setTickPosition(QSlider.TicksBelow)
         self._slider.setTickInterval(4)  # Tick every 1.0 (4 steps of 0.25)
         
@@ -81,69 +86,39 @@ class RatingSlider(QWidget):
         # Connect signal
         self._slider.valueChanged.connect(self._on_slider_changed)
     
+    @Slot()
+    def _schedule_restyle(self):
+        """Restyle once on the next event loop pass, however many theme changes arrive before it"""
+        if not self._restyle_pending:
+            self._restyle_pending = True
+            QTimer.singleShot(0, self._update_styling)
+    
     @Slot()
     def _update_styling(self):
         """Update styling based on the current theme"""
-        current_theme = theme_manager.get_current_theme()
-        theme_data = theme_manager._themes[current_theme]
+        self._restyle_pending = False
         
-        # Get colors from theme
-        bg_color = theme_data["palette"]["background"].name()
-        bg_alt_color = theme_data["palette"]["background_alt"].name()
-        fg_color = theme_data["palette"]["foreground"].name()
-        primary_color = theme_data["palette"]["primary"].name()
-        
-        # Default styling
-        groove_height = "8px"
-        handle_width = "16px"
-        handle_margin = "-4px 0"
-        border = f"border: 1px solid {primary_color};"
-        label_style = ""
-        
-        # Apply styling to slider
-        self._slider.setStyleSheet(f"""
-            QSlider::groove:horizontal {{
-                height: {groove_height};
-                background-color: {bg_alt_color};
-                border-radius: 4px;
-                {border}
-            }}
-            
-            QSlider::handle:horizontal {{
-                background-color: {primary_color};
-                border: none;
-                width: {handle_width};
-                margin: {handle_margin};
-                border-radius: {int(float(handle_width.replace('px', '')) / 2)}px;
-                {label_style}
-            }}
-            
-            QSlider::sub-page:horizontal {{
-                background-color: {primary_color};
-                border-radius: 4px;
-            }}
-        """)
+        # The stylesheet is cached per theme; skip the re-parse when nothing changed
+        style = theme_manager.get_rating_slider_stylesheet()
+        if self._slider.styleSheet() != style:
+            self._slider.setStyleSheet(style)
     
     def _value_to_slider(self, value):
-        """Convert a rating value to slider position"""
-        # Constrain value to range
-        value = max(self._min_value, min(self._max_value, value))
+        """Convert a rating value to the nearest slider position"""
+        position = round((value - self._min_value) / self._step)
         
-        # Convert to slider position
-        position = int((value - self._min_value) / self._step)
-        return position
+        # Constrain position to range
+        return max(0, min(self._steps - 1, position))
     
     def _slider_to_value(self, position):
         """Convert slider position to rating value"""
-        value = position * self._step + self._min_value
-        return value
+        return self._pos_to_value[position]
     
     def _on_slider_changed(self, position):
         """Handle slider position changes"""
-        value = self._slider_to_value(position)
-        
-        if value != self._value:
-            self._value = value
+        if position != self._position:
+            self._position = position
+            self._value = self._pos_to_value[position]
             self._label.setText(f"{self._label_text}: {self._value:.2f}")
             self.valueChanged.emit(self._value)
     
@@ -153,11 +128,10 @@ class RatingSlider(QWidget):
     
     def setValue(self, value):
         """Set the current value"""
-        if value != self._value:
-            # Ensure value is within range and snapped to step increments
-            value = round((value - self._min_value) / self._step) * self._step + self._min_value
-            value = max(self._min_value, min(self._max_value, value))
-            
-            self._value = value
-            self._slider.setValue(self._value_to_slider(value))
+        # Snap to the nearest step; compare positions rather than floats
+        position = self._value_to_slider(value)
+        if position != self._position:
+            self._position = position
+            self._value = self._pos_to_value[position]
+            self._slider.setValue(position)
             self._label.setText(f"{self._label_text}: {self._value:.2f}") 
\ No newline at end of file
@@ -17,11 +17,9 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from PySide6.QtWidgets import QWidget, QLabel, QProgressBar, QHBoxLayout, QVBoxLayout
-from PySide6.QtCore import Qt, QSize, Slot
+from PySide6.QtCore import Qt, QSize, QElapsedTimer, QTimer, Slot
 from PySide6.QtGui import QColor
 
-from src.utils import theme_manager
-
 
 class SeasonRatingBar(QWidget):
     """
@@ -33,9 +31,6 @@ class SeasonRatingBar(QWidget):
         self._season = season
         self._rating = rating
         self._setup_ui()
-        
-        # Connect to theme changes
-        theme_manager.theme_changed.connect(self._update_styling)
     
     def _setup_ui(self):
         """Set up the user interface"""
@@ -45,100 +40,40 @@ class SeasonRatingBar(QWidget):
         
         # Season label
         self._season_label = QLabel(f"{self._season}:")
+        self._season_label.setObjectName("barLabel")
         self._season_label.setFixedWidth(60)
         
         # Progress bar for visual representation
+        # Styled per season by the application stylesheet through its object name
         self._progress_bar = QProgressBar()
+        self._progress_bar.setObjectName(f"seasonBar_{self._season}")
         self._progress_bar.setRange(0, 100)
         self._progress_bar.setTextVisible(True)
         self._progress_bar.setFormat(f"{self._rating:.2f}")
-        self._progress_bar.setValue(int((self._rating - 1) / 4 * 100))
+        self._progress_bar.setValue(int((self._rating - 1) * 25))
         
         layout.addWidget(self._season_label)
         layout.addWidget(self._progress_bar)
-        
-        # Set color based on season
-        self._set_season_color()
-    
-    def _set_season_color(self):
-        """Set color of the progress bar based on season"""
-        # Define default colors for each season
-        standard_season_colors = {
-            "Winter": "#0072B2",
-            "Spring": "#009E73",
-            "Summer": "#E65849",
-            "Fall": "#D55E00"
-        }
-        
-        # Get current theme
-        current_theme = theme_manager.get_current_theme()
-        theme_data = theme_manager._themes[current_theme]
-        
-        # Check if the theme has special season colors
-        if "seasons" in theme_data:
-            # Use theme-specific season colors
-            self._season_color = theme_data["seasons"].get(self._season, theme_data["palette"]["primary"].name())
-        else:
-            # Use standard season colors
-            self._season_color = standard_season_colors.get(self._season, "#9c88ff")  # Default purple if not found
-        
-        # Apply styling (background will be updated by theme changes)
-        self._update_styling()
-    
-    @Slot()
-    def _update_styling(self):
-        """Update styling based on current theme, while preserving seasonal colors"""
-        current_theme = theme_manager.get_current_theme()
-        theme_data = theme_manager._themes[current_theme]
-        
-        # Get colors from theme for background
-        bg_color = theme_data["palette"]["background"].name()
-        bg_alt_color = theme_data["palette"]["background_alt"].name()
-        text_color = theme_data["palette"]["foreground"].name()
-        
-        # Enhance styling for different themes
-        border_style = f"border: 1px solid {self._season_color};"  # Default border for all themes
-        height = "16px"
-        bar_text_color = text_color
-        font_weight = "bold"  # Make all season labels bold
-        
-        # Apply styling with seasonal color for the bar
-        chunk_style = f"""
-        QProgressBar {{
-            {border_style}
-            border-radius: 4px;
-            background-color: {bg_alt_color};
-            text-align: center;
-            color: {bar_text_color};
-            height: {height};
-            font-weight: {font_weight};
-        }}
-        
-        QProgressBar::chunk {{
-            background-color: {self._season_color};
-            border-radius: 4px;
-        }}
-        """
-        
-        self._progress_bar.setStyleSheet(chunk_style)
-        
-        # Simple bold styling for season labels without background
-        self._season_label.setStyleSheet(f"""
-            color: {text_color};
-            font-weight: bold;
-        """)
     
     def set_rating(self, rating):
         """Update the rating value"""
         self._rating = max(1.0, min(5.0, rating))
-        self._progress_bar.setValue(int((self._rating - 1) / 4 * 100))
+        
+        # Each rating point above 1 fills a quarter of the bar; skip setValue when the fill is unchanged
+        percent = int((self._rating - 1) * 25)
+        if percent != self._progress_bar.value():
+            self._progress_bar.setValue(percent)
         self._progress_bar.setFormat(f"{self._rating:.2f}")
     
     def set_season(self, season):
         """Update the season"""
         self._season = season
         self._season_label.setText(f"{self._season}:")
-        self._set_season_color()
+        
+        # Re-polish so the new object name picks up that season's rules
+        self._progress_bar.setObjectName(f"seasonBar_{self._season}")
+        self._progress_bar.style().unpolish(self._progress_bar)
+        self._progress_bar.style().polish(self._progress_bar)
     
     def get_rating(self):
         """Get the current rating"""
@@ -149,9 +84,19 @@ class SeasonalityPanel(QWidget):
     """
     Panel containing rating bars for all four seasons
     """
+    # Minimum time between applied rating updates, about one frame at 60 fps
+    MIN_UPDATE_INTERVAL_MS = 16
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
+        # Ratings set faster than once per frame are held here and applied by the flush timer
+        self._pending_ratings = None
+        self._last_update = QElapsedTimer()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_pending_ratings)
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -172,11 +117,37 @@ class SeasonalityPanel(QWidget):
         layout.addWidget(self._fall_bar)
     
     def set_ratings(self, winter, spring, summer, fall):
-        """Update all season ratings at once"""
-        self._winter_bar.set_rating(winter)
-        self._spring_bar.set_rating(spring)
-        self._summer_bar.set_rating(summer)
-        self._fall_bar.set_rating(fall)
+        """Update all season ratings at once, applying at most one update per frame"""
+        self._pending_ratings = (winter, spring, summer, fall)
+        
+        if self._last_update.isValid():
+            remaining = self.MIN_UPDATE_INTERVAL_MS - self._last_update.elapsed()
+            if remaining > 0:
+                # Only the latest ratings are applied once the interval has passed
+                if not self._flush_timer.isActive():
+                    self._flush_timer.start(remaining)
+                return
+        
+        self._flush_pending_ratings()
+    
+    @Slot()
+    def _flush_pending_ratings(self):
+        """Apply the most recently requested ratings"""
+        if self._pending_ratings is None:
+            return
+        winter, spring, summer, fall = self._pending_ratings
+        self._pending_ratings = None
+        self._last_update.start()
+        
+        # QProgressBar.setValue can repaint immediately; hold paints so the four bars redraw together
+        self.setUpdatesEnabled(False)
+        try:
+            self._winter_bar.set_rating(winter)
+            self._spring_bar.set_rating(spring)
+            self._summer_bar.set_rating(summer)
+            self._fall_bar.set_rating(fall)
+        finally:
+            self.setUpdatesEnabled(True)
     
     def sizeHint(self):
         """Suggest a reasonable size for the widget"""
@@ -17,5 +17,5 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from .setup import setup_application
-from .export import export_collection_to_csv
+from .export import export_collection_to_csv, EXPORT_FIELDS
 from .theme_manager import theme_manager 
\ No newline at end of file
@@ -17,7 +17,74 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import csv
+import logging
 import os
+from operator import methodcaller
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+class ExportField(NamedTuple):
+    """A single exportable fragrance field"""
+    key: str
+    label: str
+    yes_no: bool = False  # Written as Yes/No rather than the raw value
+
+
+# Every exportable field, in column order. Shared by the export dialog and the CSV writer.
+EXPORT_FIELDS = (
+    ExportField('house', 'House'),
+    ExportField('name', 'Name'),
+    ExportField('size_oz', 'Size (oz)'),
+    ExportField('size_ml', 'Size (ml)'),
+    ExportField('concentration', 'Concentration'),
+    ExportField('top_notes', 'Top Notes'),
+    ExportField('middle_notes', 'Middle Notes'),
+    ExportField('base_notes', 'Base Notes'),
+    ExportField('winter_rating', 'Winter Rating'),
+    ExportField('spring_rating', 'Spring Rating'),
+    ExportField('summer_rating', 'Summer Rating'),
+    ExportField('fall_rating', 'Fall Rating'),
+    ExportField('longevity', 'Longevity'),
+    ExportField('sillage', 'Sillage'),
+    ExportField('is_clone', 'Is Clone', yes_no=True),
+    ExportField('original_fragrance', 'Original Fragrance'),
+    ExportField('is_favorite', 'Is Favorite', yes_no=True),
+)
+
+# Keys of every field that can be exported
+ALL_FIELD_KEYS = frozenset(field.key for field in EXPORT_FIELDS)
+
+# CSV text for a boolean field, indexed by the field's truth value
+_YES_NO = ('No', 'Yes')
+
+# Write buffer size for exports, so large collections reach the disk in few writes
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+
+def _column_values(field, fragrances):
+    """
+    Lazily read one field's CSV values for every fragrance
+    
+    Args:
+        field: ExportField to read
+        fragrances: List of Fragrance objects
+    
+    Returns:
+        iterator: The value to write for each fragrance, in order
+    """
+    # Fragrance exposes a getter named after each field key; map and methodcaller
+    # keep the per-value loop in C
+    values = map(methodcaller(field.key), fragrances)
+    if field.yes_no:
+        return map(_YES_NO.__getitem__, map(bool, values))
+    return values
+
+
+def _build_rows(fragrances, fields):
+    """Lazily zip the column values of each fragrance into CSV rows"""
+    return zip(*(_column_values(field, fragrances) for field in fields))
 
 
 def export_collection_to_csv(fragrances, filepath, selected_fields=None):
@@ -27,7 +94,7 @@ def export_collection_to_csv(fragrances, filepath, selected_fields=None):
     Args:
         fragrances: List of Fragrance objects
         filepath: Path to save the CSV file
-        selected_fields: Dictionary of field names to boolean values indicating which fields to export
+        selected_fields: Set of field keys to export (all fields if None)
     
     Returns:
         bool: True if successful, False otherwise
@@ -35,98 +102,30 @@ def export_collection_to_csv(fragrances, filepath, selected_fields=None):
     if not fragrances:
         return False
     
+    if selected_fields is None:
+        selected_fields = ALL_FIELD_KEYS
+    
+    # Write next to the target and swap it in at the end, so a failed export never leaves a partial file
+    temp_path = filepath + '.tmp'
+    
     try:
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+        with open(temp_path, 'w', newline='', encoding='utf-8', buffering=_EXPORT_BUFFER_SIZE) as csvfile:
             # Determine which fields to include
-            field_names = []
-            
-            # Add default fields
-            if selected_fields.get('house', True):
-                field_names.append('House')
-            if selected_fields.get('name', True):
-                field_names.append('Name')
-                
-            # Add selected fields
-            if selected_fields.get('size_oz', False):
-                field_names.append('Size (oz)')
-            if selected_fields.get('size_ml', False):
-                field_names.append('Size (ml)')
-            if selected_fields.get('concentration', False):
-                field_names.append('Concentration')
-            if selected_fields.get('top_notes', False):
-                field_names.append('Top Notes')
-            if selected_fields.get('middle_notes', False):
-                field_names.append('Middle Notes')
-            if selected_fields.get('base_notes', False):
-                field_names.append('Base Notes')
-            if selected_fields.get('winter_rating', False):
-                field_names.append('Winter Rating')
-            if selected_fields.get('spring_rating', False):
-                field_names.append('Spring Rating')
-            if selected_fields.get('summer_rating', False):
-                field_names.append('Summer Rating')
-            if selected_fields.get('fall_rating', False):
-                field_names.append('Fall Rating')
-            if selected_fields.get('longevity', False):
-                field_names.append('Longevity')
-            if selected_fields.get('sillage', False):
-                field_names.append('Sillage')
-            if selected_fields.get('is_clone', False):
-                field_names.append('Is Clone')
-            if selected_fields.get('original_fragrance', False):
-                field_names.append('Original Fragrance')
-            if selected_fields.get('is_favorite', False):
-                field_names.append('Is Favorite')
+            fields = [field for field in EXPORT_FIELDS if field.key in selected_fields]
             
             # Create CSV writer
-            writer = csv.DictWriter(csvfile, fieldnames=field_names)
-            writer.writeheader()
+            writer = csv.writer(csvfile)
+            writer.writerow([field.label for field in fields])
             
-            # Write each fragrance
-            for fragrance in fragrances:
-                row = {}
-                
-                # Add default fields
-                if 'House' in field_names:
-                    row['House'] = fragrance.house()
-                if 'Name' in field_names:
-                    row['Name'] = fragrance.name()
-                
-                # Add selected fields
-                if 'Size (oz)' in field_names:
-                    row['Size (oz)'] = fragrance.size_oz()
-                if 'Size (ml)' in field_names:
-                    row['Size (ml)'] = fragrance.size_ml()
-                if 'Concentration' in field_names:
-                    row['Concentration'] = fragrance.concentration()
-                if 'Top Notes' in field_names:
-                    row['Top Notes'] = fragrance.top_notes()
-                if 'Middle Notes' in field_names:
-                    row['Middle Notes'] = fragrance.middle_notes()
-                if 'Base Notes' in field_names:
-                    row['Base Notes'] = fragrance.base_notes()
-                if 'Winter Rating' in field_names:
-                    row['Winter Rating'] = fragrance.winter_rating()
-                if 'Spring Rating' in field_names:
-                    row['Spring Rating'] = fragrance.spring_rating()
-                if 'Summer Rating' in field_names:
-                    row['Summer Rating'] = fragrance.summer_rating()
-                if 'Fall Rating' in field_names:
-                    row['Fall Rating'] = fragrance.fall_rating()
-                if 'Longevity' in field_names:
-                    row['Longevity'] = fragrance.longevity()
-                if 'Sillage' in field_names:
-                    row['Sillage'] = fragrance.sillage()
-                if 'Is Clone' in field_names:
-                    row['Is Clone'] = 'Yes' if fragrance.is_clone() else 'No'
-                if 'Original Fragrance' in field_names:
-                    row['Original Fragrance'] = fragrance.original_fragrance()
-                if 'Is Favorite' in field_names:
-                    row['Is Favorite'] = 'Yes' if fragrance.is_favorite() else 'No'
-                
-                writer.writerow(row)
+            # Write each fragrance, letting the writer drive the row loop
+            writer.writerows(_build_rows(fragrances, fields))
         
+        os.replace(temp_path, filepath)
         return True
-    except Exception as e:
-        print(f"Error exporting CSV: {e}")
-        return False 
\ No newline at end of file
+    except Exception:
+        logger.exception("CSV export to %s failed", filepath)
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        return False
\ No newline at end of file
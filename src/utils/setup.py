@@ -18,9 +18,246 @@
 
 from PySide6.QtGui import QFont, QPalette, QColor
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
-from src.utils.theme_manager import theme_manager
+from src.utils.theme_manager import theme_manager, minify_css, THEME_PROPERTY
+
+# Application-wide font
+_APP_FONT_FAMILY = "Inter"
+_APP_FONT_SIZE = 10
+
+
+# Stylesheet source for the elegant theme. Plain colors come from the palette; only what
+# QPalette cannot express (borders, radii, padding, states) is here, and colors the palette
+# already holds are referenced by role
+_ELEGANT_STYLESHEET_SOURCE = """
+/* QToolBar */
+QToolBar {
+    border: none;
+    padding: 4px;
+    spacing: 4px;
+    background-color: palette(base);
+}
+
+/* QPushButton */
+QPushButton {
+    background-color: palette(base);
+    border: 1px solid #2e2e35;
+    padding: 8px 16px;
+    border-radius: 6px;
+}
+
+QPushButton:hover {
+    background-color: #2a2a32;
+    border: 1px solid palette(highlight);
+}
+
+QPushButton:pressed {
+    background-color: palette(highlight);
+    color: white;
+}
+
+/* QLineEdit */
+QLineEdit {
+    border: 1px solid #2e2e35;
+    padding: 8px;
+    border-radius: 6px;
+}
+
+QLineEdit:focus {
+    border: 1px solid palette(highlight);
+}
+
+/* QComboBox */
+QComboBox {
+    background-color: palette(base);
+    border: 1px solid #2e2e35;
+    padding: 8px;
+    border-radius: 6px;
+}
+
+QComboBox::drop-down {
+    border: none;
+    width: 24px;
+}
+
+QComboBox::down-arrow {
+    width: 12px;
+    height: 12px;
+}
+
+QComboBox QAbstractItemView {
+    border: 1px solid #2e2e35;
+    border-radius: 6px;
+}
+
+/* QTabWidget */
+QTabWidget::pane {
+    border: 1px solid #2e2e35;
+    background-color: palette(window);
+    top: -1px;
+}
+
+QTabBar::tab {
+    background-color: palette(base);
+    border: 1px solid #2e2e35;
+    padding: 8px 16px;
+    border-top-left-radius: 6px;
+    border-top-right-radius: 6px;
+}
+
+QTabBar::tab:selected {
+    background-color: palette(window);
+    border-bottom-color: palette(window);
+}
+
+QTabBar::tab:hover {
+    background-color: #2a2a32;
+}
+
+/* QScrollBar */
+QScrollBar:vertical, QScrollBar:horizontal {
+    border: none;
+    background-color: palette(base);
+    margin: 0px;
+}
+
+QScrollBar:vertical {
+    width: 10px;
+}
+
+QScrollBar:horizontal {
+    height: 10px;
+}
+
+QScrollBar::handle:vertical, QScrollBar::handle:horizontal {
+    background-color: #2e2e35;
+    border-radius: 5px;
+}
+
+QScrollBar::handle:vertical {
+    min-height: 30px;
+}
+
+QScrollBar::handle:horizontal {
+    min-width: 30px;
+}
+
+QScrollBar::handle:vertical:hover, QScrollBar::handle:horizontal:hover {
+    background-color: #3e3e45;
+}
+
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+    height: 0px;
+}
+
+QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+    width: 0px;
+}
+
+/* QTableView */
+QTableView {
+    gridline-color: #2e2e35;
+}
+
+QTableView::item {
+    padding: 8px;
+}
+
+QHeaderView::section {
+    background-color: #2a2a32;
+    padding: 6px;
+    border: none;
+    font-weight: bold;
+}
+
+/* QSlider */
+QSlider::groove:horizontal {
+    height: 8px;
+    background-color: palette(base);
+    border-radius: 4px;
+    border: 1px solid palette(highlight);
+}
+
+QSlider::handle:horizontal {
+    background-color: palette(highlight);
+    border: none;
+    width: 16px;
+    margin: -4px 0;
+    border-radius: 8px;
+}
+
+QSlider::sub-page:horizontal {
+    background-color: palette(highlight);
+    border-radius: 4px;
+}
+
+/* QGroupBox */
+QGroupBox {
+    font-weight: bold;
+    border: 1px solid #2e2e35;
+    border-radius: 6px;
+    margin-top: 16px;
+    padding-top: 16px;
+}
+
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px;
+}
+
+/* QCheckBox */
+QCheckBox::indicator {
+    width: 18px;
+    height: 18px;
+    border-radius: 3px;
+    border: 1px solid #2e2e35;
+}
+
+QCheckBox::indicator:checked {
+    background-color: palette(highlight);
+}
+
+QCheckBox::indicator:unchecked {
+    background-color: palette(base);
+}
+
+/* QRadioButton */
+QRadioButton::indicator {
+    width: 18px;
+    height: 18px;
+    border-radius: 9px;
+    border: 1px solid #2e2e35;
+}
+
+QRadioButton::indicator:checked {
+    background-color: palette(highlight);
+}
+
+QRadioButton::indicator:unchecked {
+    background-color: palette(base);
+}
+
+/* QProgressBar */
+QProgressBar {
+    border: none;
+    border-radius: 4px;
+    background-color: palette(base);
+    text-align: center;
+    color: white;
+}
+
+QProgressBar::chunk {
+    background-color: palette(highlight);
+    border-radius: 4px;
+}
+"""
+
+# Minified stylesheet and palette for the elegant theme, built on first use so startup
+# through setup_application never pays for them
+_elegant_stylesheet = None
+_elegant_palette = None
 
 
 def setup_application(app):
@@ -30,316 +267,102 @@ def setup_application(app):
     Args:
         app: QApplication instance
     """
+    # The palette and style must be installed on the live application before any widget
+    # exists, or widgets start from QStyle::standardPalette() and are resolved a second time
+    assert QApplication.instance() is app, "setup_application needs the running QApplication"
+    
     # Set application name and organization
     app.setApplicationName("Fragrance Collection Organizer")
     app.setOrganizationName("FragranceOrg")
     
-    # Set global font
-    font = QFont("Inter", 10)
-    app.setFont(font)
+    # Set global font, unless already set; every change is broadcast to all widgets
+    current_font = app.font()
+    if current_font.family() != _APP_FONT_FAMILY or current_font.pointSize() != _APP_FONT_SIZE:
+        app.setFont(QFont(_APP_FONT_FAMILY, _APP_FONT_SIZE))
     
-    # Apply theme
+    # Apply theme: palette first, then stylesheet, after the font so nothing is polished twice
     theme_manager.apply_theme(app)
     
     return app
 
 
-def apply_elegant_theme(app):
-    """
-    Apply an elegant theme to the application
-    
-    Args:
-        app: QApplication instance
-    """
-    # Create custom palette
-    palette = QPalette()
-    
-    # Define colors
+def _build_elegant_palette():
+    """Build the QPalette for the elegant theme"""
+    # Elegant theme colors
     background = QColor(22, 22, 25)
     background_alt = QColor(30, 30, 35)
     foreground = QColor(230, 230, 235)
     primary = QColor(156, 136, 255)
-    secondary = QColor(219, 166, 130)
-    
-    # Dark subtle background
-    palette.setColor(QPalette.Window, background)
-    palette.setColor(QPalette.WindowText, foreground)
-    
-    # Text colors
-    palette.setColor(QPalette.Text, foreground)
-    palette.setColor(QPalette.BrightText, Qt.white)
-    
-    # Button styling
-    palette.setColor(QPalette.Button, background_alt)
-    palette.setColor(QPalette.ButtonText, foreground)
-    
-    # Highlight colors
-    palette.setColor(QPalette.Highlight, primary)
-    palette.setColor(QPalette.HighlightedText, Qt.white)
+    disabled = QColor(127, 127, 127)
+    
+    # Role, color pairs for the active and inactive states
+    roles = (
+        # Dark subtle background
+        (QPalette.Window, background),
+        (QPalette.WindowText, foreground),
+        
+        # Text colors
+        (QPalette.Text, foreground),
+        (QPalette.BrightText, Qt.white),
+        
+        # Button styling
+        (QPalette.Button, background_alt),
+        (QPalette.ButtonText, foreground),
+        
+        # Highlight colors
+        (QPalette.Highlight, primary),
+        (QPalette.HighlightedText, Qt.white),
+        
+        # Base colors
+        (QPalette.Base, background_alt),
+        (QPalette.AlternateBase, background),
+        
+        # Tooltip
+        (QPalette.ToolTipBase, primary),
+        (QPalette.ToolTipText, Qt.white),
+    )
     
     # Disabled state colors
-    palette.setColor(QPalette.Disabled, QPalette.WindowText, QColor(127, 127, 127))
-    palette.setColor(QPalette.Disabled, QPalette.Text, QColor(127, 127, 127))
-    palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(127, 127, 127))
-    
-    # Base colors
-    palette.setColor(QPalette.Base, background_alt)
-    palette.setColor(QPalette.AlternateBase, background)
-    
-    # Tooltip
-    palette.setColor(QPalette.ToolTipBase, primary)
-    palette.setColor(QPalette.ToolTipText, Qt.white)
-    
-    # Apply palette
-    app.setPalette(palette)
-    
-    # Set stylesheet for more control over UI elements
-    stylesheet = """
-    /* Global */
-    * {
-        border-radius: 4px;
-    }
-    
-    /* QWidget */
-    QWidget {
-        background-color: #16161a;
-        color: #e6e6eb;
-    }
-    
-    /* QToolBar */
-    QToolBar {
-        border: none;
-        padding: 4px;
-        spacing: 4px;
-        background-color: #1e1e23;
-    }
-    
-    /* QPushButton */
-    QPushButton {
-        background-color: #1e1e23;
-        color: #e6e6eb;
-        border: 1px solid #2e2e35;
-        padding: 8px 16px;
-        border-radius: 6px;
-    }
-    
-    QPushButton:hover {
-        background-color: #2a2a32;
-        border: 1px solid #9c88ff;
-    }
-    
-    QPushButton:pressed {
-        background-color: #9c88ff;
-        color: white;
-    }
-    
-    /* QLineEdit */
-    QLineEdit {
-        background-color: #1e1e23;
-        border: 1px solid #2e2e35;
-        padding: 8px;
-        border-radius: 6px;
-    }
-    
-    QLineEdit:focus {
-        border: 1px solid #9c88ff;
-    }
-    
-    /* QComboBox */
-    QComboBox {
-        background-color: #1e1e23;
-        border: 1px solid #2e2e35;
-        padding: 8px;
-        border-radius: 6px;
-    }
-    
-    QComboBox::drop-down {
-        border: none;
-        width: 24px;
-    }
-    
-    QComboBox::down-arrow {
-        width: 12px;
-        height: 12px;
-    }
-    
-    QComboBox QAbstractItemView {
-        background-color: #1e1e23;
-        border: 1px solid #2e2e35;
-        border-radius: 6px;
-        selection-background-color: #9c88ff;
-    }
-    
-    /* QTabWidget */
-    QTabWidget::pane {
-        border: 1px solid #2e2e35;
-        background-color: #16161a;
-        top: -1px;
-    }
-    
-    QTabBar::tab {
-        background-color: #1e1e23;
-        border: 1px solid #2e2e35;
-        padding: 8px 16px;
-        border-top-left-radius: 6px;
-        border-top-right-radius: 6px;
-    }
-    
-    QTabBar::tab:selected {
-        background-color: #16161a;
-        border-bottom-color: #16161a;
-    }
-    
-    QTabBar::tab:hover {
-        background-color: #2a2a32;
-    }
-    
-    /* QScrollBar */
-    QScrollBar:vertical {
-        border: none;
-        background-color: #1e1e23;
-        width: 10px;
-        margin: 0px;
-    }
-    
-    QScrollBar::handle:vertical {
-        background-color: #2e2e35;
-        border-radius: 5px;
-        min-height: 30px;
-    }
-    
-    QScrollBar::handle:vertical:hover {
-        background-color: #3e3e45;
-    }
-    
-    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-        height: 0px;
-    }
-    
-    QScrollBar:horizontal {
-        border: none;
-        background-color: #1e1e23;
-        height: 10px;
-        margin: 0px;
-    }
+    disabled_roles = (QPalette.WindowText, QPalette.Text, QPalette.ButtonText)
     
-    QScrollBar::handle:horizontal {
-        background-color: #2e2e35;
-        border-radius: 5px;
-        min-width: 30px;
-    }
-    
-    QScrollBar::handle:horizontal:hover {
-        background-color: #3e3e45;
-    }
-    
-    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-        width: 0px;
-    }
-    
-    /* QTableView */
-    QTableView {
-        gridline-color: #2e2e35;
-        background-color: #1e1e23;
-        selection-background-color: #9c88ff;
-        selection-color: white;
-        alternate-background-color: #16161a;
-    }
-    
-    QTableView::item {
-        padding: 8px;
-    }
-    
-    QHeaderView::section {
-        background-color: #2a2a32;
-        padding: 6px;
-        border: none;
-        font-weight: bold;
-    }
-    
-    /* QSlider */
-    QSlider::groove:horizontal {
-        height: 8px;
-        background-color: #1e1e23;
-        border-radius: 4px;
-        border: 1px solid #9c88ff;
-    }
-    
-    QSlider::handle:horizontal {
-        background-color: #9c88ff;
-        border: none;
-        width: 16px;
-        margin: -4px 0;
-        border-radius: 8px;
-    }
-    
-    QSlider::sub-page:horizontal {
-        background-color: #9c88ff;
-        border-radius: 4px;
-    }
-    
-    /* QGroupBox */
-    QGroupBox {
-        font-weight: bold;
-        border: 1px solid #2e2e35;
-        border-radius: 6px;
-        margin-top: 16px;
-        padding-top: 16px;
-    }
-    
-    QGroupBox::title {
-        subcontrol-origin: margin;
-        left: 10px;
-        padding: 0 5px;
-    }
-    
-    /* QCheckBox */
-    QCheckBox::indicator {
-        width: 18px;
-        height: 18px;
-        border-radius: 3px;
-        border: 1px solid #2e2e35;
-    }
-    
-    QCheckBox::indicator:checked {
-        background-color: #9c88ff;
-        image: url(:/icons/checkmark.png);
-    }
-    
-    QCheckBox::indicator:unchecked {
-        background-color: #1e1e23;
-    }
+    # Create custom palette
+    palette = QPalette()
+    for role, color in roles:
+        palette.setColor(role, color)
+    for role in disabled_roles:
+        palette.setColor(QPalette.Disabled, role, disabled)
     
-    /* QRadioButton */
-    QRadioButton::indicator {
-        width: 18px;
-        height: 18px;
-        border-radius: 9px;
-        border: 1px solid #2e2e35;
-    }
+    return palette
+
+
+def _install_elegant_stylesheet(app):
+    """Install the elegant stylesheet, unless another theme was applied since it was scheduled"""
+    if app.property(THEME_PROPERTY) == "elegant":
+        app.setStyleSheet(_elegant_stylesheet)
+
+
+def apply_elegant_theme(app):
+    """
+    Apply an elegant theme to the application
     
-    QRadioButton::indicator:checked {
-        background-color: #9c88ff;
-        image: url(:/icons/radiomark.png);
-    }
+    Args:
+        app: QApplication instance
+    """
+    # Re-installing the same palette and stylesheet would re-polish every widget for nothing
+    if app.property(THEME_PROPERTY) == "elegant":
+        return app
     
-    QRadioButton::indicator:unchecked {
-        background-color: #1e1e23;
-    }
+    global _elegant_stylesheet, _elegant_palette
+    if _elegant_palette is None:
+        _elegant_stylesheet = minify_css(_ELEGANT_STYLESHEET_SOURCE)
+        _elegant_palette = _build_elegant_palette()
     
-    /* QProgressBar */
-    QProgressBar {
-        border: none;
-        border-radius: 4px;
-        background-color: #1e1e23;
-        text-align: center;
-        color: white;
-    }
+    # Apply palette
+    app.setPalette(_elegant_palette)
     
-    QProgressBar::chunk {
-        background-color: #9c88ff;
-        border-radius: 4px;
-    }
-    """
+    # Set stylesheet for more control over UI elements on the next event loop pass, so
+    # windows first show with the palette instead of waiting for the full polish
+    QTimer.singleShot(0, lambda: _install_elegant_stylesheet(app))
+    app.setProperty(THEME_PROPERTY, "elegant")
     
-    app.setStyleSheet(stylesheet) 
\ No newline at end of file
+    return app
\ No newline at end of file
@@ -16,9 +16,602 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from PySide6.QtGui import QPalette, QColor, QFont
+import re
+
+from PySide6.QtGui import QPalette, QColor
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt, QObject, Signal, QSettings
+from PySide6.QtCore import Qt, QObject, Signal, Slot, QSettings, QTimer
+
+# Application property naming the theme currently installed on it
+THEME_PROPERTY = "_fco_theme"
+
+# Patterns for minify_css(): comments, whitespace runs, and spaces around punctuation
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_WHITESPACE_RE = re.compile(r'\s+')
+_CSS_PUNCTUATION_RE = re.compile(r'\s*([{}:;,])\s*')
+
+
+def minify_css(stylesheet):
+    """
+    Strip comments and redundant whitespace from a stylesheet
+    
+    Args:
+        stylesheet: Qt stylesheet source
+    
+    Returns:
+        str: Equivalent stylesheet with less text for Qt's parser to scan
+    """
+    stylesheet = _CSS_COMMENT_RE.sub('', stylesheet)
+    stylesheet = _CSS_WHITESPACE_RE.sub(' ', stylesheet)
+    return _CSS_PUNCTUATION_RE.sub(r'\1', stylesheet).strip()
+
+
+# Stylesheet for dialogs that follow the current theme, filled from the theme palette
+_DIALOG_STYLESHEET_TEMPLATE = """
+    QDialog {{
+        background-color: {background};
+        color: {foreground};
+    }}
+    
+    QLabel {{
+        color: {foreground};
+    }}
+    
+    QLabel#sectionHeader {{
+        font-weight: bold;
+        font-size: 14px;
+        color: {primary};
+        border-bottom: 1px solid {primary};
+        padding-bottom: 4px;
+    }}
+    
+    QTextEdit {{
+        background-color: {background_alt};
+        color: {foreground};
+        border: 1px solid {primary};
+        border-radius: 3px;
+        padding: 4px;
+    }}
+    
+    QScrollArea {{
+        border: none;
+        background-color: transparent;
+    }}
+    
+    QPushButton {{
+        background-color: {primary};
+        color: white;
+        border: none;
+        padding: 5px 15px;
+        border-radius: 3px;
+    }}
+    
+    QPushButton:hover {{
+        background-color: {secondary};
+    }}
+"""
+
+# Stylesheet for the main window's filter panel toggle button
+_TOGGLE_BUTTON_STYLESHEET_TEMPLATE = """
+    QToolButton#toggleFilterButton {{
+        background-color: {background_alt};
+        color: {foreground};
+        border: 1px solid {primary};
+        border-top-right-radius: 12px;
+        border-bottom-right-radius: 12px;
+        border-left: none;
+        font-weight: bold;
+        font-size: 12px;
+    }}
+    
+    QToolButton#toggleFilterButton:hover {{
+        background-color: {primary};
+        color: white;
+    }}
+"""
+
+# Stylesheet for splitter handles
+_SPLITTER_STYLESHEET_TEMPLATE = """
+    QSplitter::handle {{
+        background-color: {background_alt};
+    }}
+"""
+
+# Stylesheet for the seasonal rating sliders
+_RATING_SLIDER_STYLESHEET_TEMPLATE = """
+    QSlider::groove:horizontal {{
+        height: 8px;
+        background-color: {background_alt};
+        border-radius: 4px;
+        border: 1px solid {primary};
+    }}
+    
+    QSlider::handle:horizontal {{
+        background-color: {primary};
+        border: none;
+        width: 16px;
+        margin: -4px 0;
+        border-radius: 8px;
+    }}
+    
+    QSlider::sub-page:horizontal {{
+        background-color: {primary};
+        border-radius: 4px;
+    }}
+"""
+
+# Default bar colors for each season, used by themes without their own "seasons" colors
+_SEASON_COLORS = {
+    "Winter": "#0072B2",
+    "Spring": "#009E73",
+    "Summer": "#E65849",
+    "Fall": "#D55E00"
+}
+
+# Application-wide rules for the longevity/sillage bars and the labels next to rating bars
+_RATING_BARS_STYLESHEET_TEMPLATE = """
+    QProgressBar#performanceBar {{
+        border: 1px solid {primary};
+        border-radius: 4px;
+        background-color: {background_alt};
+        text-align: center;
+        height: 16px;
+        font-weight: bold;
+    }}
+    
+    QProgressBar#performanceBar::chunk {{
+        background-color: {primary};
+        border-radius: 4px;
+    }}
+    
+    QLabel#barLabel {{
+        color: {foreground};
+        font-weight: bold;
+    }}
+"""
+
+# Rules for one seasonal rating bar, repeated for every season
+_SEASON_BAR_STYLESHEET_TEMPLATE = """
+    QProgressBar#seasonBar_{season} {{
+        border: 1px solid {season_color};
+        border-radius: 4px;
+        background-color: {background_alt};
+        text-align: center;
+        color: {foreground};
+        height: 16px;
+        font-weight: bold;
+    }}
+    
+    QProgressBar#seasonBar_{season}::chunk {{
+        background-color: {season_color};
+        border-radius: 4px;
+    }}
+"""
+
+
+# Application stylesheet shared by all themes, filled from the theme's stylesheet colors
+_APP_STYLESHEET_TEMPLATE = """
+    /* QWidget */
+    QWidget {{
+        background-color: {window};
+        color: {foreground};
+    }}
+    
+    /* QToolBar */
+    QToolBar {{
+        border: none;
+        padding: 4px;
+        spacing: 4px;
+        background-color: {background_alt};
+        border-radius: 4px;
+    }}
+    
+    /* QPushButton */
+    QPushButton {{
+        background-color: {background_alt};
+        color: {foreground};
+        border: 1px solid {border};
+        padding: 8px 16px;
+        border-radius: 6px;
+    }}
+    
+    QPushButton:hover {{
+        background-color: {hover};
+        border: 1px solid {primary};
+    }}
+    
+    QPushButton:pressed {{
+        background-color: {primary};
+        color: {selected_text};
+    }}
+    
+    /* QLineEdit */
+    QLineEdit {{
+        background-color: {input};
+        border: 1px solid {border};
+        padding: 8px;
+        border-radius: 6px;
+    }}
+    
+    QLineEdit:focus {{
+        border: 1px solid {primary};
+    }}
+    
+    /* QComboBox */
+    QComboBox {{
+        background-color: {input};
+        border: 1px solid {border};
+        padding: 8px;
+        border-radius: 6px;
+    }}
+    
+    QComboBox::drop-down {{
+        border: none;
+        width: 24px;
+    }}
+    
+    QComboBox QAbstractItemView {{
+        background-color: {input};
+        border: 1px solid {border};
+        border-radius: 6px;
+        selection-background-color: {primary};
+        selection-color: {selected_text};
+    }}
+    
+    /* QTabWidget */
+    QTabWidget::pane {{
+        border: 1px solid {border};
+        background-color: {window};
+        top: -1px;
+        border-radius: 4px;
+    }}
+    
+    QTabBar::tab {{
+        background-color: {background_alt};
+        border: 1px solid {border};
+        padding: 8px 16px;
+        border-top-left-radius: 6px;
+        border-top-right-radius: 6px;
+    }}
+    
+    QTabBar::tab:selected {{
+        background-color: {window};
+        border-bottom-color: {window};
+    }}
+    
+    QTabBar::tab:hover {{
+        background-color: {hover};
+    }}
+    
+    /* QScrollBar */
+    QScrollBar:vertical {{
+        border: none;
+        background-color: {background_alt};
+        width: 10px;
+        margin: 0px;
+        border-radius: 4px;
+    }}
+    
+    QScrollBar::handle:vertical {{
+        background-color: {scrollbar_handle};
+        border-radius: 5px;
+        min-height: 30px;
+    }}
+    
+    QScrollBar::handle:vertical:hover {{
+        background-color: {scrollbar_handle_hover};
+    }}
+    
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+        height: 0px;
+    }}
+    
+    QScrollBar:horizontal {{
+        border: none;
+        background-color: {background_alt};
+        height: 10px;
+        margin: 0px;
+        border-radius: 4px;
+    }}
+    
+    QScrollBar::handle:horizontal {{
+        background-color: {border};
+        border-radius: 5px;
+        min-width: 30px;
+    }}
+    
+    QScrollBar::handle:horizontal:hover {{
+        background-color: {scrollbar_horizontal_handle_hover};
+    }}
+    
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
+        width: 0px;
+    }}
+    
+    /* QTableView */
+    QTableView {{
+        gridline-color: {border};
+        background-color: {input};
+        selection-background-color: {primary};
+        selection-color: {selected_text};
+        alternate-background-color: {window};
+        border-radius: 4px;
+    }}
+    
+    QTableView::item {{
+        padding: 8px;
+    }}
+    
+    QHeaderView::section {{
+        background-color: {hover};
+        padding: 6px;
+        border: none;
+        font-weight: bold;
+    }}
+    
+    /* QSlider */
+    QSlider::groove:horizontal {{
+        height: 8px;
+        background-color: {background_alt};
+        border-radius: 4px;
+        border: 1px solid {primary};
+    }}
+    
+    QSlider::handle:horizontal {{
+        background-color: {primary};
+        border: none;
+        width: 16px;
+        margin: -4px 0;
+        border-radius: 8px;
+    }}
+    
+    QSlider::sub-page:horizontal {{
+        background-color: {primary};
+        border-radius: 4px;
+    }}
+    
+    /* QGroupBox */
+    QGroupBox {{
+        font-weight: bold;
+        border: 1px solid {border};
+        border-radius: 6px;
+        margin-top: 16px;
+        padding-top: 16px;
+    }}
+    
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }}
+    
+    /* QCheckBox */
+    QCheckBox::indicator {{
+        width: 18px;
+        height: 18px;
+        border-radius: 3px;
+        border: 1px solid {border};
+    }}
+    
+    QCheckBox::indicator:checked {{
+        background-color: {primary};
+    }}
+    
+    QCheckBox::indicator:unchecked {{
+        background-color: {input};
+    }}
+    
+    /* QRadioButton */
+    QRadioButton::indicator {{
+        width: 18px;
+        height: 18px;
+        border-radius: 9px;
+        border: 1px solid {border};
+    }}
+    
+    QRadioButton::indicator:checked {{
+        background-color: {primary};
+    }}
+    
+    QRadioButton::indicator:unchecked {{
+        background-color: {input};
+    }}
+    
+    /* QProgressBar */
+    QProgressBar {{
+        border: none;
+        border-radius: 4px;
+        background-color: {background_alt};
+        text-align: center;
+        color: {progress_text};
+    }}
+    
+    QProgressBar::chunk {{
+        background-color: {primary};
+        border-radius: 4px;
+    }}
+    
+    /* QSplitter */
+    QSplitter::handle {{
+        background-color: {border};
+    }}
+    
+    /* QStatusBar */
+    QStatusBar {{
+        background-color: {background_alt};
+        color: {foreground};
+    }}
+"""
+
+# Colors filling the application stylesheet for each theme
+_APP_STYLESHEET_COLORS = {
+    "dark": {
+        "window": "#16161a",
+        "foreground": "#e6e6eb",
+        "background_alt": "#1e1e23",
+        "border": "#2e2e35",
+        "hover": "#2a2a32",
+        "primary": "#9c88ff",
+        "selected_text": "white",
+        "input": "#1e1e23",
+        "scrollbar_handle": "#2e2e35",
+        "scrollbar_handle_hover": "#3e3e45",
+        "scrollbar_horizontal_handle_hover": "#3e3e45",
+        "progress_text": "white"
+    },
+    "light": {
+        "window": "#f5f5f7",
+        "foreground": "#232328",
+        "background_alt": "#e6e6eb",
+        "border": "#c5c5c8",
+        "hover": "#d8d8df",
+        "primary": "#826ee5",
+        "selected_text": "white",
+        "input": "#ffffff",
+        "scrollbar_handle": "#a5a5a8",
+        "scrollbar_handle_hover": "#757578",
+        "scrollbar_horizontal_handle_hover": "#a5a5a8",
+        "progress_text": "#232328"
+    },
+    "nature": {
+        "window": "#232a25",
+        "foreground": "#dce6dc",
+        "background_alt": "#2d3730",
+        "border": "#3d4d40",
+        "hover": "#3d4d40",
+        "primary": "#78b478",
+        "selected_text": "white",
+        "input": "#2d3730",
+        "scrollbar_handle": "#3d4d40",
+        "scrollbar_handle_hover": "#4d6350",
+        "scrollbar_horizontal_handle_hover": "#4d6350",
+        "progress_text": "white"
+    },
+    "midnight": {
+        "window": "#0f1623",
+        "foreground": "#dce1eb",
+        "background_alt": "#192332",
+        "border": "#293245",
+        "hover": "#293245",
+        "primary": "#5091e6",
+        "selected_text": "white",
+        "input": "#192332",
+        "scrollbar_handle": "#293245",
+        "scrollbar_handle_hover": "#394255",
+        "scrollbar_horizontal_handle_hover": "#394255",
+        "progress_text": "white"
+    },
+    "monochrome": {
+        "window": "#121212",
+        "foreground": "#dcdcdc",
+        "background_alt": "#1e1e1e",
+        "border": "#2d2d2d",
+        "hover": "#2d2d2d",
+        "primary": "#b4b4b4",
+        "selected_text": "#121212",
+        "input": "#1e1e1e",
+        "scrollbar_handle": "#2d2d2d",
+        "scrollbar_handle_hover": "#3c3c3c",
+        "scrollbar_horizontal_handle_hover": "#3c3c3c",
+        "progress_text": "white"
+    },
+    "reverse_monochrome": {
+        "window": "#dcdcdc",
+        "foreground": "#121212",
+        "background_alt": "#c8c8c8",
+        "border": "#a0a0a0",
+        "hover": "#a0a0a0",
+        "primary": "#464646",
+        "selected_text": "#dcdcdc",
+        "input": "#c8c8c8",
+        "scrollbar_handle": "#a0a0a0",
+        "scrollbar_handle_hover": "#808080",
+        "scrollbar_horizontal_handle_hover": "#808080",
+        "progress_text": "#121212"
+    },
+    "violet": {
+        "window": "#231932",
+        "foreground": "#e6dcf0",
+        "background_alt": "#2d2341",
+        "border": "#3d3355",
+        "hover": "#3d3355",
+        "primary": "#b478dc",
+        "selected_text": "white",
+        "input": "#2d2341",
+        "scrollbar_handle": "#3d3355",
+        "scrollbar_handle_hover": "#4d4365",
+        "scrollbar_horizontal_handle_hover": "#4d4365",
+        "progress_text": "white"
+    }
+}
+
+# Palette colors for each theme, as 0xRRGGBB ints
+_THEME_PALETTES = {
+    "dark": {
+        "background": 0x161619,
+        "background_alt": 0x1e1e23,
+        "foreground": 0xe6e6eb,
+        "primary": 0x9c88ff,
+        "secondary": 0xdba682
+    },
+    "light": {
+        "background": 0xf5f5f7,
+        "background_alt": 0xe6e6eb,
+        "foreground": 0x232328,
+        "primary": 0x826ee5,
+        "secondary": 0xdb7b50
+    },
+    "nature": {
+        "background": 0x232a25,
+        "background_alt": 0x2d3730,
+        "foreground": 0xdce6dc,
+        "primary": 0x78b478,
+        "secondary": 0xc8b478
+    },
+    "midnight": {
+        "background": 0x0f1623,
+        "background_alt": 0x192332,
+        "foreground": 0xdce1eb,
+        "primary": 0x5091e6,
+        "secondary": 0x64c3dc
+    },
+    "monochrome": {
+        "background": 0x121212,
+        "background_alt": 0x1e1e1e,
+        "foreground": 0xdcdcdc,
+        "primary": 0xb4b4b4,
+        "secondary": 0x969696
+    },
+    "reverse_monochrome": {
+        "background": 0xdcdcdc,
+        "background_alt": 0xc8c8c8,
+        "foreground": 0x121212,
+        "primary": 0x464646,
+        "secondary": 0x646464
+    },
+    "violet": {
+        "background": 0x231932,
+        "background_alt": 0x2d2341,
+        "foreground": 0xe6dcf0,
+        "primary": 0xb478dc,
+        "secondary": 0xdc8cb4
+    }
+}
+
+# Theme IDs and display names in the order they are offered to the user
+_THEME_NAMES = (
+    ("dark", "Dark Elegance"),
+    ("light", "Light Elegance"),
+    ("monochrome", "Monochrome"),
+    ("reverse_monochrome", "Light Monochrome"),
+    ("nature", "Emerald Veil"),
+    ("midnight", "Midnight Blue"),
+    ("violet", "Violet Dream"),
+)
+
+# Display name of each theme ID
+_THEME_DISPLAY_NAMES = dict(_THEME_NAMES)
+
 
 class ThemeManager(QObject):
     """
@@ -26,150 +619,236 @@ class ThemeManager(QObject):
     """
     theme_changed = Signal(str)
     
+    # Text color for disabled widgets, shared by every theme's palette
+    _DISABLED_GREY = QColor(0x7f7f7f)
+    
+    # Settings key holding the chosen theme ID
+    SETTINGS_KEY = "theme/current"
+    
+    # Delay before a theme choice is written, so clicking through themes writes only the last
+    SAVE_DELAY_MS = 500
+    
     def __init__(self):
         super().__init__()
         
         self._current_theme = "dark"  # Default theme
-        self._themes = {}
-        
-        # Initialize themes
-        self._initialize_themes()
+        self._themes = {}  # theme ID -> theme data, built on first use
+        self._stylesheet_cache = {}  # (template name, theme ID) -> stylesheet
+        self._color_name_cache = {}  # theme ID -> {palette role: hex color}
+        self._palette_cache = {}  # theme ID -> QPalette
+        self._qcolor_cache = {}  # theme ID -> {palette role: QColor}
+        self._settings = QSettings("FragranceOrg", "Fragrance Collection Organizer")
+        self._save_timer = None  # created on first save, once the application exists
         
         # Load saved theme if any
         self._load_theme_preference()
     
-    def _initialize_themes(self):
-        """Initialize all available themes"""
-        # Dark theme (default)
-        self._themes["dark"] = {
-            "name": "Dark Elegance",
-            "palette": {
-                "background": QColor(22, 22, 25),
-                "background_alt": QColor(30, 30, 35),
-                "foreground": QColor(230, 230, 235),
-                "primary": QColor(156, 136, 255),
-                "secondary": QColor(219, 166, 130)
-            },
-            "stylesheet": self._get_dark_stylesheet
-        }
-        
-        # Light theme
-        self._themes["light"] = {
-            "name": "Light Elegance",
-            "palette": {
-                "background": QColor(245, 245, 247),
-                "background_alt": QColor(230, 230, 235),
-                "foreground": QColor(35, 35, 40),
-                "primary": QColor(130, 110, 229),
-                "secondary": QColor(219, 123, 80)
-            },
-            "stylesheet": self._get_light_stylesheet
-        }
-        
-        # Nature theme
-        self._themes["nature"] = {
-            "name": "Emerald Veil",
-            "palette": {
-                "background": QColor(35, 42, 37),
-                "background_alt": QColor(45, 55, 48),
-                "foreground": QColor(220, 230, 220),
-                "primary": QColor(120, 180, 120),
-                "secondary": QColor(200, 180, 120)
-            },
-            "stylesheet": self._get_nature_stylesheet
-        }
-        
-        # Midnight theme
-        self._themes["midnight"] = {
-            "name": "Midnight Blue",
-            "palette": {
-                "background": QColor(15, 22, 35),
-                "background_alt": QColor(25, 35, 50),
-                "foreground": QColor(220, 225, 235),
-                "primary": QColor(80, 145, 230),
-                "secondary": QColor(100, 195, 220)
-            },
-            "stylesheet": self._get_midnight_stylesheet
-        }
-        
-        # Monochrome theme
-        self._themes["monochrome"] = {
-            "name": "Monochrome",
-            "palette": {
-                "background": QColor(18, 18, 18),
-                "background_alt": QColor(30, 30, 30),
-                "foreground": QColor(220, 220, 220),
-                "primary": QColor(180, 180, 180),
-                "secondary": QColor(150, 150, 150)
-            },
-            "stylesheet": self._get_monochrome_stylesheet
-        }
-        
-        # Reverse Monochrome theme
-        self._themes["reverse_monochrome"] = {
-            "name": "Light Monochrome",
-            "palette": {
-                "background": QColor(220, 220, 220),
-                "background_alt": QColor(200, 200, 200),
-                "foreground": QColor(18, 18, 18),
-                "primary": QColor(70, 70, 70),
-                "secondary": QColor(100, 100, 100)
-            },
-            "stylesheet": self._get_reverse_monochrome_stylesheet
-        }
+    def _get_theme(self, theme_id):
+        """
+        Get a theme's data, building it the first time it is requested
         
-        # Violet theme
-        self._themes["violet"] = {
-            "name": "Violet Dream",
-            "palette": {
-                "background": QColor(35, 25, 50),
-                "background_alt": QColor(45, 35, 65),
-                "foreground": QColor(230, 220, 240),
-                "primary": QColor(180, 120, 220),
-                "secondary": QColor(220, 140, 180)
-            },
-            "stylesheet": self._get_violet_stylesheet
+        Args:
+            theme_id: Theme ID to look up
+            
+        Returns:
+            dict: Theme name, palette colors and stylesheet
+        """
+        theme = self._themes.get(theme_id)
+        if theme is None:
+            theme = self._build_theme(theme_id)
+            self._themes[theme_id] = theme
+        return theme
+    
+    def _build_theme(self, theme_id):
+        """Build a theme's data from its palette and stylesheet colors"""
+        return {
+            "name": _THEME_DISPLAY_NAMES[theme_id],
+            "palette": _THEME_PALETTES[theme_id],
+            "stylesheet": minify_css(_APP_STYLESHEET_TEMPLATE.format_map(_APP_STYLESHEET_COLORS[theme_id]))
         }
     
     def get_theme_names(self):
-        """Get a list of available theme names in the specified order"""
-        # Define the order of themes
-        theme_order = ["dark", "light", "monochrome", "reverse_monochrome", "nature", "midnight", "violet"]
-        
-        # Return the themes in the specified order
-        return [(theme_id, self._themes[theme_id]["name"]) for theme_id in theme_order if theme_id in self._themes]
+        """Get the available (theme ID, theme name) pairs in display order, as a shared tuple"""
+        return _THEME_NAMES
     
     def get_current_theme(self):
         """Get the current theme ID"""
         return self._current_theme
     
-    def apply_theme(self, app, theme_id=None):
+    def apply_theme(self, app, theme_id=None, force=False):
         """
         Apply the specified theme to the application
         
         Args:
             app: QApplication instance
             theme_id: Theme ID to apply (if None, applies current theme)
+            force: Re-apply even if the theme is already installed on the application
         """
-        if theme_id and theme_id in self._themes:
+        previous_theme = self._current_theme
+        if theme_id and theme_id in _THEME_DISPLAY_NAMES:
             self._current_theme = theme_id
+        
+        # Re-installing the same palette and stylesheet would re-polish every widget for nothing
+        if not force and app.property(THEME_PROPERTY) == self._current_theme:
+            return
             
         # Save theme preference
         self._save_theme_preference()
         
-        # Get theme data
-        theme = self._themes[self._current_theme]
-        
-        # Create and apply palette
-        palette = self._create_palette_from_theme(theme["palette"])
+        # Apply palette, built the first time each theme is used
+        palette = self._palette_cache.get(self._current_theme)
+        if palette is None:
+            palette = self._create_palette_from_theme(self.get_palette_colors(self._current_theme))
+            self._palette_cache[self._current_theme] = palette
         app.setPalette(palette)
         
         # Apply stylesheet
-        app.setStyleSheet(theme["stylesheet"]())
+        app.setStyleSheet(self.get_application_stylesheet())
+        app.setProperty(THEME_PROPERTY, self._current_theme)
         
-        # Emit theme changed signal
-        self.theme_changed.emit(self._current_theme)
+        # Emit theme changed signal, only if widgets styled for the previous theme need restyling
+        if force or self._current_theme != previous_theme:
+            self.theme_changed.emit(self._current_theme)
 
+    def get_color_names(self, theme_id=None):
+        """
+        Get the hex color names of a theme's palette
+        
+        Args:
+            theme_id: Theme ID to look up (if None, uses current theme)
+            
+        Returns:
+            dict: Palette role (e.g. "primary") to hex color string, computed once per theme
+        """
+        theme_id = theme_id or self._current_theme
+        
+        colors = self._color_name_cache.get(theme_id)
+        if colors is None:
+            colors = {role: "#%06x" % rgb for role, rgb in self._get_theme(theme_id)["palette"].items()}
+            self._color_name_cache[theme_id] = colors
+        return colors
+    
+    def get_palette_colors(self, theme_id=None):
+        """
+        Get a theme's palette colors
+        
+        Args:
+            theme_id: Theme ID to look up (if None, uses current theme)
+            
+        Returns:
+            dict: Palette role (e.g. "primary") to the theme's shared QColor; do not modify
+        """
+        theme_id = theme_id or self._current_theme
+        
+        colors = self._qcolor_cache.get(theme_id)
+        if colors is None:
+            colors = {role: QColor(rgb) for role, rgb in self._get_theme(theme_id)["palette"].items()}
+            self._qcolor_cache[theme_id] = colors
+        return colors
+    
+    def get_application_stylesheet(self, theme_id=None):
+        """
+        Get the application-wide stylesheet, with the rating bar rules so the bars need no
+        sheets of their own
+        
+        Args:
+            theme_id: Theme ID to style for (if None, uses current theme)
+            
+        Returns:
+            str: Stylesheet built once per theme and reused afterwards
+        """
+        theme_id = theme_id or self._current_theme
+        key = ("application", theme_id)
+        
+        stylesheet = self._stylesheet_cache.get(key)
+        if stylesheet is None:
+            stylesheet = self._get_theme(theme_id)["stylesheet"] + self.get_rating_bars_stylesheet(theme_id)
+            self._stylesheet_cache[key] = stylesheet
+        return stylesheet
+    
+    def get_dialog_stylesheet(self, theme_id=None):
+        """
+        Get the stylesheet for themed dialogs
+        
+        Args:
+            theme_id: Theme ID to style for (if None, uses current theme)
+            
+        Returns:
+            str: Stylesheet built once per theme and reused afterwards
+        """
+        return self._get_cached_stylesheet("dialog", _DIALOG_STYLESHEET_TEMPLATE, theme_id)
+    
+    def get_toggle_button_stylesheet(self, theme_id=None):
+        """
+        Get the stylesheet for the filter panel toggle button
+        
+        Args:
+            theme_id: Theme ID to style for (if None, uses current theme)
+            
+        Returns:
+            str: Stylesheet built once per theme and reused afterwards
+        """
+        return self._get_cached_stylesheet("toggle_button", _TOGGLE_BUTTON_STYLESHEET_TEMPLATE, theme_id)
+    
+    def get_splitter_stylesheet(self, theme_id=None):
+        """
+        Get the stylesheet for splitter handles
+        
+        Args:
+            theme_id: Theme ID to style for (if None, uses current theme)
+            
+        Returns:
+            str: Stylesheet built once per theme and reused afterwards
+        """
+        return self._get_cached_stylesheet("splitter", _SPLITTER_STYLESHEET_TEMPLATE, theme_id)
+    
+    def get_rating_slider_stylesheet(self, theme_id=None):
+        """
+        Get the stylesheet for rating sliders
+        
+        Args:
+            theme_id: Theme ID to style for (if None, uses current theme)
+            
+        Returns:
+            str: Stylesheet built once per theme and reused afterwards
+        """
+        return self._get_cached_stylesheet("rating_slider", _RATING_SLIDER_STYLESHEET_TEMPLATE, theme_id)
+    
+    def get_rating_bars_stylesheet(self, theme_id=None):
+        """
+        Get the application-wide rules for performance and seasonal rating bars
+        
+        Args:
+            theme_id: Theme ID to style for (if None, uses current theme)
+            
+        Returns:
+            str: Stylesheet built once per theme and reused afterwards
+        """
+        theme_id = theme_id or self._current_theme
+        key = ("rating_bars", theme_id)
+        
+        stylesheet = self._stylesheet_cache.get(key)
+        if stylesheet is None:
+            colors = self.get_color_names(theme_id)
+            season_colors = self._get_theme(theme_id).get("seasons", _SEASON_COLORS)
+            stylesheet = minify_css(_RATING_BARS_STYLESHEET_TEMPLATE.format_map(colors) + "".join(
+                _SEASON_BAR_STYLESHEET_TEMPLATE.format_map({**colors, "season": season, "season_color": color})
+                for season, color in season_colors.items()
+            ))
+            self._stylesheet_cache[key] = stylesheet
+        return stylesheet
+    
+    def _get_cached_stylesheet(self, name, template, theme_id):
+        """Fill a stylesheet template from a theme palette, memoized per theme"""
+        theme_id = theme_id or self._current_theme
+        key = (name, theme_id)
+        
+        stylesheet = self._stylesheet_cache.get(key)
+        if stylesheet is None:
+            stylesheet = minify_css(template.format_map(self.get_color_names(theme_id)))
+            self._stylesheet_cache[key] = stylesheet
+        return stylesheet
+    
     def _create_palette_from_theme(self, theme_colors):
         """Create a QPalette from theme colors"""
         palette = QPalette()
@@ -180,1826 +859,55 @@ class ThemeManager(QObject):
         foreground = theme_colors["foreground"]
         primary = theme_colors["primary"]
         
-        # Set palette colors
-        palette.setColor(QPalette.Window, background)
-        palette.setColor(QPalette.WindowText, foreground)
-        palette.setColor(QPalette.Base, background_alt)
-        palette.setColor(QPalette.AlternateBase, background)
-        palette.setColor(QPalette.Text, foreground)
-        palette.setColor(QPalette.BrightText, Qt.white)
-        palette.setColor(QPalette.Button, background_alt)
-        palette.setColor(QPalette.ButtonText, foreground)
-        palette.setColor(QPalette.Highlight, primary)
-        palette.setColor(QPalette.HighlightedText, Qt.white)
+        # Role, color pairs for the active and inactive states. Tooltip roles are left out:
+        # the application stylesheet's QWidget rule already colors tooltips
+        roles = (
+            (QPalette.Window, background),
+            (QPalette.WindowText, foreground),
+            (QPalette.Base, background_alt),
+            (QPalette.AlternateBase, background),
+            (QPalette.Text, foreground),
+            (QPalette.BrightText, Qt.white),
+            (QPalette.Button, background_alt),
+            (QPalette.ButtonText, foreground),
+            (QPalette.Highlight, primary),
+            (QPalette.HighlightedText, Qt.white),
+        )
         
         # Disabled state colors
-        palette.setColor(QPalette.Disabled, QPalette.WindowText, QColor(127, 127, 127))
-        palette.setColor(QPalette.Disabled, QPalette.Text, QColor(127, 127, 127))
-        palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(127, 127, 127))
+        disabled_roles = (QPalette.WindowText, QPalette.Text, QPalette.ButtonText)
         
-        # Tooltip
-        palette.setColor(QPalette.ToolTipBase, primary)
-        palette.setColor(QPalette.ToolTipText, Qt.white)
+        for role, color in roles:
+            palette.setColor(role, color)
+        for role in disabled_roles:
+            palette.setColor(QPalette.Disabled, role, self._DISABLED_GREY)
         
         return palette
     
     def _save_theme_preference(self):
-        """Save the current theme preference to settings"""
-        settings = QSettings("FragranceOrg", "Fragrance Collection Organizer")
-        settings.setValue("theme/current", self._current_theme)
+        """Schedule saving the current theme preference, restarting any pending save"""
+        if self._save_timer is None:
+            self._save_timer = QTimer(self)
+            self._save_timer.setSingleShot(True)
+            self._save_timer.timeout.connect(self._write_theme_preference)
+            
+            # Don't lose a choice made just before quitting
+            QApplication.instance().aboutToQuit.connect(self._write_theme_preference)
+        
+        self._save_timer.start(self.SAVE_DELAY_MS)
+    
+    @Slot()
+    def _write_theme_preference(self):
+        """Write the current theme preference to settings"""
+        if self._settings.value(self.SETTINGS_KEY) != self._current_theme:
+            self._settings.setValue(self.SETTINGS_KEY, self._current_theme)
     
     def _load_theme_preference(self):
         """Load theme preference from settings"""
-        settings = QSettings("FragranceOrg", "Fragrance Collection Organizer")
-        saved_theme = settings.value("theme/current", "dark")
+        saved_theme = self._settings.value(self.SETTINGS_KEY, "dark")
         
-        if saved_theme in self._themes:
+        if saved_theme in _THEME_DISPLAY_NAMES:
             self._current_theme = saved_theme
 
-    # Theme stylesheet getters
-    def _get_dark_stylesheet(self):
-        """Get the dark theme stylesheet"""
-        return """
-        /* Global */
-        * {
-            border-radius: 4px;
-        }
-        
-        /* QWidget */
-        QWidget {
-            background-color: #16161a;
-            color: #e6e6eb;
-        }
-        
-        /* QToolBar */
-        QToolBar {
-            border: none;
-            padding: 4px;
-            spacing: 4px;
-            background-color: #1e1e23;
-        }
-        
-        /* QPushButton */
-        QPushButton {
-            background-color: #1e1e23;
-            color: #e6e6eb;
-            border: 1px solid #2e2e35;
-            padding: 8px 16px;
-            border-radius: 6px;
-        }
-        
-        QPushButton:hover {
-            background-color: #2a2a32;
-            border: 1px solid #9c88ff;
-        }
-        
-        QPushButton:pressed {
-            background-color: #9c88ff;
-            color: white;
-        }
-        
-        /* QLineEdit */
-        QLineEdit {
-            background-color: #1e1e23;
-            border: 1px solid #2e2e35;
-            padding: 8px;
-            border-radius: 6px;
-        }
-        
-        QLineEdit:focus {
-            border: 1px solid #9c88ff;
-        }
-        
-        /* QComboBox */
-        QComboBox {
-            background-color: #1e1e23;
-            border: 1px solid #2e2e35;
-            padding: 8px;
-            border-radius: 6px;
-        }
-        
-        QComboBox::drop-down {
-            border: none;
-            width: 24px;
-        }
-        
-        QComboBox QAbstractItemView {
-            background-color: #1e1e23;
-            border: 1px solid #2e2e35;
-            border-radius: 6px;
-            selection-background-color: #9c88ff;
-        }
-        
-        /* QTabWidget */
-        QTabWidget::pane {
-            border: 1px solid #2e2e35;
-            background-color: #16161a;
-            top: -1px;
-        }
-        
-        QTabBar::tab {
-            background-color: #1e1e23;
-            border: 1px solid #2e2e35;
-            padding: 8px 16px;
-            border-top-left-radius: 6px;
-            border-top-right-radius: 6px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: #16161a;
-            border-bottom-color: #16161a;
-        }
-        
-        QTabBar::tab:hover {
-            background-color: #2a2a32;
-        }
-        
-        /* QScrollBar */
-        QScrollBar:vertical {
-            border: none;
-            background-color: #1e1e23;
-            width: 10px;
-            margin: 0px;
-        }
-        
-        QScrollBar::handle:vertical {
-            background-color: #2e2e35;
-            border-radius: 5px;
-            min-height: 30px;
-        }
-        
-        QScrollBar::handle:vertical:hover {
-            background-color: #3e3e45;
-        }
-        
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-            height: 0px;
-        }
-        
-        QScrollBar:horizontal {
-            border: none;
-            background-color: #1e1e23;
-            height: 10px;
-            margin: 0px;
-        }
-        
-        QScrollBar::handle:horizontal {
-            background-color: #2e2e35;
-            border-radius: 5px;
-            min-width: 30px;
-        }
-        
-        QScrollBar::handle:horizontal:hover {
-            background-color: #3e3e45;
-        }
-        
-        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-            width: 0px;
-        }
-        
-        /* QTableView */
-        QTableView {
-            gridline-color: #2e2e35;
-            background-color: #1e1e23;
-            selection-background-color: #9c88ff;
-            selection-color: white;
-            alternate-background-color: #16161a;
-        }
-        
-        QTableView::item {
-            padding: 8px;
-        }
-        
-        QHeaderView::section {
-            background-color: #2a2a32;
-            padding: 6px;
-            border: none;
-            font-weight: bold;
-        }
-        
-        /* QSlider */
-        QSlider::groove:horizontal {
-            height: 8px;
-            background-color: #1e1e23;
-            border-radius: 4px;
-            border: 1px solid #9c88ff;
-        }
-        
-        QSlider::handle:horizontal {
-            background-color: #9c88ff;
-            border: none;
-            width: 16px;
-            margin: -4px 0;
-            border-radius: 8px;
-        }
-        
-        QSlider::sub-page:horizontal {
-            background-color: #9c88ff;
-            border-radius: 4px;
-        }
-        
-        /* QGroupBox */
-        QGroupBox {
-            font-weight: bold;
-            border: 1px solid #2e2e35;
-            border-radius: 6px;
-            margin-top: 16px;
-            padding-top: 16px;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px;
-        }
-        
-        /* QCheckBox */
-        QCheckBox::indicator {
-            width: 18px;
-            height: 18px;
-            border-radius: 3px;
-            border: 1px solid #2e2e35;
-        }
-        
-        QCheckBox::indicator:checked {
-            background-color: #9c88ff;
-        }
-        
-        QCheckBox::indicator:unchecked {
-            background-color: #1e1e23;
-        }
-        
-        /* QRadioButton */
-        QRadioButton::indicator {
-            width: 18px;
-            height: 18px;
-            border-radius: 9px;
-            border: 1px solid #2e2e35;
-        }
-        
-        QRadioButton::indicator:checked {
-            background-color: #9c88ff;
-        }
-        
-        QRadioButton::indicator:unchecked {
-            background-color: #1e1e23;
-        }
-        
-        /* QProgressBar */
-        QProgressBar {
-            border: none;
-            border-radius: 4px;
-            background-color: #1e1e23;
-            text-align: center;
-            color: white;
-        }
-        
-        QProgressBar::chunk {
-            background-color: #9c88ff;
-            border-radius: 4px;
-        }
-        
-        /* QSplitter */
-        QSplitter::handle {
-            background-color: #2e2e35;
-        }
-        
-        /* QStatusBar */
-        QStatusBar {
-            background-color: #1e1e23;
-            color: #e6e6eb;
-        }
-        """
-
-    def _get_light_stylesheet(self):
-        """Get the light theme stylesheet"""
-        return """
-        /* Global */
-        * {
-            border-radius: 4px;
-        }
-        
-        /* QWidget */
-        QWidget {
-            background-color: #f5f5f7;
-            color: #232328;
-        }
-        
-        /* QToolBar */
-        QToolBar {
-            border: none;
-            padding: 4px;
-            spacing: 4px;
-            background-color: #e6e6eb;
-        }
-        
-        /* QPushButton */
-        QPushButton {
-            background-color: #e6e6eb;
-            color: #232328;
-            border: 1px solid #c5c5c8;
-            padding: 8px 16px;
-            border-radius: 6px;
-        }
-        
-        QPushButton:hover {
-            background-color: #d8d8df;
-            border: 1px solid #826ee5;
-        }
-        
-        QPushButton:pressed {
-            background-color: #826ee5;
-            color: white;
-        }
-        
-        /* QLineEdit */
-        QLineEdit {
-            background-color: #ffffff;
-            border: 1px solid #c5c5c8;
-            padding: 8px;
-            border-radius: 6px;
-        }
-        
-        QLineEdit:focus {
-            border: 1px solid #826ee5;
-        }
-        
-        /* QComboBox */
-        QComboBox {
-            background-color: #ffffff;
-            border: 1px solid #c5c5c8;
-            padding: 8px;
-            border-radius: 6px;
-        }
-        
-        QComboBox::drop-down {
-            border: none;
-            width: 24px;
-        }
-        
-        QComboBox QAbstractItemView {
-            background-color: #ffffff;
-            border: 1px solid #c5c5c8;
-            border-radius: 6px;
-            selection-background-color: #826ee5;
-            selection-color: white;
-        }
-        
-        /* QTabWidget */
-        QTabWidget::pane {
-            border: 1px solid #c5c5c8;
-            background-color: #f5f5f7;
-            top: -1px;
-        }
-        
-        QTabBar::tab {
-            background-color: #e6e6eb;
-            border: 1px solid #c5c5c8;
-            padding: 8px 16px;
-            border-top-left-radius: 6px;
-            border-top-right-radius: 6px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: #f5f5f7;
-            border-bottom-color: #f5f5f7;
-        }
-        
-        QTabBar::tab:hover {
-            background-color: #d8d8df;
-        }
-        
-        /* QScrollBar */
-        QScrollBar:vertical {
-            border: none;
-            background-color: #e6e6eb;
-            width: 10px;
-            margin: 0px;
-        }
-        
-        QScrollBar::handle:vertical {
-            background-color: #a5a5a8;
-            border-radius: 5px;
-            min-height: 30px;
-        }
-        
-        QScrollBar::handle:vertical:hover {
-            background-color: #757578;
-        }
-        
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-            height: 0px;
-        }
-        
-        QScrollBar:horizontal {
-            border: none;
-            background-color: #e6e6eb;
-            height: 10px;
-            margin: 0px;
-        }
-        
-        QScrollBar::handle:horizontal {
-            background-color: #c5c5c8;
-            border-radius: 5px;
-            min-width: 30px;
-        }
-        
-        QScrollBar::handle:horizontal:hover {
-            background-color: #a5a5a8;
-        }
-        
-        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-            width: 0px;
-        }
-        
-        /* QTableView */
-        QTableView {
-            gridline-color: #c5c5c8;
-            background-color: #ffffff;
-            selection-background-color: #826ee5;
-            selection-color: white;
-            alternate-background-color: #f5f5f7;
-        }
-        
-        QTableView::item {
-            padding: 8px;
-        }
-        
-        QHeaderView::section {
-            background-color: #d8d8df;
-            padding: 6px;
-            border: none;
-            font-weight: bold;
-        }
-        
-        /* QSlider */
-        QSlider::groove:horizontal {
-            height: 8px;
-            background-color: #e6e6eb;
-            border-radius: 4px;
-            border: 1px solid #826ee5;
-        }
-        
-        QSlider::handle:horizontal {
-            background-color: #826ee5;
-            border: none;
-            width: 16px;
-            margin: -4px 0;
-            border-radius: 8px;
-        }
-        
-        QSlider::sub-page:horizontal {
-            background-color: #826ee5;
-            border-radius: 4px;
-        }
-        
-        /* QGroupBox */
-        QGroupBox {
-            font-weight: bold;
-            border: 1px solid #c5c5c8;
-            border-radius: 6px;
-            margin-top: 16px;
-            padding-top: 16px;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px;
-        }
-        
-        /* QCheckBox */
-        QCheckBox::indicator {
-            width: 18px;
-            height: 18px;
-            border-radius: 3px;
-            border: 1px solid #c5c5c8;
-        }
-        
-        QCheckBox::indicator:checked {
-            background-color: #826ee5;
-        }
-        
-        QCheckBox::indicator:unchecked {
-            background-color: #ffffff;
-        }
-        
-        /* QRadioButton */
-        QRadioButton::indicator {
-            width: 18px;
-            height: 18px;
-            border-radius: 9px;
-            border: 1px solid #c5c5c8;
-        }
-        
-        QRadioButton::indicator:checked {
-            background-color: #826ee5;
-        }
-        
-        QRadioButton::indicator:unchecked {
-            background-color: #ffffff;
-        }
-        
-        /* QProgressBar */
-        QProgressBar {
-            border: none;
-            border-radius: 4px;
-            background-color: #e6e6eb;
-            text-align: center;
-            color: #232328;
-        }
-        
-        QProgressBar::chunk {
-            background-color: #826ee5;
-            border-radius: 4px;
-        }
-        
-        /* QSplitter */
-        QSplitter::handle {
-            background-color: #c5c5c8;
-        }
-        
-        /* QStatusBar */
-        QStatusBar {
-            background-color: #e6e6eb;
-            color: #232328;
-        }
-        """
-
-    def _get_nature_stylesheet(self):
-        """Get the Emerald Veil theme stylesheet"""
-        return """
-        /* Global */
-        * {
-            border-radius: 4px;
-        }
-        
-        /* QWidget */
-        QWidget {
-            background-color: #232a25;
-            color: #dce6dc;
-        }
-        
-        /* QToolBar */
-        QToolBar {
-            border: none;
-            padding: 4px;
-            spacing: 4px;
-            background-color: #2d3730;
-        }
-        
-        /* QPushButton */
-        QPushButton {
-            background-color: #2d3730;
-            color: #dce6dc;
-            border: 1px solid #3d4d40;
-            padding: 8px 16px;
-            border-radius: 6px;
-        }
-        
-        QPushButton:hover {
-            background-color: #3d4d40;
-            border: 1px solid #78b478;
-        }
-        
-        QPushButton:pressed {
-            background-color: #78b478;
-            color: white;
-        }
-        
-        /* QLineEdit */
-        QLineEdit {
-            background-color: #2d3730;
-            border: 1px solid #3d4d40;
-            padding: 8px;
-            border-radius: 6px;
-        }
-        
-        QLineEdit:focus {
-            border: 1px solid #78b478;
-        }
-        
-        /* QComboBox */
-        QComboBox {
-            background-color: #2d3730;
-            border: 1px solid #3d4d40;
-            padding: 8px;
-            border-radius: 6px;
-        }
-        
-        QComboBox::drop-down {
-            border: none;
-            width: 24px;
-        }
-        
-        QComboBox QAbstractItemView {
-            background-color: #2d3730;
-            border: 1px solid #3d4d40;
-            border-radius: 6px;
-            selection-background-color: #78b478;
-            selection-color: white;
-        }
-        
-        /* QTabWidget */
-        QTabWidget::pane {
-            border: 1px solid #3d4d40;
-            background-color: #232a25;
-            top: -1px;
-        }
-        
-        QTabBar::tab {
-            background-color: #2d3730;
-            border: 1px solid #3d4d40;
-            padding: 8px 16px;
-            border-top-left-radius: 6px;
-            border-top-right-radius: 6px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: #232a25;
-            border-bottom-color: #232a25;
-        }
-        
-        QTabBar::tab:hover {
-            background-color: #3d4d40;
-        }
-        
-        /* QScrollBar */
-        QScrollBar:vertical {
-            border: none;
-            background-color: #2d3730;
-            width: 10px;
-            margin: 0px;
-        }
-        
-        QScrollBar::handle:vertical {
-            background-color: #3d4d40;
-            border-radius: 5px;
-            min-height: 30px;
-        }
-        
-        QScrollBar::handle:vertical:hover {
-            background-color: #4d6350;
-        }
-        
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-            height: 0px;
-        }
-        
-        QScrollBar:horizontal {
-            border: none;
-            background-color: #2d3730;
-            height: 10px;
-            margin: 0px;
-        }
-        
-        QScrollBar::handle:horizontal {
-            background-color: #3d4d40;
-            border-radius: 5px;
-            min-width: 30px;
-        }
-        
-        QScrollBar::handle:horizontal:hover {
-            background-color: #4d6350;
-        }
-        
-        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-            width: 0px;
-        }
-        
-        /* QTableView */
-        QTableView {
-            gridline-color: #3d4d40;
-            background-color: #2d3730;
-            selection-background-color: #78b478;
-            selection-color: white;
-            alternate-background-color: #232a25;
-        }
-        
-        QTableView::item {
-            padding: 8px;
-        }
-        
-        QHeaderView::section {
-            background-color: #3d4d40;
-            padding: 6px;
-            border: none;
-            font-weight: bold;
-        }
-        
-        /* QSlider */
-        QSlider::groove:horizontal {
-            height: 8px;
-            background-color: #2d3730;
-            border-radius: 4px;
-            border: 1px solid #78b478;
-        }
-        
-        QSlider::handle:horizontal {
-            background-color: #78b478;
-            border: none;
-            width: 16px;
-            margin: -4px 0;
-            border-radius: 8px;
-        }
-        
-        QSlider::sub-page:horizontal {
-            background-color: #78b478;
-            border-radius: 4px;
-        }
-        
-        /* QGroupBox */
-        QGroupBox {
-            font-weight: bold;
-            border: 1px solid #3d4d40;
-            border-radius: 6px;
-            margin-top: 16px;
-            padding-top: 16px;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px;
-        }
-        
-        /* QCheckBox */
-        QCheckBox::indicator {
-            width: 18px;
-            height: 18px;
-            border-radius: 3px;
-            border: 1px solid #3d4d40;
-        }
-        
-        QCheckBox::indicator:checked {
-            background-color: #78b478;
-        }
-        
-        QCheckBox::indicator:unchecked {
-            background-color: #2d3730;
-        }
-        
-        /* QRadioButton */
-        QRadioButton::indicator {
-            width: 18px;
-            height: 18px;
-            border-radius: 9px;
-            border: 1px solid #3d4d40;
-        }
-        
-        QRadioButton::indicator:checked {
-            background-color: #78b478;
-        }
-        
-        QRadioButton::indicator:unchecked {
-            background-color: #2d3730;
-        }
-        
-        /* QProgressBar */
-        QProgressBar {
-            border: none;
-            border-radius: 4px;
-            background-color: #2d3730;
-            text-align: center;
-            color: white;
-        }
-        
-        QProgressBar::chunk {
-            background-color: #78b478;
-            border-radius: 4px;
-        }
-        
-        /* QSplitter */
-        QSplitter::handle {
-            background-color: #3d4d40;
-        }
-        
-        /* QStatusBar */
-        QStatusBar {
-            background-color: #2d3730;
-            color: #dce6dc;
-        }
-        """
-
-    def _get_midnight_stylesheet(self):
-        """Get the midnight blue theme stylesheet"""
-        return """
-        /* Global */
-        * {
-            border-radius: 4px;
-        }
-        
-        /* QWidget */
-        QWidget {
-            background-color: #0f1623;
-            color: #dce1eb;
-        }
-        
-        /* QToolBar */
-        QToolBar {
-            border: none;
-            padding: 4px;
-            spacing: 4px;
-            background-color: #192332;
-        }
-        
-        /* QPushButton */
-        QPushButton {
-            background-color: #192332;
-            color: #dce1eb;
-            border: 1px solid #293245;
-            padding: 8px 16px;
-            border-radius: 6px;
-        }
-        
-        QPushButton:hover {
-            background-color: #293245;
-            border: 1px solid #5091e6;
-        }
-        
-        QPushButton:pressed {
-            background-color: #5091e6;
-            color: white;
-        }
-        
-        /* QLineEdit */
-        QLineEdit {
-            background-color: #192332;
-            border: 1px solid #293245;
-            padding: 8px;
-            border-radius: 6px;
-        }
-        
-        QLineEdit:focus {
-            border: 1px solid #5091e6;
-        }
-        
-        /* QComboBox */
-        QComboBox {
-            background-color: #192332;
-            border: 1px solid #293245;
-            padding: 8px;
-            border-radius: 6px;
-        }
-        
-        QComboBox::drop-down {
-            border: none;
-            width: 24px;
-        }
-        
-        QComboBox QAbstractItemView {
-            background-color: #192332;
-            border: 1px solid #293245;
-            border-radius: 6px;
-            selection-background-color: #5091e6;
-            selection-color: white;
-        }
-        
-        /* QTabWidget */
-        QTabWidget::pane {
-            border: 1px solid #293245;
-            background-color: #0f1623;
-            top: -1px;
-        }
-        
-        QTabBar::tab {
-            background-color: #192332;
-            border: 1px solid #293245;
-            padding: 8px 16px;
-            border-top-left-radius: 6px;
-            border-top-right-radius: 6px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: #0f1623;
-            border-bottom-color: #0f1623;
-        }
-        
-        QTabBar::tab:hover {
-            background-color: #293245;
-        }
-        
-        /* QScrollBar */
-        QScrollBar:vertical {
-            border: none;
-            background-color: #192332;
-            width: 10px;
-            margin: 0px;
-        }
-        
-        QScrollBar::handle:vertical {
-            background-color: #293245;
-            border-radius: 5px;
-            min-height: 30px;
-        }
-        
-        QScrollBar::handle:vertical:hover {
-            background-color: #394255;
-        }
-        
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-            height: 0px;
-        }
-        
-        QScrollBar:horizontal {
-            border: none;
-            background-color: #192332;
-            height: 10px;
-            margin: 0px;
-        }
-        
-        QScrollBar::handle:horizontal {
-            background-color: #293245;
-            border-radius: 5px;
-            min-width: 30px;
-        }
-        
-        QScrollBar::handle:horizontal:hover {
-            background-color: #394255;
-        }
-        
-        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-            width: 0px;
-        }
-        
-        /* QTableView */
-        QTableView {
-            gridline-color: #293245;
-            background-color: #192332;
-            selection-background-color: #5091e6;
-            selection-color: white;
-            alternate-background-color: #0f1623;
-        }
-        
-        QTableView::item {
-            padding: 8px;
-        }
-        
-        QHeaderView::section {
-            background-color: #293245;
-            padding: 6px;
-            border: none;
-            font-weight: bold;
-        }
-        
-        /* QSlider */
-        QSlider::groove:horizontal {
-            height: 8px;
-            background-color: #192332;
-            border-radius: 4px;
-            border: 1px solid #5091e6;
-        }
-        
-        QSlider::handle:horizontal {
-            background-color: #5091e6;
-            border: none;
-            width: 16px;
-            margin: -4px 0;
-            border-radius: 8px;
-        }
-        
-        QSlider::sub-page:horizontal {
-            background-color: #5091e6;
-            border-radius: 4px;
-        }
-        
-        /* QGroupBox */
-        QGroupBox {
-            font-weight: bold;
-            border: 1px solid #293245;
-            border-radius: 6px;
-            margin-top: 16px;
-            padding-top: 16px;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px;
-        }
-        
-        /* QCheckBox */
-        QCheckBox::indicator {
-            width: 18px;
-            height: 18px;
-            border-radius: 3px;
-            border: 1px solid #293245;
-        }
-        
-        QCheckBox::indicator:checked {
-            background-color: #5091e6;
-        }
-        
-        QCheckBox::indicator:unchecked {
-            background-color: #192332;
-        }
-        
-        /* QRadioButton */
-        QRadioButton::indicator {
-            width: 18px;
-            height: 18px;
-            border-radius: 9px;
-            border: 1px solid #293245;
-        }
-        
-        QRadioButton::indicator:checked {
-            background-color: #5091e6;
-        }
-        
-        QRadioButton::indicator:unchecked {
-            background-color: #192332;
-        }
-        
-        /* QProgressBar */
-        QProgressBar {
-            border: none;
-            border-radius: 4px;
-            background-color: #192332;
-            text-align: center;
-            color: white;
-        }
-        
-        QProgressBar::chunk {
-            background-color: #5091e6;
-            border-radius: 4px;
-        }
-        
-        /* QSplitter */
-        QSplitter::handle {
-            background-color: #293245;
-        }
-        
-        /* QStatusBar */
-        QStatusBar {
-            background-color: #192332;
-            color: #dce1eb;
-        }
-        """
-
-    def _get_monochrome_stylesheet(self):
-        """Get the monochrome theme stylesheet"""
-        return """
-        /* Global */
-        * {
-            border-radius: 4px;
-        }
-        
-        /* QWidget */
-        QWidget {
-            background-color: #121212;
-            color: #dcdcdc;
-        }
-        
-        /* QToolBar */
-        QToolBar {
-            border: none;
-            padding: 4px;
-            spacing: 4px;
-            background-color: #1e1e1e;
-        }
-        
-        /* QPushButton */
-        QPushButton {
-            background-color: #1e1e1e;
-            color: #dcdcdc;
-            border: 1px solid #2d2d2d;
-            padding: 8px 16px;
-            border-radius: 6px;
-        }
-        
-        QPushButton:hover {
-            background-color: #2d2d2d;
-            border: 1px solid #b4b4b4;
-        }
-        
-        QPushButton:pressed {
-            background-color: #b4b4b4;
-            color: #121212;
-        }
-        
-        /* QLineEdit */
-        QLineEdit {
-            background-color: #1e1e1e;
-            border: 1px solid #2d2d2d;
-            padding: 8px;
-            border-radius: 6px;
-        }
-        
-        QLineEdit:focus {
-            border: 1px solid #b4b4b4;
-        }
-        
-        /* QComboBox */
-        QComboBox {
-            background-color: #1e1e1e;
-            border: 1px solid #2d2d2d;
-            padding: 8px;
-            border-radius: 6px;
-        }
-        
-        QComboBox::drop-down {
-            border: none;
-            width: 24px;
-        }
-        
-        QComboBox QAbstractItemView {
-            background-color: #1e1e1e;
-            border: 1px solid #2d2d2d;
-            border-radius: 6px;
-            selection-background-color: #b4b4b4;
-            selection-color: #121212;
-        }
-        
-        /* QTabWidget */
-        QTabWidget::pane {
-            border: 1px solid #2d2d2d;
-            background-color: #121212;
-            top: -1px;
-        }
-        
-        QTabBar::tab {
-            background-color: #1e1e1e;
-            border: 1px solid #2d2d2d;
-            padding: 8px 16px;
-            border-top-left-radius: 6px;
-            border-top-right-radius: 6px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: #121212;
-            border-bottom-color: #121212;
-        }
-        
-        QTabBar::tab:hover {
-            background-color: #2d2d2d;
-        }
-        
-        /* QScrollBar */
-        QScrollBar:vertical {
-            border: none;
-            background-color: #1e1e1e;
-            width: 10px;
-            margin: 0px;
-        }
-        
-        QScrollBar::handle:vertical {
-            background-color: #2d2d2d;
-            border-radius: 5px;
-            min-height: 30px;
-        }
-        
-        QScrollBar::handle:vertical:hover {
-            background-color: #3c3c3c;
-        }
-        
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-            height: 0px;
-        }
-        
-        QScrollBar:horizontal {
-            border: none;
-            background-color: #1e1e1e;
-            height: 10px;
-            margin: 0px;
-        }
-        
-        QScrollBar::handle:horizontal {
-            background-color: #2d2d2d;
-            border-radius: 5px;
-            min-width: 30px;
-        }
-        
-        QScrollBar::handle:horizontal:hover {
-            background-color: #3c3c3c;
-        }
-        
-        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-            width: 0px;
-        }
-        
-        /* QTableView */
-        QTableView {
-            gridline-color: #2d2d2d;
-            background-color: #1e1e1e;
-            selection-background-color: #b4b4b4;
-            selection-color: #121212;
-            alternate-background-color: #121212;
-        }
-        
-        QTableView::item {
-            padding: 8px;
-        }
-        
-        QHeaderView::section {
-            background-color: #2d2d2d;
-            padding: 6px;
-            border: none;
-            font-weight: bold;
-        }
-        
-        /* QSlider */
-        QSlider::groove:horizontal {
-            height: 8px;
-            background-color: #1e1e1e;
-            border-radius: 4px;
-            border: 1px solid #b4b4b4;
-        }
-        
-        QSlider::handle:horizontal {
-            background-color: #b4b4b4;
-            border: none;
-            width: 16px;
-            margin: -4px 0;
-            border-radius: 8px;
-        }
-        
-        QSlider::sub-page:horizontal {
-            background-color: #b4b4b4;
-            border-radius: 4px;
-        }
-        
-        /* QGroupBox */
-        QGroupBox {
-            font-weight: bold;
-            border: 1px solid #2d2d2d;
-            border-radius: 6px;
-            margin-top: 16px;
-            padding-top: 16px;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px;
-        }
-        
-        /* QCheckBox */
-        QCheckBox::indicator {
-            width: 18px;
-            height: 18px;
-            border-radius: 3px;
-            border: 1px solid #2d2d2d;
-        }
-        
-        QCheckBox::indicator:checked {
-            background-color: #b4b4b4;
-        }
-        
-        QCheckBox::indicator:unchecked {
-            background-color: #1e1e1e;
-        }
-        
-        /* QRadioButton */
-        QRadioButton::indicator {
-            width: 18px;
-            height: 18px;
-            border-radius: 9px;
-            border: 1px solid #2d2d2d;
-        }
-        
-        QRadioButton::indicator:checked {
-            background-color: #b4b4b4;
-        }
-        
-        QRadioButton::indicator:unchecked {
-            background-color: #1e1e1e;
-        }
-        
-        /* QProgressBar */
-        QProgressBar {
-            border: none;
-            border-radius: 4px;
-            background-color: #1e1e1e;
-            text-align: center;
-            color: white;
-        }
-        
-        QProgressBar::chunk {
-            background-color: #b4b4b4;
-            border-radius: 4px;
-        }
-        
-        /* QSplitter */
-        QSplitter::handle {
-            background-color: #2d2d2d;
-        }
-        
-        /* QStatusBar */
-        QStatusBar {
-            background-color: #1e1e1e;
-            color: #dcdcdc;
-        }
-        """
-    
-    def _get_reverse_monochrome_stylesheet(self):
-        """Get the reverse monochrome theme stylesheet"""
-        return """
-        /* Global */
-        * {
-            border-radius: 4px;
-        }
-        
-        /* QWidget */
-        QWidget {
-            background-color: #dcdcdc;
-            color: #121212;
-        }
-        
-        /* QToolBar */
-        QToolBar {
-            border: none;
-            padding: 4px;
-            spacing: 4px;
-            background-color: #c8c8c8;
-        }
-        
-        /* QPushButton */
-        QPushButton {
-            background-color: #c8c8c8;
-            color: #121212;
-            border: 1px solid #a0a0a0;
-            padding: 8px 16px;
-            border-radius: 6px;
-        }
-        
-        QPushButton:hover {
-            background-color: #a0a0a0;
-            border: 1px solid #464646;
-        }
-        
-        QPushButton:pressed {
-            background-color: #464646;
-            color: #dcdcdc;
-        }
-        
-        /* QLineEdit */
-        QLineEdit {
-            background-color: #c8c8c8;
-            border: 1px solid #a0a0a0;
-            padding: 8px;
-            border-radius: 6px;
-        }
-        
-        QLineEdit:focus {
-            border: 1px solid #464646;
-        }
-        
-        /* QComboBox */
-        QComboBox {
-            background-color: #c8c8c8;
-            border: 1px solid #a0a0a0;
-            padding: 8px;
-            border-radius: 6px;
-        }
-        
-        QComboBox::drop-down {
-            border: none;
-            width: 24px;
-        }
-        
-        QComboBox QAbstractItemView {
-            background-color: #c8c8c8;
-            border: 1px solid #a0a0a0;
-            border-radius: 6px;
-            selection-background-color: #464646;
-            selection-color: #dcdcdc;
-        }
-        
-        /* QTabWidget */
-        QTabWidget::pane {
-            border: 1px solid #a0a0a0;
-            background-color: #dcdcdc;
-            top: -1px;
-        }
-        
-        QTabBar::tab {
-            background-color: #c8c8c8;
-            border: 1px solid #a0a0a0;
-            padding: 8px 16px;
-            border-top-left-radius: 6px;
-            border-top-right-radius: 6px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: #dcdcdc;
-            border-bottom-color: #dcdcdc;
-        }
-        
-        QTabBar::tab:hover {
-            background-color: #a0a0a0;
-        }
-        
-        /* QScrollBar */
-        QScrollBar:vertical {
-            border: none;
-            background-color: #c8c8c8;
-            width: 10px;
-            margin: 0px;
-        }
-        
-        QScrollBar::handle:vertical {
-            background-color: #a0a0a0;
-            border-radius: 5px;
-            min-height: 30px;
-        }
-        
-        QScrollBar::handle:vertical:hover {
-            background-color: #808080;
-        }
-        
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-            height: 0px;
-        }
-        
-        QScrollBar:horizontal {
-            border: none;
-            background-color: #c8c8c8;
-            height: 10px;
-            margin: 0px;
-        }
-        
-        QScrollBar::handle:horizontal {
-            background-color: #a0a0a0;
-            border-radius: 5px;
-            min-width: 30px;
-        }
-        
-        QScrollBar::handle:horizontal:hover {
-            background-color: #808080;
-        }
-        
-        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-            width: 0px;
-        }
-        
-        /* QTableView */
-        QTableView {
-            gridline-color: #a0a0a0;
-            background-color: #c8c8c8;
-            selection-background-color: #464646;
-            selection-color: #dcdcdc;
-            alternate-background-color: #dcdcdc;
-        }
-        
-        QTableView::item {
-            padding: 8px;
-        }
-        
-        QHeaderView::section {
-            background-color: #a0a0a0;
-            padding: 6px;
-            border: none;
-            font-weight: bold;
-        }
-        
-        /* QSlider */
-        QSlider::groove:horizontal {
-            height: 8px;
-            background-color: #c8c8c8;
-            border-radius: 4px;
-            border: 1px solid #464646;
-        }
-        
-        QSlider::handle:horizontal {
-            background-color: #464646;
-            border: none;
-            width: 16px;
-            margin: -4px 0;
-            border-radius: 8px;
-        }
-        
-        QSlider::sub-page:horizontal {
-            background-color: #464646;
-            border-radius: 4px;
-        }
-        
-        /* QGroupBox */
-        QGroupBox {
-            font-weight: bold;
-            border: 1px solid #a0a0a0;
-            border-radius: 6px;
-            margin-top: 16px;
-            padding-top: 16px;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px;
-        }
-        
-        /* QCheckBox */
-        QCheckBox::indicator {
-            width: 18px;
-            height: 18px;
-            border-radius: 3px;
-            border: 1px solid #a0a0a0;
-        }
-        
-        QCheckBox::indicator:checked {
-            background-color: #464646;
-        }
-        
-        QCheckBox::indicator:unchecked {
-            background-color: #c8c8c8;
-        }
-        
-        /* QRadioButton */
-        QRadioButton::indicator {
-            width: 18px;
-            height: 18px;
-            border-radius: 9px;
-            border: 1px solid #a0a0a0;
-        }
-        
-        QRadioButton::indicator:checked {
-            background-color: #464646;
-        }
-        
-        QRadioButton::indicator:unchecked {
-            background-color: #c8c8c8;
-        }
-        
-        /* QProgressBar */
-        QProgressBar {
-            border: none;
-            border-radius: 4px;
-            background-color: #c8c8c8;
-            text-align: center;
-            color: #121212;
-        }
-        
-        QProgressBar::chunk {
-            background-color: #464646;
-            border-radius: 4px;
-        }
-        
-        /* QSplitter */
-        QSplitter::handle {
-            background-color: #a0a0a0;
-        }
-        
-        /* QStatusBar */
-        QStatusBar {
-            background-color: #c8c8c8;
-            color: #121212;
-        }
-        """
-
-    def _get_violet_stylesheet(self):
-        """Get the violet theme stylesheet"""
-        return """
-        /* Global */
-        * {
-            border-radius: 4px;
-        }
-        
-        /* QWidget */
-        QWidget {
-            background-color: #231932;
-            color: #e6dcf0;
-        }
-        
-        /* QToolBar */
-        QToolBar {
-            border: none;
-            padding: 4px;
-            spacing: 4px;
-            background-color: #2d2341;
-        }
-        
-        /* QPushButton */
-        QPushButton {
-            background-color: #2d2341;
-            color: #e6dcf0;
-            border: 1px solid #3d3355;
-            padding: 8px 16px;
-            border-radius: 6px;
-        }
-        
-        QPushButton:hover {
-            background-color: #3d3355;
-            border: 1px solid #b478dc;
-        }
-        
-        QPushButton:pressed {
-            background-color: #b478dc;
-            color: white;
-        }
-        
-        /* QLineEdit */
-        QLineEdit {
-            background-color: #2d2341;
-            border: 1px solid #3d3355;
-            padding: 8px;
-            border-radius: 6px;
-        }
-        
-        QLineEdit:focus {
-            border: 1px solid #b478dc;
-        }
-        
-        /* QComboBox */
-        QComboBox {
-            background-color: #2d2341;
-            border: 1px solid #3d3355;
-            padding: 8px;
-            border-radius: 6px;
-        }
-        
-        QComboBox::drop-down {
-            border: none;
-            width: 24px;
-        }
-        
-        QComboBox QAbstractItemView {
-            background-color: #2d2341;
-            border: 1px solid #3d3355;
-            border-radius: 6px;
-            selection-background-color: #b478dc;
-            selection-color: white;
-        }
-        
-        /* QTabWidget */
-        QTabWidget::pane {
-            border: 1px solid #3d3355;
-            background-color: #231932;
-            top: -1px;
-        }
-        
-        QTabBar::tab {
-            background-color: #2d2341;
-            border: 1px solid #3d3355;
-            padding: 8px 16px;
-            border-top-left-radius: 6px;
-            border-top-right-radius: 6px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: #231932;
-            border-bottom-color: #231932;
-        }
-        
-        QTabBar::tab:hover {
-            background-color: #3d3355;
-        }
-        
-        /* QScrollBar */
-        QScrollBar:vertical {
-            border: none;
-            background-color: #2d2341;
-            width: 10px;
-            margin: 0px;
-        }
-        
-        QScrollBar::handle:vertical {
-            background-color: #3d3355;
-            border-radius: 5px;
-            min-height: 30px;
-        }
-        
-        QScrollBar::handle:vertical:hover {
-            background-color: #4d4365;
-        }
-        
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-            height: 0px;
-        }
-        
-        QScrollBar:horizontal {
-            border: none;
-            background-color: #2d2341;
-            height: 10px;
-            margin: 0px;
-        }
-        
-        QScrollBar::handle:horizontal {
-            background-color: #3d3355;
-            border-radius: 5px;
-            min-width: 30px;
-        }
-        
-        QScrollBar::handle:horizontal:hover {
-            background-color: #4d4365;
-        }
-        
-        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-            width: 0px;
-        }
-        
-        /* QTableView */
-        QTableView {
-            gridline-color: #3d3355;
-            background-color: #2d2341;
-            selection-background-color: #b478dc;
-            selection-color: white;
-            alternate-background-color: #231932;
-        }
-        
-        QTableView::item {
-            padding: 8px;
-        }
-        
-        QHeaderView::section {
-            background-color: #3d3355;
-            padding: 6px;
-            border: none;
-            font-weight: bold;
-        }
-        
-        /* QSlider */
-        QSlider::groove:horizontal {
-            height: 8px;
-            background-color: #2d2341;
-            border-radius: 4px;
-            border: 1px solid #b478dc;
-        }
-        
-        QSlider::handle:horizontal {
-            background-color: #b478dc;
-            border: none;
-            width: 16px;
-            margin: -4px 0;
-            border-radius: 8px;
-        }
-        
-        QSlider::sub-page:horizontal {
-            background-color: #b478dc;
-            border-radius: 4px;
-        }
-        
-        /* QGroupBox */
-        QGroupBox {
-            font-weight: bold;
-            border: 1px solid #3d3355;
-            border-radius: 6px;
-            margin-top: 16px;
-            padding-top: 16px;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px;
-        }
-        
-        /* QCheckBox */
-        QCheckBox::indicator {
-            width: 18px;
-            height: 18px;
-            border-radius: 3px;
-            border: 1px solid #3d3355;
-        }
-        
-        QCheckBox::indicator:checked {
-            background-color: #b478dc;
-        }
-        
-        QCheckBox::indicator:unchecked {
-            background-color: #2d2341;
-        }
-        
-        /* QRadioButton */
-        QRadioButton::indicator {
-            width: 18px;
-            height: 18px;
-            border-radius: 9px;
-            border: 1px solid #3d3355;
-        }
-        
-        QRadioButton::indicator:checked {
-            background-color: #b478dc;
-        }
-        
-        QRadioButton::indicator:unchecked {
-            background-color: #2d2341;
-        }
-        
-        /* QProgressBar */
-        QProgressBar {
-            border: none;
-            border-radius: 4px;
-            background-color: #2d2341;
-            text-align: center;
-            color: white;
-        }
-        
-        QProgressBar::chunk {
-            background-color: #b478dc;
-            border-radius: 4px;
-        }
-        
-        /* QSplitter */
-        QSplitter::handle {
-            background-color: #3d3355;
-        }
-        
-        /* QStatusBar */
-        QStatusBar {
-            background-color: #2d2341;
-            color: #e6dcf0;
-        }
-        """
-
 # Create a singleton instance
 theme_manager = ThemeManager() 
\ No newline at end of file